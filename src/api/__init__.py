@@ -1,6 +1,8 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
+from api.dependencies.session import get_unit_of_work
 from api.v1 import router as v1_router
 
-router = APIRouter(prefix="/api")
+# одна сессия и одна транзакция на запрос, зависимость решается раньше сервисов
+router = APIRouter(prefix="/api", dependencies=[Depends(get_unit_of_work)])
 router.include_router(v1_router)
@@ -0,0 +1,68 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Iterable
+
+from fastapi import Request, Response, status
+
+from domain.entities.versions import VersionEntity
+
+
+def make_etag(versions: Iterable[VersionEntity], *extra: object) -> str:
+    # подходят любые объекты с id и updated_at: и версии, и сами сущности
+    digest = hashlib.blake2b(digest_size=16)
+    for version in versions:
+        digest.update(f"{version.id}:{version.updated_at.isoformat()};".encode())
+    for value in extra:
+        digest.update(f"{value};".encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def last_modified_of(versions: Iterable[VersionEntity]) -> datetime | None:
+    return max((version.updated_at for version in versions), default=None)
+
+
+def is_conditional(request: Request) -> bool:
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def has_if_none_match(request: Request) -> bool:
+    # списки отдают 304 только по ETag, для одного If-Modified-Since запрос версий бесполезен
+    return "if-none-match" in request.headers
+
+
+def is_not_modified(
+        request: Request, etag: str, last_modified: datetime | None = None, use_modified_since: bool = True
+) -> bool:
+    # If-None-Match важнее If-Modified-Since (RFC 9110, 13.2.2)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or etag in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if not if_modified_since or last_modified is None or not use_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return _to_utc(last_modified).replace(microsecond=0) <= since
+
+
+def validator_headers(etag: str, last_modified: datetime | None = None) -> dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_to_utc(last_modified), usegmt=True)
+    return headers
+
+
+def not_modified_response(etag: str, last_modified: datetime | None = None) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validator_headers(etag, last_modified))
+
+
+def _to_utc(value: datetime) -> datetime:
+    # в базе хранится локальное время без зоны
+    return value.astimezone(timezone.utc)
@@ -0,0 +1,14 @@
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import AfterValidator
+
+
+def to_local_naive(value: datetime) -> datetime:
+    # в базе хранится локальное время без зоны; asyncpg не принимает aware-значения для таких колонок
+    if value.tzinfo is None:
+        return value
+    return value.astimezone().replace(tzinfo=None)
+
+
+LocalDateTime = Annotated[datetime, AfterValidator(to_local_naive)]
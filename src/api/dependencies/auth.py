@@ -5,42 +5,56 @@ from punq import Container
 from api.dependencies.users import get_user_service
 from core.config import settings
 from core.exceptions import ApplicationException
+from domain.entities.auth import PrincipalEntity, TokenPayloadEntity
 from domain.entities.users import UserEntity
 from logic.services.users.base import BaseUserService
 from logic.services.auth.jwt_auth import JWTAuthService
 from di import get_container
-from logic.utils.auth import decode_jwt
 
 
 class JWTBearer(HTTPBearer):
     def __init__(self, auto_error: bool = True):
         super(JWTBearer, self).__init__(auto_error=auto_error)
 
-    async def __call__(self, request: Request):
+    async def __call__(self, request: Request) -> TokenPayloadEntity:
         credentials = await super(JWTBearer, self).__call__(request)
         if credentials:
             try:
-                decode_jwt(credentials.credentials)
+                return JWTAuthService.get_token_payload(
+                    token=credentials.credentials,
+                    token_type=settings.auth_jwt.access_token_name,
+                )
             except ApplicationException as e:
                 raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
-            return credentials.credentials
         else:
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid auth token")
 
 
+# один экземпляр на всё приложение, чтобы FastAPI кэшировал проверку токена в рамках запроса
+jwt_bearer = JWTBearer()
+
+
 def get_auth_service(container: Container = Depends(get_container)) -> JWTAuthService:
     service: JWTAuthService = container.resolve(JWTAuthService)
     return service
 
 
 async def get_auth_user(
-        auth_service: JWTAuthService = Depends(get_auth_service),
         user_service: BaseUserService = Depends(get_user_service),
-        token: str = Depends(JWTBearer())
+        payload: TokenPayloadEntity = Depends(jwt_bearer),
 ) -> UserEntity:
     try:
-        payload = auth_service.get_token_payload(token, settings.auth_jwt.access_token_name)
         user = await user_service.get_user_by_email(email=payload.sub)
     except ApplicationException as e:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=e.message)
     return user
+
+
+async def get_auth_principal(
+        user_service: BaseUserService = Depends(get_user_service),
+        payload: TokenPayloadEntity = Depends(jwt_bearer),
+) -> PrincipalEntity:
+    if payload.user_id is not None and payload.is_company is not None:
+        return PrincipalEntity(id=payload.user_id, email=payload.sub, is_company=payload.is_company)
+    user = await get_auth_user(user_service=user_service, payload=payload)
+    return PrincipalEntity(id=user.id, email=user.email, is_company=user.is_company)
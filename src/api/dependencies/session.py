@@ -0,0 +1,10 @@
+from typing import AsyncIterator
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from infra.repositories.session import unit_of_work
+
+
+async def get_unit_of_work() -> AsyncIterator[AsyncSession]:
+    async with unit_of_work() as session:
+        yield session
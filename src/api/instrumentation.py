@@ -0,0 +1,69 @@
+import json
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from infra.repositories.instrumentation import QueryStats, track_queries
+
+logger = logging.getLogger(__name__)
+
+
+def configure_sql_logging(level: str) -> None:
+    # корневой логгер без настройки пропускает только WARNING: сводки уровня INFO терялись бы молча
+    logger.setLevel(level)
+    if not logger.hasHandlers():
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s"))
+        logger.addHandler(handler)
+
+
+def format_server_timing(stats: QueryStats, total_seconds: float) -> str:
+    return f'db;dur={stats.duration_seconds * 1000:.2f};desc="{stats.count} queries", app;dur={total_seconds * 1000:.2f}'
+
+
+# чистый ASGI, а не BaseHTTPMiddleware: не буферизует потоковые ответы вроде выгрузки вакансий
+class SQLInstrumentationMiddleware:
+    def __init__(self, app: ASGIApp, repeated_statement_threshold: int):
+        self.app = app
+        self.repeated_statement_threshold = repeated_statement_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = None
+        with track_queries() as stats:
+            async def send_with_timing(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    # к этому моменту единица работы запроса уже закоммичена
+                    status_code = message["status"]
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", format_server_timing(stats, time.perf_counter() - started))
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                self._log(scope, status_code, stats, time.perf_counter() - started)
+
+    def _log(self, scope: Scope, status_code: int | None, stats: QueryStats, total_seconds: float) -> None:
+        route = scope.get("route")
+        record = {
+            "method": scope["method"],
+            "path": getattr(route, "path", scope["path"]),
+            "status": status_code,
+            "queries": stats.count,
+            "db_ms": round(stats.duration_seconds * 1000, 2),
+            "total_ms": round(total_seconds * 1000, 2),
+        }
+        repeated = stats.repeated_shapes(self.repeated_statement_threshold)
+        if repeated:
+            record["repeated_statements"] = repeated
+            logger.warning(json.dumps(record, ensure_ascii=False))
+        else:
+            logger.info(json.dumps(record, ensure_ascii=False))
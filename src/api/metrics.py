@@ -0,0 +1,98 @@
+import time
+from typing import Iterable
+
+from fastapi import APIRouter, Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.metrics import CONTENT_TYPE, Counter, Gauge, Metric, gauge, histogram, registry
+from di import get_container
+from infra.cache.registry import CacheRegistry
+from infra.repositories.session import get_all_pool_stats
+from logic.utils.password_hasher import PasswordHasher
+
+HTTP_REQUEST_SECONDS = histogram(
+    "http_request_duration_seconds", "Время обработки HTTP-запроса", ("method", "route", "status"),
+)
+HTTP_REQUESTS_IN_FLIGHT = gauge("http_requests_in_flight", "HTTP-запросы в обработке")
+UNMATCHED_ROUTE = "<unmatched>"
+
+router = APIRouter()
+
+
+# маршрут берётся шаблоном из scope, чтобы id в пути не плодили ряды метрик
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            route = scope.get("route")
+            HTTP_REQUEST_SECONDS.observe(
+                time.perf_counter() - started,
+                scope["method"],
+                getattr(route, "path", UNMATCHED_ROUTE),
+                str(status_code),
+            )
+
+
+def collect_pool_metrics() -> Iterable[Metric]:
+    gauges = {
+        "size": Gauge("db_pool_size", "Размер пула соединений", ("pool",)),
+        "checked_out": Gauge("db_pool_checked_out", "Выданные соединения", ("pool",)),
+        "checked_in": Gauge("db_pool_checked_in", "Свободные соединения в пуле", ("pool",)),
+        "overflow": Gauge("db_pool_overflow", "Соединения сверх pool_size", ("pool",)),
+        "wait_seconds_max": Gauge("db_pool_wait_seconds_max", "Самое долгое ожидание соединения", ("pool",)),
+    }
+    counters = {
+        "waits": Counter("db_pool_waits_total", "Ожидания свободного соединения", ("pool",)),
+        "wait_seconds_total": Counter("db_pool_wait_seconds_total", "Суммарное ожидание соединения", ("pool",)),
+        "timeouts": Counter("db_pool_timeouts_total", "Таймауты ожидания соединения", ("pool",)),
+    }
+    for stats in get_all_pool_stats():
+        for field, metric in gauges.items():
+            metric.set(getattr(stats, field), stats.name)
+        for field, metric in counters.items():
+            metric.inc(stats.name, amount=getattr(stats, field))
+    return [*gauges.values(), *counters.values()]
+
+
+def collect_cache_metrics() -> Iterable[Metric]:
+    hits = Counter("cache_hits_total", "Попадания в кэш", ("cache",))
+    misses = Counter("cache_misses_total", "Промахи кэша", ("cache",))
+    for stats in get_container().resolve(CacheRegistry).get_all_stats():
+        hits.inc(stats.name, amount=stats.hits)
+        misses.inc(stats.name, amount=stats.misses)
+    return [hits, misses]
+
+
+def collect_password_hasher_metrics() -> Iterable[Metric]:
+    pending = Gauge("password_hashing_pending", "Операции bcrypt в очереди и в работе")
+    pending.set(get_container().resolve(PasswordHasher).pending)
+    return [pending]
+
+
+registry.register_collector(collect_pool_metrics)
+registry.register_collector(collect_cache_metrics)
+registry.register_collector(collect_password_hasher_metrics)
+
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics() -> Response:
+    return Response(content=registry.render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,39 @@
+from types import NoneType, UnionType
+from typing import Any, Union, get_args, get_origin
+
+from fastapi import Response, status
+from pydantic import BaseModel, TypeAdapter
+
+
+def _schema_include(schema: type[BaseModel]) -> dict:
+    include = {}
+    for name, field in schema.model_fields.items():
+        annotation = field.annotation
+        if get_origin(annotation) in (Union, UnionType):
+            annotation = next(arg for arg in get_args(annotation) if arg is not NoneType)
+        if get_origin(annotation) is list and isinstance(get_args(annotation)[0], type) \
+                and issubclass(get_args(annotation)[0], BaseModel):
+            include[name] = {"__all__": _schema_include(get_args(annotation)[0])}
+        elif isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            include[name] = _schema_include(annotation)
+        else:
+            include[name] = True
+    return include
+
+
+# сущности кодируются в JSON напрямую, без повторной валидации через response_model;
+# схема по-прежнему описывает ответ в OpenAPI и задаёт набор полей в JSON
+class EntitySerializer:
+    def __init__(self, entity_type: Any, schema: type[BaseModel]):
+        self.adapter = TypeAdapter(entity_type)
+        self.include = _schema_include(schema)
+
+    def to_json(self, entity: Any) -> bytes:
+        return self.adapter.dump_json(entity, include=self.include)
+
+    def to_response(
+            self, entity: Any, status_code: int = status.HTTP_200_OK, headers: dict[str, str] | None = None
+    ) -> Response:
+        return Response(
+            content=self.to_json(entity), status_code=status_code, headers=headers, media_type="application/json",
+        )
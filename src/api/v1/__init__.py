@@ -4,9 +4,11 @@ from api.v1.users.routers import router as user_router
 from api.v1.auth.routers import router as auth_router
 from api.v1.jobs.routers import router as job_router
 from api.v1.responses.routers import router as response_router
+from api.v1.monitoring.routers import router as monitoring_router
 
 router = APIRouter(prefix="/v1")
 router.include_router(auth_router)
 router.include_router(user_router)
 router.include_router(job_router)
 router.include_router(response_router)
+router.include_router(monitoring_router)
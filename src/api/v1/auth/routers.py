@@ -5,6 +5,7 @@ from api.dependencies.users import get_user_service
 from api.v1.auth.schemas import TokenSchema, LoginSchema, RefreshTokenSchema
 from core.config import settings
 from core.exceptions import ApplicationException
+from logic.exceptions.auth import PasswordHashingOverloadedException
 from logic.services.auth.jwt_auth import JWTAuthService
 from logic.services.users.base import BaseUserService
 
@@ -18,6 +19,12 @@ async def login(
 ) -> TokenSchema:
     try:
         token = await auth_service.login_user(email=creds.email, password=creds.password)
+    except PasswordHashingOverloadedException as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=e.message,
+            headers={"Retry-After": "1"},
+        )
     except ApplicationException as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
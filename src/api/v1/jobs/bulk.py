@@ -0,0 +1,64 @@
+import json
+from typing import AsyncIterator
+
+from fastapi import HTTPException, Request, status
+from pydantic import ValidationError
+
+from api.v1.jobs.schemas import JobBulkItemSchema
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _body_too_large(max_bytes: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"Тело запроса больше {max_bytes} байт",
+    )
+
+
+async def _read_limited(request: Request, max_bytes: int) -> AsyncIterator[bytes]:
+    # Content-Length отсекает явно большие тела сразу, подсчёт байтов — тела без длины (chunked)
+    if int(request.headers.get("content-length") or 0) > max_bytes:
+        raise _body_too_large(max_bytes)
+    received = 0
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > max_bytes:
+            raise _body_too_large(max_bytes)
+        yield chunk
+
+
+async def read_bulk_rows(request: Request, max_bytes: int) -> AsyncIterator[tuple[int, bytes | object]]:
+    # NDJSON читаем потоком и отдаём сырые строки с номером физической строки файла (пустые тоже считаются),
+    # JSON-массив разбираем целиком и нумеруем по позиции в нём
+    if request.headers.get("content-type", "").startswith(NDJSON_MEDIA_TYPE):
+        buffer, line_number = b"", 0
+        async for chunk in _read_limited(request, max_bytes):
+            *lines, buffer = (buffer + chunk).split(b"\n")
+            for line in lines:
+                line_number += 1
+                if line.strip():
+                    yield line_number, line
+        if buffer.strip():
+            yield line_number + 1, buffer
+        return
+
+    body = b"".join([chunk async for chunk in _read_limited(request, max_bytes)])
+    try:
+        rows = json.loads(body)
+    except ValueError:
+        raise ValueError("Некорректный JSON")
+    if not isinstance(rows, list):
+        raise ValueError("Ожидается JSON-массив вакансий")
+    for row_number, row in enumerate(rows, start=1):
+        yield row_number, row
+
+
+def validate_bulk_row(row: bytes | object) -> JobBulkItemSchema:
+    if isinstance(row, bytes):
+        return JobBulkItemSchema.model_validate_json(row)
+    return JobBulkItemSchema.model_validate(row)
+
+
+def format_validation_errors(error: ValidationError) -> list[str]:
+    return [f"{'.'.join(map(str, err['loc'])) or 'row'}: {err['msg']}" for err in error.errors()]
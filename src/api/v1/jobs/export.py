@@ -0,0 +1,37 @@
+import csv
+import io
+from enum import Enum
+
+from api.v1.jobs.schemas import JobSchema
+from domain.entities.jobs import JobEntity
+
+
+class JobExportFormatEnum(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+EXPORT_MEDIA_TYPES = {
+    JobExportFormatEnum.NDJSON: "application/x-ndjson",
+    JobExportFormatEnum.CSV: "text/csv",
+}
+
+CSV_COLUMNS = list(JobSchema.model_fields)
+
+
+def format_ndjson_batch(jobs: list[JobEntity]) -> str:
+    return "".join(JobSchema.from_entity(job).model_dump_json() + "\n" for job in jobs)
+
+
+def format_csv_header() -> str:
+    return _format_csv_rows([CSV_COLUMNS])
+
+
+def format_csv_batch(jobs: list[JobEntity]) -> str:
+    return _format_csv_rows([getattr(job, column) for column in CSV_COLUMNS] for job in jobs)
+
+
+def _format_csv_rows(rows) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
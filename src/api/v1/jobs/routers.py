@@ -1,29 +1,118 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from punq import Container
 
+from api.conditional import (has_if_none_match, is_conditional, is_not_modified, last_modified_of, make_etag,
+                             not_modified_response, validator_headers)
+from api.datetimes import LocalDateTime
 from api.dependencies.jobs import get_job_service
-from api.v1.jobs.schemas import JobCreateSchema, JobSchema
+from api.v1.jobs.bulk import NDJSON_MEDIA_TYPE, format_validation_errors, read_bulk_rows, validate_bulk_row
+from api.v1.jobs.export import (EXPORT_MEDIA_TYPES, JobExportFormatEnum, format_csv_batch, format_csv_header,
+                                format_ndjson_batch)
+from api.v1.jobs.schemas import (JobCreateSchema, JobSchema, JobPageSchema, JobFiltersSchema, JobBulkItemSchema,
+                                 JobBulkResultSchema, JobBulkRowErrorSchema, JobStatsSchema, job_page_serializer)
 from core.exceptions import ApplicationException
-from api.dependencies.auth import get_auth_user
-from domain.entities.users import UserEntity
+from api.dependencies.auth import get_auth_principal
+from domain.entities.auth import PrincipalEntity
+from logic.exceptions.base import ServiceException
+from di import get_container
+from infra.repositories.session import unit_of_work
 from logic.services.jobs.base import BaseJobService
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
+BULK_IMPORT_CHUNK_SIZE = 1000
+BULK_IMPORT_MAX_ROWS = 50000
+BULK_IMPORT_MAX_BYTES = 64 * 1024 * 1024
+EXPORT_BATCH_SIZE = 1000
 
-@router.get("", response_model=list[JobSchema])
+
+@router.get("", response_model=JobPageSchema)
 async def get_all_jobs(
+        request: Request,
         job_service: BaseJobService = Depends(get_job_service),
-        limit: int = 100,
-        offset: int = 0
-) -> list[JobSchema]:
-    jobs = await job_service.get_job_list(limit=limit, offset=offset)
-    return [JobSchema.from_entity(job) for job in jobs]
+        limit: int = Query(100, ge=1, le=1000),
+        offset: int = Query(0, ge=0),
+        cursor: str | None = None,
+        filters: JobFiltersSchema = Depends(),
+) -> Response:
+    try:
+        if has_if_none_match(request):
+            # для 304 хватает id и updated_at страницы, полный запрос не нужен
+            versions = await job_service.get_job_list_versions(
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+                filters=filters.to_entity(),
+            )
+            etag = make_etag(versions.items, versions.has_next)
+            if is_not_modified(request, etag, use_modified_since=False):
+                return not_modified_response(etag, last_modified_of(versions.items))
+        jobs = await job_service.get_job_list(
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            filters=filters.to_entity(),
+        )
+    except ApplicationException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        )
+    etag = make_etag(jobs.items, jobs.next_cursor is not None)
+    return job_page_serializer.to_response(jobs, headers=validator_headers(etag, last_modified_of(jobs.items)))
+
+
+@router.get("/search", response_model=JobPageSchema)
+async def search_jobs(
+        q: str = Query(min_length=1, max_length=200),
+        job_service: BaseJobService = Depends(get_job_service),
+        limit: int = Query(100, ge=1, le=1000),
+        cursor: str | None = None,
+) -> Response:
+    try:
+        jobs = await job_service.search_jobs(search_query=q, limit=limit, cursor=cursor)
+    except ApplicationException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        )
+    return job_page_serializer.to_response(jobs)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()}}},
+)
+async def export_jobs(
+        export_format: JobExportFormatEnum = Query(JobExportFormatEnum.NDJSON, alias="format"),
+        filters: JobFiltersSchema = Depends(),
+        container: Container = Depends(get_container),
+) -> StreamingResponse:
+    format_batch = format_csv_batch if export_format == JobExportFormatEnum.CSV else format_ndjson_batch
+
+    async def stream_jobs():
+        # тело отдаётся уже после закрытия сессии запроса, поэтому у выгрузки своя единица работы
+        async with unit_of_work():
+            job_service = get_job_service(container)
+            if export_format == JobExportFormatEnum.CSV:
+                yield format_csv_header()
+            async for jobs in job_service.export_jobs(filters=filters.to_entity(), batch_size=EXPORT_BATCH_SIZE):
+                yield format_batch(jobs)
+
+    return StreamingResponse(
+        stream_jobs(),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="jobs.{export_format.value}"'},
+    )
 
 
 @router.post("", response_model=JobSchema)
 async def create_job(
         job_in: JobCreateSchema,
-        auth_user: UserEntity = Depends(get_auth_user),
+        auth_user: PrincipalEntity = Depends(get_auth_principal),
         job_service: BaseJobService = Depends(get_job_service),
 ) -> JobSchema:
     job_in.user_id = auth_user.id
@@ -37,7 +126,51 @@ async def create_job(
     return JobSchema.from_entity(job)
 
 
-@router.put("", response_model=JobSchema)
+@router.post(
+    "/bulk",
+    response_model=JobBulkResultSchema,
+    openapi_extra={"requestBody": {"required": True, "content": {
+        "application/json": {"schema": {"type": "array", "items": JobBulkItemSchema.model_json_schema()}},
+        NDJSON_MEDIA_TYPE: {"schema": JobBulkItemSchema.model_json_schema()},
+    }}},
+)
+async def create_jobs_bulk(
+        request: Request,
+        auth_user: PrincipalEntity = Depends(get_auth_principal),
+        job_service: BaseJobService = Depends(get_job_service),
+) -> JobBulkResultSchema:
+    created, errors, chunk = 0, [], []
+    rows_total = 0
+    try:
+        async for row_number, row in read_bulk_rows(request, max_bytes=BULK_IMPORT_MAX_BYTES):
+            rows_total += 1
+            if rows_total > BULK_IMPORT_MAX_ROWS:
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"За один запрос можно загрузить не более {BULK_IMPORT_MAX_ROWS} вакансий",
+                )
+            try:
+                job_in = validate_bulk_row(row)
+            except ValidationError as e:
+                errors.append(JobBulkRowErrorSchema(row=row_number, errors=format_validation_errors(e)))
+                continue
+            job_in.user_id = auth_user.id
+            chunk.append(job_in.to_entity())
+            if len(chunk) >= BULK_IMPORT_CHUNK_SIZE:
+                created += await job_service.create_jobs(jobs_in=chunk, auth_user=auth_user)
+                chunk = []
+        created += await job_service.create_jobs(jobs_in=chunk, auth_user=auth_user)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    except ApplicationException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        )
+    return JobBulkResultSchema(created=created, errors=errors)
+
+
+@router.put("", response_model=JobSchema, deprecated=True)
 async def get_job_by_id(
         job_id: str,
         job_service: BaseJobService = Depends(get_job_service),
@@ -52,14 +185,59 @@ async def get_job_by_id(
     return JobSchema.from_entity(job)
 
 
+# объявлен до /{job_id}, иначе "my" попадёт в job_id
+@router.get("/my/stats", response_model=list[JobStatsSchema])
+async def get_my_job_stats(
+        since: LocalDateTime | None = Query(None, description="Считать новыми отклики после этого времени"),
+        auth_user: PrincipalEntity = Depends(get_auth_principal),
+        job_service: BaseJobService = Depends(get_job_service),
+) -> list[JobStatsSchema]:
+    try:
+        stats = await job_service.get_company_job_stats(auth_user=auth_user, since=since)
+    except ServiceException as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=e.message,
+        )
+    return [JobStatsSchema.from_entity(job_stats) for job_stats in stats]
+
+
+@router.get("/{job_id}", response_model=JobSchema)
+async def get_job(
+        job_id: str,
+        request: Request,
+        response: Response,
+        job_service: BaseJobService = Depends(get_job_service),
+) -> JobSchema | Response:
+    try:
+        if is_conditional(request):
+            version = await job_service.get_job_version(job_id=job_id)
+            etag = make_etag([version])
+            if is_not_modified(request, etag, version.updated_at):
+                return not_modified_response(etag, version.updated_at)
+        job = await job_service.get_job_by_id(job_id=job_id)
+    except ApplicationException as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=e.message,
+        )
+    response.headers.update(validator_headers(make_etag([job]), job.updated_at))
+    return JobSchema.from_entity(job)
+
+
 @router.delete("", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_job(
         job_id: str,
-        auth_user: UserEntity = Depends(get_current_user),
+        auth_user: PrincipalEntity = Depends(get_auth_principal),
         job_service: BaseJobService = Depends(get_job_service),
 ) -> None:
     try:
         await job_service.delete_job(job_id=job_id, user=auth_user)
+    except ServiceException as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=e.message,
+        )
     except ApplicationException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,6 +1,11 @@
+from datetime import datetime
+
 from pydantic import BaseModel, Field
 
-from domain.entities.jobs import JobEntity
+from api.serialization import EntitySerializer
+
+from domain.entities.jobs import JobEntity, JobFiltersEntity, JobSortEnum, JobStatsEntity
+from domain.entities.pagination import PageEntity
 
 
 class JobCreateSchema(BaseModel):
@@ -22,6 +27,21 @@ class JobCreateSchema(BaseModel):
         )
 
 
+class JobBulkItemSchema(JobCreateSchema):
+    # владелец берётся из токена
+    user_id: str | None = None
+
+
+class JobBulkRowErrorSchema(BaseModel):
+    row: int
+    errors: list[str]
+
+
+class JobBulkResultSchema(BaseModel):
+    created: int
+    errors: list[JobBulkRowErrorSchema]
+
+
 class JobSchema(BaseModel):
     id: str
     title: str
@@ -30,6 +50,8 @@ class JobSchema(BaseModel):
     salary_to: float
     is_active: bool = True
     user_id: str
+    responses_count: int = 0
+    last_response_at: datetime | None = None
 
     @classmethod
     def from_entity(cls, entity: JobEntity) -> "JobSchema":
@@ -41,4 +63,60 @@ class JobSchema(BaseModel):
             salary_to=entity.salary_to,
             is_active=entity.is_active,
             user_id=entity.user_id,
+            responses_count=entity.responses_count,
+            last_response_at=entity.last_response_at,
+        )
+
+
+class JobStatsSchema(BaseModel):
+    job_id: str
+    title: str
+    is_active: bool
+    created_at: datetime
+    responses_count: int
+    last_response_at: datetime | None = None
+    new_responses_count: int | None = None
+
+    @classmethod
+    def from_entity(cls, entity: JobStatsEntity) -> "JobStatsSchema":
+        return JobStatsSchema(
+            job_id=entity.job_id,
+            title=entity.title,
+            is_active=entity.is_active,
+            created_at=entity.created_at,
+            responses_count=entity.responses_count,
+            last_response_at=entity.last_response_at,
+            new_responses_count=entity.new_responses_count,
+        )
+
+
+class JobFiltersSchema(BaseModel):
+    is_active: bool | None = None
+    salary_from: float | None = None
+    salary_to: float | None = None
+    user_id: str | None = None
+    sort: JobSortEnum = JobSortEnum.NEWEST
+
+    def to_entity(self) -> JobFiltersEntity:
+        return JobFiltersEntity(
+            is_active=self.is_active,
+            salary_from=self.salary_from,
+            salary_to=self.salary_to,
+            user_id=self.user_id,
+            sort=self.sort,
         )
+
+
+class JobPageSchema(BaseModel):
+    items: list[JobSchema]
+    next_cursor: str | None = None
+
+    @classmethod
+    def from_entity(cls, entity: PageEntity[JobEntity]) -> "JobPageSchema":
+        return JobPageSchema(
+            items=[JobSchema.from_entity(job) for job in entity.items],
+            next_cursor=entity.next_cursor,
+        )
+
+
+job_page_serializer = EntitySerializer(PageEntity[JobEntity], JobPageSchema)
@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Depends
+from punq import Container
+
+from api.dependencies.auth import get_auth_principal
+from api.v1.monitoring.schemas import CacheStatsSchema, PoolStatsSchema
+from di import get_container
+from infra.cache.registry import CacheRegistry
+from infra.repositories.session import get_all_pool_stats
+
+# внутреннее устройство сервиса наружу отдаём только авторизованным пользователям
+router = APIRouter(prefix="/monitoring", tags=["monitoring"], dependencies=[Depends(get_auth_principal)])
+
+
+@router.get("/db-pool", response_model=list[PoolStatsSchema])
+async def get_db_pool_stats() -> list[PoolStatsSchema]:
+    return [PoolStatsSchema.from_entity(stats) for stats in get_all_pool_stats()]
+
+
+@router.get("/caches", response_model=list[CacheStatsSchema])
+async def get_cache_stats(container: Container = Depends(get_container)) -> list[CacheStatsSchema]:
+    registry: CacheRegistry = container.resolve(CacheRegistry)
+    return [CacheStatsSchema.from_entity(stats) for stats in registry.get_all_stats()]
@@ -0,0 +1,45 @@
+from pydantic import BaseModel
+
+from domain.entities.monitoring import CacheStatsEntity, PoolStatsEntity
+
+
+class PoolStatsSchema(BaseModel):
+    name: str
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    waits: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+    timeouts: int
+
+    @classmethod
+    def from_entity(cls, entity: PoolStatsEntity) -> "PoolStatsSchema":
+        return PoolStatsSchema(
+            name=entity.name,
+            size=entity.size,
+            checked_in=entity.checked_in,
+            checked_out=entity.checked_out,
+            overflow=entity.overflow,
+            waits=entity.waits,
+            wait_seconds_total=entity.wait_seconds_total,
+            wait_seconds_max=entity.wait_seconds_max,
+            timeouts=entity.timeouts,
+        )
+
+
+class CacheStatsSchema(BaseModel):
+    name: str
+    hits: int
+    misses: int
+    hit_ratio: float
+
+    @classmethod
+    def from_entity(cls, entity: CacheStatsEntity) -> "CacheStatsSchema":
+        return CacheStatsSchema(
+            name=entity.name,
+            hits=entity.hits,
+            misses=entity.misses,
+            hit_ratio=entity.hit_ratio,
+        )
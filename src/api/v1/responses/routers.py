@@ -1,24 +1,29 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Response, status
 
+from api.dependencies.auth import get_auth_principal
 from api.dependencies.responses import get_response_service
-from api.v1.jobs.schemas import JobSchema
 
-from api.v1.responses.schemas import ResponseSchema, ResponseCreateSchema, ResponseAggregateJobSchema, \
-    ResponseAggregateUserSchema
+from api.v1.responses.schemas import ResponseSchema, ResponseCreateSchema, ResponseAggregateJobPageSchema, \
+    ResponseAggregateUserPageSchema, ResponseFiltersSchema, ResponseBatchResultSchema, response_job_page_serializer, \
+    response_user_page_serializer
 
 from core.exceptions import ApplicationException
-from domain.entities.users import UserEntity
+from domain.entities.auth import PrincipalEntity
+from logic.exceptions.base import ServiceException
 from logic.services.responses.base import BaseResponseService
 
 router = APIRouter(prefix="/responses", tags=["responses"])
 
+RESPONSE_LIST_MAX_LIMIT = 200
+RESPONSE_BATCH_MAX_SIZE = 500
+
 
 @router.post("", response_model=ResponseSchema)
 async def make_response(
         response: ResponseCreateSchema,
-        auth_user: UserEntity = Depends(get_auth_user),
+        auth_user: PrincipalEntity = Depends(get_auth_principal),
         response_service: BaseResponseService = Depends(get_response_service),
-) -> list[JobSchema]:
+) -> ResponseSchema:
     response.user_id = auth_user.id
     try:
         new_response = await response_service.make_response(
@@ -30,73 +35,124 @@ async def make_response(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=e.message,
         )
-    return new_response
+    return ResponseSchema.from_entity(new_response)
+
 
+@router.post("/batch", response_model=ResponseBatchResultSchema)
+async def make_responses(
+        responses: list[ResponseCreateSchema] = Body(min_length=1, max_length=RESPONSE_BATCH_MAX_SIZE),
+        auth_user: PrincipalEntity = Depends(get_auth_principal),
+        response_service: BaseResponseService = Depends(get_response_service),
+) -> ResponseBatchResultSchema:
+    for response in responses:
+        response.user_id = auth_user.id
+    try:
+        result = await response_service.make_responses(
+            responses_in=[response.to_entity() for response in responses],
+            user=auth_user,
+        )
+    except ApplicationException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        )
+    return ResponseBatchResultSchema.from_entity(result)
 
-@router.get("/my_responses", response_model=list[ResponseAggregateJobSchema])
+
+@router.get("/my_responses", response_model=ResponseAggregateJobPageSchema)
 async def get_all_user_responses(
-        auth_user: UserEntity = Depends(get_auth_user),
+        auth_user: PrincipalEntity = Depends(get_auth_principal),
         response_service: BaseResponseService = Depends(get_response_service),
-) -> list[ResponseAggregateJobSchema] | list[ResponseAggregateUserSchema]:
+        limit: int = Query(50, ge=1, le=RESPONSE_LIST_MAX_LIMIT),
+        cursor: str | None = None,
+        filters: ResponseFiltersSchema = Depends(),
+) -> Response:
     if auth_user.is_company:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Эндпоинт для получения откликов пользователя!",
         )
     try:
-        responses = await response_service.get_user_response_list(user=auth_user)
+        responses = await response_service.get_user_response_list(
+            user=auth_user,
+            limit=limit,
+            cursor=cursor,
+            filters=filters.to_entity(),
+        )
     except ApplicationException as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=e.message,
         )
-    return [ResponseAggregateJobSchema.from_entity(response) for response in responses]
+    return response_job_page_serializer.to_response(responses)
 
 
-@router.get("/my_company_responses", response_model=list[ResponseAggregateUserSchema])
+@router.get("/my_company_responses", response_model=ResponseAggregateUserPageSchema)
 async def get_all_company_responses(
-        auth_user: UserEntity = Depends(get_auth_user),
+        auth_user: PrincipalEntity = Depends(get_auth_principal),
         response_service: BaseResponseService = Depends(get_response_service),
-) -> list[ResponseAggregateJobSchema] | list[ResponseAggregateUserSchema]:
+        limit: int = Query(50, ge=1, le=RESPONSE_LIST_MAX_LIMIT),
+        cursor: str | None = None,
+        filters: ResponseFiltersSchema = Depends(),
+) -> Response:
     if not auth_user.is_company:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Эндпоинт для получения откликов компаний!",
         )
     try:
-        responses = await response_service.get_user_response_list(user=auth_user)
+        responses = await response_service.get_user_response_list(
+            user=auth_user,
+            limit=limit,
+            cursor=cursor,
+            filters=filters.to_entity(),
+        )
     except ApplicationException as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=e.message,
         )
-    return [ResponseAggregateUserSchema.from_entity(response) for response in responses]
+    return response_user_page_serializer.to_response(responses)
 
 
-@router.get("/job_responses", response_model=list[ResponseAggregateUserSchema])
+@router.get("/job_responses", response_model=ResponseAggregateUserPageSchema)
 async def get_all_job_responses(
         job_id: str,
-        auth_user: UserEntity = Depends(get_auth_user),
+        auth_user: PrincipalEntity = Depends(get_auth_principal),
         response_service: BaseResponseService = Depends(get_response_service),
-) -> list[ResponseAggregateUserSchema]:
+        limit: int = Query(50, ge=1, le=RESPONSE_LIST_MAX_LIMIT),
+        cursor: str | None = None,
+        filters: ResponseFiltersSchema = Depends(),
+) -> Response:
     try:
-        responses = await response_service.get_job_response_list(job_id=job_id, user=auth_user)
+        responses = await response_service.get_job_response_list(
+            job_id=job_id,
+            user=auth_user,
+            limit=limit,
+            cursor=cursor,
+            filters=filters.to_entity(),
+        )
     except ApplicationException as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=e.message,
         )
-    return [ResponseAggregateUserSchema.from_entity(response) for response in responses]
+    return response_user_page_serializer.to_response(responses)
 
 
 @router.delete("", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_response(
         response_id: str,
-        auth_user: UserEntity = Depends(get_auth_user),
+        auth_user: PrincipalEntity = Depends(get_auth_principal),
         response_service: BaseResponseService = Depends(get_response_service),
 ) -> None:
     try:
         await response_service.delete_response(response_id=response_id, user=auth_user)
+    except ServiceException as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=e.message,
+        )
     except ApplicationException as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -1,8 +1,13 @@
 from pydantic import BaseModel
 
+from api.datetimes import LocalDateTime
+from api.serialization import EntitySerializer
+
 from api.v1.jobs.schemas import JobSchema
 from api.v1.users.schemas import UserSchema
-from domain.entities.responses import ResponseEntity, ResponseAggregateJobEntity, ResponseAggregateUserEntity
+from domain.entities.pagination import PageEntity
+from domain.entities.responses import (ResponseEntity, ResponseAggregateJobEntity, ResponseAggregateUserEntity,
+                                       ResponseBatchResultEntity, ResponseFiltersEntity)
 
 
 class ResponseCreateSchema(BaseModel):
@@ -34,6 +39,20 @@ class ResponseSchema(BaseModel):
         )
 
 
+class ResponseBatchResultSchema(BaseModel):
+    created: list[ResponseSchema]
+    duplicate_job_ids: list[str]
+    missing_job_ids: list[str]
+
+    @classmethod
+    def from_entity(cls, entity: ResponseBatchResultEntity) -> "ResponseBatchResultSchema":
+        return ResponseBatchResultSchema(
+            created=[ResponseSchema.from_entity(response) for response in entity.created],
+            duplicate_job_ids=entity.duplicate_job_ids,
+            missing_job_ids=entity.missing_job_ids,
+        )
+
+
 class ResponseAggregateJobSchema(BaseModel):
     id: str
     message: str
@@ -68,3 +87,42 @@ class ResponseAggregateUserSchema(BaseModel):
             user_id=response.user_id,
             user=UserSchema.from_entity(response.user)
         )
+
+
+class ResponseFiltersSchema(BaseModel):
+    created_from: LocalDateTime | None = None
+    created_to: LocalDateTime | None = None
+
+    def to_entity(self) -> ResponseFiltersEntity:
+        return ResponseFiltersEntity(
+            created_from=self.created_from,
+            created_to=self.created_to,
+        )
+
+
+class ResponseAggregateJobPageSchema(BaseModel):
+    items: list[ResponseAggregateJobSchema]
+    next_cursor: str | None = None
+
+    @classmethod
+    def from_entity(cls, entity: PageEntity[ResponseAggregateJobEntity]) -> "ResponseAggregateJobPageSchema":
+        return ResponseAggregateJobPageSchema(
+            items=[ResponseAggregateJobSchema.from_entity(response) for response in entity.items],
+            next_cursor=entity.next_cursor,
+        )
+
+
+class ResponseAggregateUserPageSchema(BaseModel):
+    items: list[ResponseAggregateUserSchema]
+    next_cursor: str | None = None
+
+    @classmethod
+    def from_entity(cls, entity: PageEntity[ResponseAggregateUserEntity]) -> "ResponseAggregateUserPageSchema":
+        return ResponseAggregateUserPageSchema(
+            items=[ResponseAggregateUserSchema.from_entity(response) for response in entity.items],
+            next_cursor=entity.next_cursor,
+        )
+
+
+response_job_page_serializer = EntitySerializer(PageEntity[ResponseAggregateJobEntity], ResponseAggregateJobPageSchema)
+response_user_page_serializer = EntitySerializer(PageEntity[ResponseAggregateUserEntity], ResponseAggregateUserPageSchema)
@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
-from api.v1.users.schemas import UserSchema, UserInSchema, UserUpdateSchema
+from api.conditional import (has_if_none_match, is_not_modified, last_modified_of, make_etag, not_modified_response,
+                             validator_headers)
+from api.v1.users.schemas import UserSchema, UserInSchema, UserUpdateSchema, UserPageSchema, user_page_serializer
 from core.exceptions import ApplicationException
+from logic.exceptions.auth import PasswordHashingOverloadedException
 from api.dependencies.auth import get_auth_user, get_user_service
 from domain.entities.users import UserEntity
 
@@ -10,14 +13,28 @@ from logic.services.users.base import BaseUserService
 router = APIRouter(prefix="/users", tags=["users"])
 
 
-@router.get("", response_model=list[UserSchema])
+@router.get("", response_model=UserPageSchema)
 async def read_users(
+        request: Request,
         user_service: BaseUserService = Depends(get_user_service),
-        limit: int = 100,
-        offset: int = 0
-) -> list[UserSchema]:
-    users = await user_service.get_user_list(limit=limit, offset=offset)
-    return [UserSchema.from_entity(user) for user in users]
+        limit: int = Query(100, ge=1, le=1000),
+        offset: int = Query(0, ge=0),
+        cursor: str | None = None,
+) -> Response:
+    try:
+        if has_if_none_match(request):
+            versions = await user_service.get_user_list_versions(limit=limit, offset=offset, cursor=cursor)
+            etag = make_etag(versions.items, versions.has_next)
+            if is_not_modified(request, etag, use_modified_since=False):
+                return not_modified_response(etag, last_modified_of(versions.items))
+        users = await user_service.get_user_list(limit=limit, offset=offset, cursor=cursor)
+    except ApplicationException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=e.message,
+        )
+    etag = make_etag(users.items, users.next_cursor is not None)
+    return user_page_serializer.to_response(users, headers=validator_headers(etag, last_modified_of(users.items)))
 
 
 @router.post("", response_model=UserSchema)
@@ -27,6 +44,12 @@ async def create_user(
 ) -> UserSchema:
     try:
         user = await user_service.create_user(user_in=user_in.to_entity())
+    except PasswordHashingOverloadedException as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=e.message,
+            headers={"Retry-After": "1"},
+        )
     except ApplicationException as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -2,6 +2,9 @@ import datetime
 from typing import Optional
 from pydantic import BaseModel, EmailStr, field_validator, StringConstraints, ValidationInfo
 
+from api.serialization import EntitySerializer
+
+from domain.entities.pagination import PageEntity
 from domain.entities.users import UserEntity
 
 
@@ -23,6 +26,18 @@ class UserSchema(BaseModel):
         )
 
 
+class UserPageSchema(BaseModel):
+    items: list[UserSchema]
+    next_cursor: str | None = None
+
+    @classmethod
+    def from_entity(cls, entity: PageEntity[UserEntity]) -> "UserPageSchema":
+        return UserPageSchema(
+            items=[UserSchema.from_entity(user) for user in entity.items],
+            next_cursor=entity.next_cursor,
+        )
+
+
 class UserUpdateSchema(BaseModel):
     name: Optional[str] = None
     email: Optional[EmailStr] = None
@@ -56,3 +71,6 @@ class UserInSchema(BaseModel):
             password=self.password,
             is_company=self.is_company
         )
+
+
+user_page_serializer = EntitySerializer(PageEntity[UserEntity], UserPageSchema)
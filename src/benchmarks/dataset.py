@@ -0,0 +1,187 @@
+"""Генерация больших синтетических таблиц пользователей, вакансий и откликов.
+
+Запуск: python -m benchmarks.dataset --users 1000000 --jobs 500000 --responses 3000000 --seed 42
+Вакансии распределяются по компаниям, а отклики по вакансиям по закону Ципфа (--skew):
+несколько компаний получают огромное число вакансий, несколько вакансий — огромное число откликов.
+Строки грузятся через COPY, при одном и том же seed получается одинаковый набор данных.
+Пароль всех сгенерированных пользователей — "dataset".
+"""
+import argparse
+import asyncio
+import hashlib
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Iterator
+
+from passlib.hash import bcrypt
+from sqlalchemy import text
+
+from infra.repositories.session import engine
+
+CHUNK_SIZE = 50000
+PASSWORD = "dataset"
+# соль фиксирована, чтобы хеш, как и остальные данные, не зависел от запуска
+HASHED_PASSWORD = bcrypt.using(salt="DatasetGeneratorSalt..", rounds=12).hash(PASSWORD)
+TITLES = ("Разработчик", "Инженер", "Аналитик", "Менеджер", "Тестировщик", "Дизайнер", "Бухгалтер", "Водитель")
+LEVELS = ("стажёр", "младший", "ведущий", "старший", "главный")
+WORDS = ("python", "sql", "опыт", "команда", "удалённо", "офис", "график", "проект", "клиенты", "отчёты")
+
+USER_COLUMNS = ["id", "created_at", "updated_at", "name", "email", "hashed_password", "is_company"]
+JOB_COLUMNS = [
+    "id", "created_at", "updated_at", "title", "description", "salary_from", "salary_to", "is_active", "user_id",
+    "responses_count", "last_response_at",
+]
+RESPONSE_COLUMNS = ["id", "created_at", "updated_at", "message", "user_id", "job_id", "company_id"]
+
+
+def make_id(seed: int, kind: str, number: int) -> str:
+    # id выводится из номера строки, поэтому не нужно держать в памяти миллионы uuid
+    digest = hashlib.blake2b(f"{seed}:{kind}:{number}".encode(), digest_size=16).digest()
+    return str(uuid.UUID(bytes=digest, version=4))
+
+
+def allocate(total: int, buckets: int, skew: float, rng: random.Random) -> list[int]:
+    # доля корзины ранга r пропорциональна 1 / r^skew, ранги перемешиваются
+    if buckets == 0:
+        return []
+    weights = [1 / (rank + 1) ** skew for rank in range(buckets)]
+    scale = total / sum(weights)
+    counts = [int(weight * scale) for weight in weights]
+    for index in rng.choices(range(buckets), weights=weights, k=total - sum(counts)):
+        counts[index] += 1
+    rng.shuffle(counts)
+    return counts
+
+
+def random_moment(rng: random.Random, start: datetime, end: datetime) -> datetime:
+    return start + timedelta(seconds=rng.uniform(0, (end - start).total_seconds()))
+
+
+def generate_users(args: argparse.Namespace, rng: random.Random) -> Iterator[tuple]:
+    for number in range(args.users):
+        is_company = number < args.companies
+        kind = "company" if is_company else "user"
+        created_at = random_moment(rng, args.start, args.end)
+        yield (
+            make_id(args.seed, "user", number), created_at, created_at, f"{kind.capitalize()} {number}",
+            f"{kind}{number}.{args.seed}@dataset.example", HASHED_PASSWORD, is_company,
+        )
+
+
+def generate_job(
+        args: argparse.Namespace, rng: random.Random, number: int, company: int, created_at: datetime,
+        responses: list[tuple],
+) -> tuple:
+    salary_from = rng.randrange(20, 400) * 1000
+    last_response_at = max((response[1] for response in responses), default=None)
+    return (
+        make_id(args.seed, "job", number), created_at, created_at,
+        f"{rng.choice(TITLES)} ({rng.choice(LEVELS)})", " ".join(rng.choices(WORDS, k=rng.randrange(10, 60))),
+        salary_from, salary_from + rng.randrange(0, 200) * 1000, rng.random() < args.active_share,
+        make_id(args.seed, "user", company), len(responses), last_response_at,
+    )
+
+
+def generate_responses(
+        args: argparse.Namespace, rng: random.Random, first_number: int, job_number: int, company: int,
+        job_created_at: datetime, count: int,
+) -> list[tuple]:
+    # соискатели внутри вакансии выбираются без повторов — так соблюдается uix_user_job
+    applicants = rng.sample(range(args.companies, args.users), k=min(count, args.users - args.companies))
+    job_id, company_id = make_id(args.seed, "job", job_number), make_id(args.seed, "user", company)
+    responses = []
+    for applicant in applicants:
+        created_at = random_moment(rng, job_created_at, args.end)
+        responses.append((
+            make_id(args.seed, "response", first_number + len(responses)), created_at, created_at,
+            "Здравствуйте! " + " ".join(rng.choices(WORDS, k=rng.randrange(3, 20))),
+            make_id(args.seed, "user", applicant), job_id, company_id,
+        ))
+    return responses
+
+
+async def copy_rows(connection, table: str, columns: list[str], rows: list[tuple]) -> None:
+    if rows:
+        await connection.copy_records_to_table(table, records=rows, columns=columns)
+
+
+def log(message: str, started: float) -> None:
+    print(f"[{time.perf_counter() - started:8.1f} с] {message}", file=sys.stderr)
+
+
+async def main(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    started = time.perf_counter()
+    jobs_per_company = allocate(args.jobs, args.companies, args.skew, rng)
+    responses_per_job = allocate(args.responses, args.jobs, args.skew, rng)
+
+    async with engine.begin() as sa_connection:
+        # asyncpg-диалект шлёт BEGIN только перед первым запросом, без него каждый COPY закоммитится сам по себе
+        await sa_connection.execute(text("TRUNCATE responses, jobs, users") if args.truncate else text("SELECT 1"))
+        connection = (await sa_connection.get_raw_connection()).driver_connection
+
+        users = []
+        for users_total, user in enumerate(generate_users(args, rng), start=1):
+            users.append(user)
+            if len(users) >= CHUNK_SIZE:
+                await copy_rows(connection, "users", USER_COLUMNS, users)
+                users = []
+                log(f"пользователей: {users_total}", started)
+        await copy_rows(connection, "users", USER_COLUMNS, users)
+
+        # отклики ссылаются на вакансии, поэтому пачка вакансий всегда уходит раньше своих откликов
+        jobs, responses = [], []
+        job_number = responses_total = 0
+        for company, jobs_count in enumerate(jobs_per_company):
+            for _ in range(jobs_count):
+                created_at = random_moment(rng, args.start, args.end)
+                job_responses = generate_responses(
+                    args, rng, responses_total, job_number, company, created_at, responses_per_job[job_number],
+                )
+                jobs.append(generate_job(args, rng, job_number, company, created_at, job_responses))
+                responses.extend(job_responses)
+                responses_total += len(job_responses)
+                job_number += 1
+                if len(jobs) >= CHUNK_SIZE or len(responses) >= CHUNK_SIZE:
+                    await copy_rows(connection, "jobs", JOB_COLUMNS, jobs)
+                    await copy_rows(connection, "responses", RESPONSE_COLUMNS, responses)
+                    jobs, responses = [], []
+                    log(f"вакансий: {job_number}, откликов: {responses_total}", started)
+        await copy_rows(connection, "jobs", JOB_COLUMNS, jobs)
+        await copy_rows(connection, "responses", RESPONSE_COLUMNS, responses)
+        log(f"вакансий: {job_number}, откликов: {responses_total}", started)
+
+    async with engine.connect() as sa_connection:
+        await sa_connection.execution_options(isolation_level="AUTOCOMMIT")
+        await sa_connection.execute(text("ANALYZE users, jobs, responses"))
+    await engine.dispose()
+    log("готово", started)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=100000, help="всего пользователей, включая компании")
+    parser.add_argument("--companies", type=int, default=None, help="по умолчанию 2%% пользователей")
+    parser.add_argument("--jobs", type=int, default=50000)
+    parser.add_argument("--responses", type=int, default=300000)
+    parser.add_argument("--skew", type=float, default=1.1, help="показатель Ципфа; 0 — равномерно")
+    parser.add_argument("--active-share", type=float, default=0.8, help="доля активных вакансий")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--start", type=datetime.fromisoformat, default=datetime(2024, 1, 1))
+    parser.add_argument("--end", type=datetime.fromisoformat, default=datetime(2025, 1, 1))
+    parser.add_argument("--truncate", action="store_true", help="очистить таблицы перед загрузкой")
+    args = parser.parse_args()
+    if args.companies is None:
+        args.companies = max(1, args.users // 50)
+    if not 0 < args.companies < args.users:
+        parser.error("компаний должно быть больше нуля и меньше, чем пользователей")
+    if args.jobs and not args.companies:
+        parser.error("вакансиям нужны компании")
+    return args
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
@@ -0,0 +1,80 @@
+"""Сравнение чтения списка вакансий через ORM-объекты и через проекцию колонок.
+
+Запуск: python -m benchmarks.hydration --rows 10000 --repeat 5
+Данные вставляются во временную транзакцию и откатываются в конце.
+"""
+import argparse
+import asyncio
+import gc
+import time
+import tracemalloc
+from uuid import uuid4
+
+from sqlalchemy import select
+
+from domain.entities.jobs import JobEntity, JobFiltersEntity
+from domain.entities.users import UserEntity
+from infra.repositories.alchemy_models.jobs import Job
+from infra.repositories.jobs.alchemy import AlchemyJobRepository
+from infra.repositories.session import engine, session_factory
+from infra.repositories.users.alchemy import AlchemyUserRepository
+
+
+async def read_orm(session, limit: int) -> list[JobEntity]:
+    res = await session.execute(select(Job).order_by(Job.created_at.desc(), Job.id.desc()).limit(limit))
+    jobs = [job.to_entity() for job in res.scalars().all()]
+    session.expunge_all()
+    return jobs
+
+
+async def read_projection(session, limit: int) -> list[JobEntity]:
+    return await AlchemyJobRepository(session).get_all(limit=limit, filters=JobFiltersEntity())
+
+
+async def measure(name: str, read, session, rows: int, repeat: int) -> None:
+    await read(session, rows)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        await read(session, rows)
+    rows_per_second = rows * repeat / (time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    result = await read(session, rows)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{name:<12} {rows_per_second:>12,.0f} rows/s"
+        f" {retained / len(result):>8,.0f} B/row retained {peak / len(result):>8,.0f} B/row peak"
+    )
+
+
+async def main(rows: int, repeat: int) -> None:
+    async with session_factory() as session:
+        user = UserEntity(email=f"{uuid4()}@bench.local", name="bench", is_company=True, hashed_password="-")
+        await AlchemyUserRepository(session).add(user)
+        await AlchemyJobRepository(session).add_many([
+            JobEntity(
+                title=f"Вакансия {number}",
+                description="Описание вакансии " * 10,
+                salary_from=number,
+                salary_to=number * 2,
+                is_active=True,
+                user_id=user.id,
+            )
+            for number in range(rows)
+        ])
+        try:
+            await measure("orm", read_orm, session, rows, repeat)
+            await measure("projection", read_projection, session, rows, repeat)
+        finally:
+            await session.rollback()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(rows=args.rows, repeat=args.repeat))
@@ -0,0 +1,389 @@
+"""Нагрузочный прогон HTTP API по смешанным сценариям с отчётом по каждому маршруту.
+
+Запуск: python -m benchmarks.load --concurrency 20 --duration 30 --output load.json
+По умолчанию main.create_app поднимается в этом же процессе поверх базы из docker-compose,
+с --base-url запросы уходят в уже запущенный сервер. Пользователи и вакансии создаются
+с уникальным префиксом и не удаляются, поэтому прогонять лучше на отдельной базе.
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import subprocess
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import httpx
+
+API = "/api/v1"
+PASSWORD = "benchmark"
+SEARCH_WORDS = ("разработчик", "инженер", "аналитик", "менеджер", "тестировщик")
+DEFAULT_MIX = {
+    "browse": 50,
+    "login": 5,
+    "signup": 2,
+    "apply": 15,
+    "dashboard": 15,
+    "manage": 8,
+    "bulk": 2,
+    "export": 1,
+    "batch": 2,
+}
+
+
+@dataclass
+class RouteStats:
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+
+
+@dataclass
+class Actor:
+    email: str
+    user_id: str = ""
+    access_token: str = ""
+    refresh_token: str = ""
+    applied_job_ids: set[str] = field(default_factory=set)
+    response_ids: list[str] = field(default_factory=list)
+    job_ids: list[str] = field(default_factory=list)
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.access_token}"}
+
+
+@dataclass
+class Dataset:
+    prefix: str
+    companies: list[Actor] = field(default_factory=list)
+    applicants: list[Actor] = field(default_factory=list)
+    job_ids: list[str] = field(default_factory=list)
+
+
+class Recorder:
+    def __init__(self):
+        self.routes: dict[str, RouteStats] = {}
+        self.enabled = False
+
+    async def request(self, client: httpx.AsyncClient, method: str, route: str, url: str, **kwargs) -> httpx.Response:
+        started = time.perf_counter()
+        response = await client.request(method, url, **kwargs)
+        elapsed = time.perf_counter() - started
+        if self.enabled:
+            stats = self.routes.setdefault(f"{method} {API}{route}", RouteStats())
+            stats.latencies.append(elapsed)
+            stats.errors += response.status_code >= 400
+        return response
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    # nearest-rank: значение, не меньше которого fraction всех замеров
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(latencies: list[float], errors: int, duration: float) -> dict:
+    values = sorted(latencies)
+    return {
+        "count": len(values),
+        "errors": errors,
+        "rps": round(len(values) / duration, 2),
+        "mean_ms": round(sum(values) / len(values) * 1000, 2) if values else 0.0,
+        "p50_ms": round(percentile(values, 0.50) * 1000, 2),
+        "p95_ms": round(percentile(values, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(values, 0.99) * 1000, 2),
+        "max_ms": round(values[-1] * 1000, 2) if values else 0.0,
+    }
+
+
+def job_payload(rng: random.Random) -> dict:
+    salary_from = rng.randrange(30, 300) * 1000
+    return {
+        "title": f"{rng.choice(SEARCH_WORDS).capitalize()} {rng.randrange(1000)}",
+        "description": " ".join(rng.choices(SEARCH_WORDS, k=12)),
+        "salary_from": salary_from,
+        "salary_to": salary_from + rng.randrange(0, 100) * 1000,
+        "user_id": "",
+    }
+
+
+async def sign_up(client: httpx.AsyncClient, recorder: Recorder, actor: Actor, is_company: bool) -> None:
+    response = await recorder.request(client, "POST", "/users", f"{API}/users", json={
+        "name": actor.email.split("@")[0],
+        "email": actor.email,
+        "password": PASSWORD,
+        "password2": PASSWORD,
+        "is_company": is_company,
+    })
+    response.raise_for_status()
+    actor.user_id = response.json()["id"]
+    await log_in(client, recorder, actor)
+
+
+async def log_in(client: httpx.AsyncClient, recorder: Recorder, actor: Actor) -> None:
+    response = await recorder.request(
+        client, "POST", "/auth/login", f"{API}/auth/login", json={"email": actor.email, "password": PASSWORD},
+    )
+    response.raise_for_status()
+    tokens = response.json()
+    actor.access_token, actor.refresh_token = tokens["access_token"], tokens["refresh_token"]
+
+
+async def prepare(
+        client: httpx.AsyncClient, recorder: Recorder, companies: int, applicants: int, jobs_per_company: int,
+) -> Dataset:
+    rng = random.Random(0)
+    dataset = Dataset(prefix=uuid4().hex[:8])
+    dataset.companies = [Actor(email=f"company-{dataset.prefix}-{n}@bench.example") for n in range(companies)]
+    dataset.applicants = [Actor(email=f"applicant-{dataset.prefix}-{n}@bench.example") for n in range(applicants)]
+    await asyncio.gather(*(sign_up(client, recorder, actor, True) for actor in dataset.companies))
+    await asyncio.gather(*(sign_up(client, recorder, actor, False) for actor in dataset.applicants))
+    for company in dataset.companies:
+        response = await recorder.request(
+            client, "POST", "/jobs/bulk", f"{API}/jobs/bulk", headers=company.headers,
+            json=[job_payload(rng) for _ in range(jobs_per_company)],
+        )
+        response.raise_for_status()
+    for company in dataset.companies:
+        response = await recorder.request(
+            client, "GET", "/jobs", f"{API}/jobs", params={"user_id": company.user_id, "limit": 1000},
+        )
+        company.job_ids = [job["id"] for job in response.json()["items"]]
+        dataset.job_ids.extend(company.job_ids)
+    return dataset
+
+
+async def browse(client, recorder: Recorder, dataset: Dataset, rng: random.Random) -> None:
+    page = (await recorder.request(client, "GET", "/jobs", f"{API}/jobs", params={"limit": 20})).json()
+    if page.get("next_cursor"):
+        await recorder.request(
+            client, "GET", "/jobs", f"{API}/jobs", params={"limit": 20, "cursor": page["next_cursor"]},
+        )
+    job_id = rng.choice(dataset.job_ids)
+    await recorder.request(client, "GET", "/jobs/{job_id}", f"{API}/jobs/{job_id}")
+    await recorder.request(client, "GET", "/jobs/search", f"{API}/jobs/search", params={
+        "q": rng.choice(SEARCH_WORDS), "limit": 20,
+    })
+    await recorder.request(client, "GET", "/users", f"{API}/users", params={"limit": 20})
+
+
+async def login(client, recorder: Recorder, dataset: Dataset, rng: random.Random) -> None:
+    actor = rng.choice(dataset.applicants + dataset.companies)
+    await log_in(client, recorder, actor)
+    response = await recorder.request(
+        client, "POST", "/auth/refresh", f"{API}/auth/refresh", json={"refresh_token": actor.refresh_token},
+    )
+    if response.is_success:
+        actor.access_token = response.json()["access_token"]
+
+
+async def signup(client, recorder: Recorder, dataset: Dataset, rng: random.Random) -> None:
+    actor = Actor(email=f"applicant-{dataset.prefix}-{uuid4().hex[:12]}@bench.example")
+    await sign_up(client, recorder, actor, is_company=False)
+    dataset.applicants.append(actor)
+
+
+async def apply(client, recorder: Recorder, dataset: Dataset, rng: random.Random) -> None:
+    applicant = rng.choice(dataset.applicants)
+    job_id = rng.choice(dataset.job_ids)
+    if job_id not in applicant.applied_job_ids:
+        applicant.applied_job_ids.add(job_id)
+        response = await recorder.request(
+            client, "POST", "/responses", f"{API}/responses", headers=applicant.headers,
+            json={"message": "Готов приступить", "job_id": job_id},
+        )
+        if response.is_success:
+            applicant.response_ids.append(response.json()["id"])
+    await recorder.request(
+        client, "GET", "/responses/my_responses", f"{API}/responses/my_responses", headers=applicant.headers,
+        params={"limit": 20},
+    )
+    if applicant.response_ids and rng.random() < 0.1:
+        response_id = applicant.response_ids.pop(rng.randrange(len(applicant.response_ids)))
+        await recorder.request(
+            client, "DELETE", "/responses", f"{API}/responses", headers=applicant.headers,
+            params={"response_id": response_id},
+        )
+
+
+async def batch(client, recorder: Recorder, dataset: Dataset, rng: random.Random) -> None:
+    applicant = rng.choice(dataset.applicants)
+    # выбираем только из ещё не откликнутых: пустой пакет сервер отклоняет с 422, это ошибка сценария
+    candidates = [job_id for job_id in dataset.job_ids if job_id not in applicant.applied_job_ids]
+    if not candidates:
+        return
+    job_ids = rng.sample(candidates, k=min(5, len(candidates)))
+    applicant.applied_job_ids.update(job_ids)
+    response = await recorder.request(
+        client, "POST", "/responses/batch", f"{API}/responses/batch", headers=applicant.headers,
+        json=[{"message": "Готов приступить", "job_id": job_id} for job_id in job_ids],
+    )
+    if response.is_success:
+        applicant.response_ids.extend(created["id"] for created in response.json()["created"])
+
+
+async def dashboard(client, recorder: Recorder, dataset: Dataset, rng: random.Random) -> None:
+    company = rng.choice(dataset.companies)
+    since = (datetime.now() - timedelta(minutes=5)).isoformat()
+    await recorder.request(
+        client, "GET", "/jobs/my/stats", f"{API}/jobs/my/stats", headers=company.headers, params={"since": since},
+    )
+    await recorder.request(
+        client, "GET", "/responses/my_company_responses", f"{API}/responses/my_company_responses",
+        headers=company.headers, params={"limit": 20},
+    )
+    if company.job_ids:
+        await recorder.request(
+            client, "GET", "/responses/job_responses", f"{API}/responses/job_responses", headers=company.headers,
+            params={"job_id": rng.choice(company.job_ids), "limit": 20},
+        )
+
+
+async def manage(client, recorder: Recorder, dataset: Dataset, rng: random.Random) -> None:
+    # созданная здесь вакансия не попадает в общий пул, чтобы на неё не успели откликнуться до удаления
+    company = rng.choice(dataset.companies)
+    response = await recorder.request(
+        client, "POST", "/jobs", f"{API}/jobs", headers=company.headers, json=job_payload(rng),
+    )
+    if response.is_success:
+        await recorder.request(
+            client, "DELETE", "/jobs", f"{API}/jobs", headers=company.headers,
+            params={"job_id": response.json()["id"]},
+        )
+    await recorder.request(
+        client, "PUT", "/users", f"{API}/users", headers=company.headers, params={"user_id": company.user_id},
+        json={"name": f"company-{rng.randrange(1000)}"},
+    )
+
+
+async def bulk(client, recorder: Recorder, dataset: Dataset, rng: random.Random) -> None:
+    company = rng.choice(dataset.companies)
+    await recorder.request(
+        client, "POST", "/jobs/bulk", f"{API}/jobs/bulk", headers=company.headers,
+        json=[job_payload(rng) for _ in range(50)],
+    )
+
+
+async def export(client, recorder: Recorder, dataset: Dataset, rng: random.Random) -> None:
+    company = rng.choice(dataset.companies)
+    await recorder.request(client, "GET", "/jobs/export", f"{API}/jobs/export", params={
+        "user_id": company.user_id, "format": rng.choice(["ndjson", "csv"]),
+    })
+
+
+SCENARIOS = {
+    "browse": browse,
+    "login": login,
+    "signup": signup,
+    "apply": apply,
+    "dashboard": dashboard,
+    "manage": manage,
+    "bulk": bulk,
+    "export": export,
+    "batch": batch,
+}
+
+
+async def worker(
+        client: httpx.AsyncClient, recorder: Recorder, dataset: Dataset, mix: dict[str, int],
+        deadline: float, seed: int,
+) -> None:
+    rng = random.Random(seed)
+    names, weights = list(mix), list(mix.values())
+    while time.perf_counter() < deadline:
+        await SCENARIOS[rng.choices(names, weights)[0]](client, recorder, dataset, rng)
+
+
+def parse_mix(value: str) -> dict[str, int]:
+    mix = dict(DEFAULT_MIX)
+    for item in filter(None, value.split(",")):
+        name, _, weight = item.partition("=")
+        if name not in SCENARIOS:
+            raise argparse.ArgumentTypeError(f"неизвестный сценарий {name}, доступны: {', '.join(SCENARIOS)}")
+        mix[name] = int(weight)
+    return {name: weight for name, weight in mix.items() if weight > 0}
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def main(args: argparse.Namespace) -> dict:
+    if args.base_url:
+        client = httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout)
+        app = None
+    else:
+        from main import create_app
+        app = create_app()
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://benchmark", timeout=args.timeout,
+        )
+
+    recorder = Recorder()
+    async with client:
+        dataset = await prepare(client, recorder, args.companies, args.applicants, args.jobs_per_company)
+        recorder.enabled = True
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(*(
+            worker(client, recorder, dataset, args.mix, deadline, seed=args.seed + number)
+            for number in range(args.concurrency)
+        ))
+        elapsed = time.perf_counter() - started
+
+    if app is not None:
+        from infra.repositories.session import engine
+        await engine.dispose()
+
+    return {
+        "config": {
+            "base_url": args.base_url or "in-process",
+            "concurrency": args.concurrency,
+            "duration_seconds": round(elapsed, 2),
+            "mix": args.mix,
+            "seed": args.seed,
+            "revision": git_revision(),
+            "started_at": datetime.now().isoformat(timespec="seconds"),
+        },
+        "total": summarize(
+            [latency for stats in recorder.routes.values() for latency in stats.latencies],
+            sum(stats.errors for stats in recorder.routes.values()),
+            elapsed,
+        ),
+        "routes": {
+            route: summarize(stats.latencies, stats.errors, elapsed)
+            for route, stats in sorted(recorder.routes.items())
+        },
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", help="адрес запущенного сервера; без него приложение поднимается в процессе")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=30, help="длительность замера в секундах")
+    parser.add_argument("--companies", type=int, default=5)
+    parser.add_argument("--applicants", type=int, default=20)
+    parser.add_argument("--jobs-per-company", type=int, default=100)
+    parser.add_argument("--mix", type=parse_mix, default=dict(DEFAULT_MIX),
+                        help="веса сценариев, например browse=80,apply=20,export=0")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--output", help="куда записать JSON-отчёт; по умолчанию в stdout")
+    args = parser.parse_args()
+    report = json.dumps(asyncio.run(main(args)), ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(report)
+    else:
+        print(report)
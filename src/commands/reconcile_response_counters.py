@@ -0,0 +1,22 @@
+"""Пересчёт счётчиков откликов у вакансий по таблице откликов.
+
+Запуск: python -m commands.reconcile_response_counters
+Исправляются только разошедшиеся строки, повторный запуск безопасен.
+"""
+import asyncio
+
+from di import get_container
+from infra.repositories.jobs.alchemy import AlchemyJobRepository
+from infra.repositories.session import engine, unit_of_work
+
+
+async def main() -> None:
+    async with unit_of_work():
+        repository: AlchemyJobRepository = get_container().resolve(AlchemyJobRepository)
+        repaired = await repository.reconcile_response_counters()
+    await engine.dispose()
+    print(f"Исправлено вакансий: {repaired}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
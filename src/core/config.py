@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -18,6 +19,13 @@ class DbSettings(CustomSettings):
     postgres_password: str
     postgres_host: str
     postgres_port: int
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = False
+    statement_cache_size: int = 100
+    replica_urls: list[str] = []
 
     @property
     def db_url(self):
@@ -33,11 +41,43 @@ class AuthJWT(CustomSettings):
     token_type_field_name: str = "token_type"
     access_token_name: str = "access"
     refresh_token_name: str = "refresh"
+    # id и is_company кладутся в access-токен, принципал строится без запроса к базе; выданный токен
+    # живёт до access_token_expire_minutes, поэтому смена email и is_company при включённом флаге запрещена
+    embed_principal_claims: bool = False
+
+
+class CacheSettings(CustomSettings):
+    principal_cache_max_size: int = 10000
+    principal_cache_ttl_seconds: float = 60
+    # memory — LRU в каждом воркере, shared — общий redis, fake — замена redis в памяти процесса;
+    # TTL ограничивает устаревание там, где инвалидация не доходит (memory при нескольких воркерах)
+    listing_cache_backend: Literal["none", "memory", "shared", "fake"] = "memory"
+    listing_cache_max_size: int = 1000
+    listing_cache_ttl_seconds: int = 10
+    shared_cache_url: str = "redis://localhost:6379/0"
+
+
+class PasswordHashingSettings(CustomSettings):
+    password_hashing_executor: Literal["thread", "process"] = "thread"
+    password_hashing_max_workers: int = 4
+    password_hashing_max_pending: int = 64
+
+
+class InstrumentationSettings(CustomSettings):
+    sql_instrumentation_enabled: bool = True
+    # одна и та же форма запроса чаще этого порога за запрос — признак N+1
+    sql_repeated_statement_threshold: int = 5
+    # INFO — сводка по каждому запросу, WARNING — только запросы с признаками N+1
+    sql_log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = "INFO"
+    metrics_enabled: bool = True
 
 
 class Settings(CustomSettings):
     db: DbSettings = DbSettings()
     auth_jwt: AuthJWT = AuthJWT()
+    cache: CacheSettings = CacheSettings()
+    password_hashing: PasswordHashingSettings = PasswordHashingSettings()
+    instrumentation: InstrumentationSettings = InstrumentationSettings()
 
 
 settings = Settings()
@@ -2,7 +2,17 @@ import punq
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from functools import lru_cache
+from typing import Any
 
+from core.config import settings
+from domain.entities.jobs import JobEntity
+from domain.entities.pagination import PageEntity
+from domain.entities.users import UserEntity
+from infra.cache.base import BaseCache
+from infra.cache.fake import FakeSharedCacheClient
+from infra.cache.memory import MemoryCache
+from infra.cache.registry import CacheRegistry
+from infra.cache.shared import SharedCache, SharedCacheClient
 from infra.repositories.session import get_session
 from infra.repositories.jobs.alchemy import AlchemyJobRepository
 from infra.repositories.jobs.base import BaseJobRepository
@@ -17,6 +27,7 @@ from logic.services.responses.base import BaseResponseService
 from logic.services.responses.repo import RepositoryResponseService
 from logic.services.users.base import BaseUserService
 from logic.services.users.repo import RepositoryUserService
+from logic.utils.password_hasher import PasswordHasher
 
 
 @lru_cache(1)
@@ -24,12 +35,63 @@ def get_container() -> punq.Container:
     return _initialize_container()
 
 
+def _init_shared_cache_client() -> SharedCacheClient:
+    if settings.cache.listing_cache_backend == "fake":
+        return FakeSharedCacheClient()
+    # redis нужен только для общего кэша, поэтому импортируется по требованию
+    from redis.asyncio import Redis
+    return Redis.from_url(settings.cache.shared_cache_url)
+
+
+def _init_listing_cache(prefix: str, value_type: Any, shared_client: SharedCacheClient | None) -> BaseCache | None:
+    if settings.cache.listing_cache_backend == "none":
+        return None
+    if shared_client is None:
+        return MemoryCache(
+            max_size=settings.cache.listing_cache_max_size,
+            ttl_seconds=settings.cache.listing_cache_ttl_seconds,
+        )
+    return SharedCache(
+        client=shared_client,
+        prefix=prefix,
+        ttl_seconds=settings.cache.listing_cache_ttl_seconds,
+        value_type=value_type,
+    )
+
+
 def _initialize_container() -> punq.Container:
     container = punq.Container()
 
     # init session
     container.register(AsyncSession, factory=get_session)
 
+    # init caches
+    principal_cache = MemoryCache(
+        max_size=settings.cache.principal_cache_max_size,
+        ttl_seconds=settings.cache.principal_cache_ttl_seconds,
+    )
+    shared_cache_client = None
+    if settings.cache.listing_cache_backend in ("shared", "fake"):
+        shared_cache_client = _init_shared_cache_client()
+    job_list_cache = _init_listing_cache("jobs", PageEntity[JobEntity], shared_cache_client)
+    user_list_cache = _init_listing_cache("users", PageEntity[UserEntity], shared_cache_client)
+
+    cache_registry = CacheRegistry()
+    cache_registry.register("principal", principal_cache)
+    if job_list_cache is not None:
+        cache_registry.register("job_list", job_list_cache)
+    if user_list_cache is not None:
+        cache_registry.register("user_list", user_list_cache)
+    container.register(CacheRegistry, instance=cache_registry)
+
+    # init password hashing pool
+    password_hasher = PasswordHasher.from_settings(
+        executor_type=settings.password_hashing.password_hashing_executor,
+        max_workers=settings.password_hashing.password_hashing_max_workers,
+        max_pending=settings.password_hashing.password_hashing_max_pending,
+    )
+    container.register(PasswordHasher, instance=password_hasher)
+
     # init repos
     container.register(BaseUserRepository)
     container.register(AlchemyUserRepository)
@@ -41,20 +103,30 @@ def _initialize_container() -> punq.Container:
     # init services
     def init_sqlalchemy_user_service():
         repository: BaseUserRepository = container.resolve(AlchemyUserRepository)
-        return RepositoryUserService(repository=repository)
+        return RepositoryUserService(
+            repository=repository,
+            password_hasher=password_hasher,
+            principal_cache=principal_cache,
+            list_cache=user_list_cache,
+            principal_claims_in_token=settings.auth_jwt.embed_principal_claims,
+        )
 
     def init_jwt_auth_service():
         repository: BaseUserRepository = container.resolve(AlchemyUserRepository)
-        return JWTAuthService(user_repository=repository)
+        return JWTAuthService(user_repository=repository, password_hasher=password_hasher)
 
     def init_sqlalchemy_job_service():
         repository: BaseJobRepository = container.resolve(AlchemyJobRepository)
-        return RepositoryJobService(repository=repository)
+        return RepositoryJobService(repository=repository, list_cache=job_list_cache)
 
     def init_sqlalchemy_response_service():
         repository: BaseResponseRepository = container.resolve(AlchemyResponseRepository)
         job_repository: BaseJobRepository = container.resolve(AlchemyJobRepository)
-        return RepositoryResponseService(repository=repository, job_repository=job_repository)
+        return RepositoryResponseService(
+            repository=repository,
+            job_repository=job_repository,
+            job_list_cache=job_list_cache,
+        )
 
     container.register(BaseUserService, factory=init_sqlalchemy_user_service)
     container.register(BaseJobService, factory=init_sqlalchemy_job_service)
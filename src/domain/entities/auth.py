@@ -13,3 +13,12 @@ class TokenEntity:
 class TokenPayloadEntity:
     sub: str | None = None
     iat: datetime = field(default_factory=datetime.now)
+    user_id: str | None = None
+    is_company: bool | None = None
+
+
+@dataclass
+class PrincipalEntity:
+    id: str
+    email: str
+    is_company: bool
@@ -3,7 +3,7 @@ from datetime import datetime
 from uuid import uuid4
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseEntity:
     id: str = field(
         default_factory=lambda: str(uuid4()),
@@ -13,6 +13,10 @@ class BaseEntity:
         default_factory=datetime.now,
         kw_only=True
     )
+    updated_at: datetime = field(
+        default_factory=datetime.now,
+        kw_only=True
+    )
 
     def to_not_nullable_values_dict(self):
         return {key: value for key, value in asdict(self).items() if value is not None}
@@ -1,9 +1,16 @@
 from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
 
 from domain.entities.base import BaseEntity
 
 
-@dataclass
+class JobSortEnum(str, Enum):
+    NEWEST = "newest"
+    HIGHEST_SALARY = "highest_salary"
+
+
+@dataclass(slots=True)
 class JobEntity(BaseEntity):
     title: str
     description: str
@@ -11,3 +18,25 @@ class JobEntity(BaseEntity):
     salary_to: float
     is_active: bool
     user_id: str
+    responses_count: int = 0
+    last_response_at: datetime | None = None
+
+
+@dataclass(slots=True)
+class JobFiltersEntity:
+    is_active: bool | None = None
+    salary_from: float | None = None
+    salary_to: float | None = None
+    user_id: str | None = None
+    sort: JobSortEnum = JobSortEnum.NEWEST
+
+
+@dataclass(slots=True)
+class JobStatsEntity:
+    job_id: str
+    title: str
+    is_active: bool
+    created_at: datetime
+    responses_count: int
+    last_response_at: datetime | None
+    new_responses_count: int | None = None
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class PoolStatsEntity:
+    name: str
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+    waits: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+    timeouts: int
+
+
+@dataclass
+class CacheStatsEntity:
+    name: str
+    hits: int
+    misses: int
+    hit_ratio: float
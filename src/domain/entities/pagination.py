@@ -0,0 +1,17 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class CursorEntity:
+    value: datetime | float
+    id: str
+
+
+@dataclass
+class PageEntity(Generic[T]):
+    items: list[T] = field(default_factory=list)
+    next_cursor: str | None = None
@@ -1,18 +1,19 @@
 from dataclasses import dataclass
+from datetime import datetime
 
 from domain.entities.base import BaseEntity
 from domain.entities.jobs import JobEntity
 from domain.entities.users import UserEntity
 
 
-@dataclass
+@dataclass(slots=True)
 class ResponseEntity(BaseEntity):
     message: str
     user_id: str
     job_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ResponseAggregateJobEntity(BaseEntity):
     message: str
     user_id: str
@@ -20,9 +21,22 @@ class ResponseAggregateJobEntity(BaseEntity):
     job: JobEntity
 
 
-@dataclass
+@dataclass(slots=True)
 class ResponseAggregateUserEntity(BaseEntity):
     message: str
     user_id: str
     job_id: str
     user: UserEntity
+
+
+@dataclass(slots=True)
+class ResponseFiltersEntity:
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+
+
+@dataclass(slots=True)
+class ResponseBatchResultEntity:
+    created: list[ResponseEntity]
+    duplicate_job_ids: list[str]
+    missing_job_ids: list[str]
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from domain.entities.base import BaseEntity
 
 
-@dataclass
+@dataclass(slots=True)
 class UserEntity(BaseEntity):
     email: str
     name: str
@@ -12,7 +12,7 @@ class UserEntity(BaseEntity):
     hashed_password: str | None = None
       
 
-@dataclass
+@dataclass(slots=True)
 class TokenEntity:
     access_token: str
     token_type: str
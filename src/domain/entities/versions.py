@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+
+
+@dataclass(slots=True)
+class VersionEntity:
+    id: str
+    updated_at: datetime
+
+
+@dataclass(slots=True)
+class PageVersionsEntity:
+    items: list[VersionEntity] = field(default_factory=list)
+    has_next: bool = False
@@ -0,0 +1,29 @@
+import time
+
+
+# заменяет redis локально и в тестах; общий между кэшами в пределах одного процесса
+class FakeSharedCacheClient:
+    def __init__(self):
+        self._items: dict[str, tuple[float | None, bytes]] = {}
+
+    async def get(self, name: str) -> bytes | None:
+        item = self._items.get(name)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._items[name]
+            return None
+        return value
+
+    async def set(self, name: str, value: bytes, ex: int | None = None) -> bool:
+        self._items[name] = (time.monotonic() + ex if ex is not None else None, value)
+        return True
+
+    async def delete(self, *names: str) -> int:
+        return sum(self._items.pop(name, None) is not None for name in names)
+
+    async def incr(self, name: str) -> int:
+        value = int(await self.get(name) or 0) + 1
+        self._items[name] = (None, str(value).encode())
+        return value
@@ -0,0 +1,17 @@
+from domain.entities.monitoring import CacheStatsEntity
+from infra.cache.base import BaseCache
+
+
+class CacheRegistry:
+    def __init__(self):
+        self._caches: dict[str, BaseCache] = {}
+
+    def register(self, name: str, cache: BaseCache) -> BaseCache:
+        self._caches[name] = cache
+        return cache
+
+    def get_all_stats(self) -> list[CacheStatsEntity]:
+        return [
+            CacheStatsEntity(name=name, hits=cache.hits, misses=cache.misses, hit_ratio=cache.hit_ratio)
+            for name, cache in self._caches.items()
+        ]
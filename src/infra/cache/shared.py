@@ -0,0 +1,54 @@
+from typing import Any, Protocol
+
+from pydantic import TypeAdapter
+
+from infra.cache.base import BaseCache
+
+
+class SharedCacheClient(Protocol):
+    # подмножество API redis.asyncio.Redis, которым пользуется кэш
+    async def get(self, name: str) -> bytes | None:
+        ...
+
+    async def set(self, name: str, value: bytes, ex: int | None = None) -> Any:
+        ...
+
+    async def delete(self, *names: str) -> int:
+        ...
+
+    async def incr(self, name: str) -> int:
+        ...
+
+
+class SharedCache(BaseCache):
+    def __init__(self, client: SharedCacheClient, prefix: str, ttl_seconds: int, value_type: Any):
+        super().__init__()
+        self.client = client
+        self.prefix = prefix
+        self.ttl_seconds = ttl_seconds
+        # значения хранятся в JSON, как и ответы API: тип задаёт и кодирование, и разбор
+        self.adapter = TypeAdapter(value_type)
+
+    async def _key(self, key: str) -> str:
+        # поколение входит в ключ: clear лишь увеличивает его, старые записи дожидаются TTL
+        generation = await self.client.get(f"{self.prefix}:generation")
+        return f"{self.prefix}:{int(generation or 0)}:{key}"
+
+    async def get(self, key: str) -> Any | None:
+        payload = await self.client.get(await self._key(key))
+        if payload is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self.adapter.validate_json(payload)
+
+    async def set(self, key: str, value: Any) -> None:
+        await self.client.set(await self._key(key), self.adapter.dump_json(value), ex=self.ttl_seconds)
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.client.delete(*[await self._key(key) for key in keys])
+
+    async def clear(self) -> None:
+        # один счётчик на префикс: соседние кэши и воркеры на том же сервере не затрагиваются
+        await self.client.incr(f"{self.prefix}:generation")
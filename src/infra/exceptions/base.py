@@ -5,3 +5,9 @@ class RepositoryException(ApplicationException):
     @property
     def message(self):
         return "Произошла ошибка при записи или получении данных"
+
+
+# ошибка программиста, а не данных: не наследуется от ApplicationException, чтобы не стать ответом 403
+class NoUnitOfWorkException(RuntimeError):
+    def __init__(self):
+        super().__init__("Сессия запрошена вне unit_of_work(): её изменения никто не закоммитит")
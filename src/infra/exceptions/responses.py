@@ -8,3 +8,12 @@ class ResponseNotFoundDBException(RepositoryException):
     @property
     def message(self):
         return f"Отклик с id {self.response_id} не найден!"
+
+
+class ResponseAlreadyExistsDBException(RepositoryException):
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+
+    @property
+    def message(self):
+        return f"Отклик на вакансию с id {self.job_id} уже существует!"
@@ -14,4 +14,7 @@ class TimedBaseModel(Base):
         return f"{cls.__name__.lower()}s"
 
     id: Mapped[str] = mapped_column(primary_key=True, comment="Идентификатор", unique=True,)
-    created_at: Mapped[datetime] = mapped_column(default=datetime.now(), comment="Время создания записи",)
+    created_at: Mapped[datetime] = mapped_column(default=datetime.now, comment="Время создания записи",)
+    updated_at: Mapped[datetime] = mapped_column(
+        default=datetime.now, onupdate=datetime.now, comment="Время последнего изменения записи",
+    )
@@ -1,6 +1,8 @@
+from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import String, ForeignKey, Text
+from sqlalchemy import String, ForeignKey, Text, Index, Computed, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from domain.entities.jobs import JobEntity
@@ -10,6 +12,8 @@ if TYPE_CHECKING:
     from infra.repositories.alchemy_models.responses import Response
     from infra.repositories.alchemy_models.users import User
 
+JOB_SEARCH_CONFIG = "russian"
+
 
 class Job(TimedBaseModel):
     title: Mapped[str] = mapped_column(String(100), comment="Название вакансии")
@@ -18,10 +22,34 @@ class Job(TimedBaseModel):
     salary_to: Mapped[float] = mapped_column(comment="Зарплата до")
     is_active: Mapped[bool] = mapped_column(comment="Активна ли вакансия ")
     user_id: Mapped[str] = mapped_column(ForeignKey("users.id"), comment="Идентификатор пользователя")
+    responses_count: Mapped[int] = mapped_column(default=0, server_default=text("0"), comment="Число откликов")
+    last_response_at: Mapped[datetime | None] = mapped_column(comment="Время последнего отклика")
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{JOB_SEARCH_CONFIG}', title), 'A') || "
+            f"setweight(to_tsvector('{JOB_SEARCH_CONFIG}', description), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+        comment="Поисковый вектор по названию и описанию",
+    )
 
     user: Mapped['User'] = relationship(back_populates="jobs", )
     responses: Mapped[list['Response']] = relationship(back_populates="job")
 
+    __table_args__ = (
+        Index('ix_jobs_created_at_id', 'created_at', 'id'),
+        Index('ix_jobs_search_vector', 'search_vector', postgresql_using='gin'),
+        Index('ix_jobs_salary_to_id', 'salary_to', 'id'),
+        Index('ix_jobs_user_id_created_at_id', 'user_id', 'created_at', 'id'),
+        Index('ix_jobs_user_id_salary_to_id', 'user_id', 'salary_to', 'id'),
+        Index('ix_jobs_user_id_is_active_created_at_id', 'user_id', 'is_active', 'created_at', 'id'),
+        Index('ix_jobs_user_id_is_active_salary_to_id', 'user_id', 'is_active', 'salary_to', 'id'),
+        Index('ix_jobs_is_active_created_at_id', 'is_active', 'created_at', 'id'),
+        Index('ix_jobs_is_active_salary_to_id', 'is_active', 'salary_to', 'id'),
+    )
+
     def __str__(self):
         return f"{self.__class__.__name__}(id={self.id}, title={self.title!r}"
 
@@ -37,5 +65,8 @@ class Job(TimedBaseModel):
             salary_to=self.salary_to,
             is_active=self.is_active,
             user_id=self.user_id,
+            responses_count=self.responses_count,
+            last_response_at=self.last_response_at,
             created_at=self.created_at,
+            updated_at=self.updated_at,
         )
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Text, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, Text, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from domain.entities.responses import ResponseEntity, ResponseAggregateJobEntity, ResponseAggregateUserEntity
@@ -15,12 +15,17 @@ class Response(TimedBaseModel):
     message: Mapped[str] = mapped_column(Text, comment="Описание вакансии")
     user_id: Mapped[str] = mapped_column(ForeignKey("users.id"), comment="Идентификатор пользователя")
     job_id: Mapped[str] = mapped_column(ForeignKey("jobs.id"), comment="Идентификатор вакансии")
+    # копия jobs.user_id: список откликов компании читается одним проходом по индексу без соединения с jobs
+    company_id: Mapped[str] = mapped_column(ForeignKey("users.id"), comment="Идентификатор компании-владельца вакансии")
 
-    user: Mapped["User"] = relationship(back_populates="responses", )
+    user: Mapped["User"] = relationship(back_populates="responses", foreign_keys=[user_id])
     job: Mapped["Job"] = relationship(back_populates="responses", )
 
     __table_args__ = (
         UniqueConstraint('user_id', 'job_id', name='uix_user_job'),
+        Index('ix_responses_user_id_created_at_id', 'user_id', 'created_at', 'id'),
+        Index('ix_responses_job_id_created_at_id', 'job_id', 'created_at', 'id'),
+        Index('ix_responses_company_id_created_at_id', 'company_id', 'created_at', 'id'),
     )
 
     def __str__(self):
@@ -36,6 +41,7 @@ class Response(TimedBaseModel):
             user_id=self.user_id,
             job_id=self.job_id,
             created_at=self.created_at,
+            updated_at=self.updated_at,
         )
 
     def to_aggregate_job_entity(self) -> ResponseAggregateJobEntity:
@@ -45,6 +51,7 @@ class Response(TimedBaseModel):
             user_id=self.user_id,
             job_id=self.job_id,
             created_at=self.created_at,
+            updated_at=self.updated_at,
             job=self.job.to_entity()
         )
 
@@ -55,5 +62,6 @@ class Response(TimedBaseModel):
             user_id=self.user_id,
             job_id=self.job_id,
             created_at=self.created_at,
+            updated_at=self.updated_at,
             user=self.user.to_entity()
         )
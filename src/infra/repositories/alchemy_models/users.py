@@ -1,3 +1,4 @@
+from sqlalchemy import Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from domain.entities.users import UserEntity
@@ -13,7 +14,11 @@ class User(TimedBaseModel):
     is_company: Mapped[bool] = mapped_column(comment="Флаг компании")
 
     jobs: Mapped[list["Job"]] = relationship(back_populates="user")
-    responses: Mapped[list["Response"]] = relationship(back_populates="user")
+    responses: Mapped[list["Response"]] = relationship(back_populates="user", foreign_keys=[Response.user_id])
+
+    __table_args__ = (
+        Index('ix_users_created_at_id', 'created_at', 'id'),
+    )
 
     def __str__(self):
         return f"{self.__class__.__name__}(id={self.id}, name={self.name!r})"
@@ -28,5 +33,6 @@ class User(TimedBaseModel):
             name=self.name,
             is_company=self.is_company,
             hashed_password=self.hashed_password,
-            created_at=self.created_at
+            created_at=self.created_at,
+            updated_at=self.updated_at,
         )
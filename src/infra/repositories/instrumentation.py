@@ -0,0 +1,63 @@
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+_PLACEHOLDERS = re.compile(r"\$\d+(?:\s*,\s*\$\d+)*")
+_SPACES = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    # IN с разным числом параметров — та же форма запроса
+    return _SPACES.sub(" ", _PLACEHOLDERS.sub("?", statement)).strip()
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    duration_seconds: float = 0.0
+    shapes: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, duration_seconds: float) -> None:
+        self.count += 1
+        self.duration_seconds += duration_seconds
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated_shapes(self, threshold: int) -> dict[str, int]:
+        return {shape: count for shape, count in self.shapes.items() if count > threshold}
+
+
+# статистика текущего запроса; объект изменяемый, поэтому его видят и копии контекста
+_current_stats: ContextVar[QueryStats | None] = ContextVar("current_query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is not None:
+        context.query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _current_stats.get()
+    if stats is not None and context is not None:
+        stats.record(statement, time.perf_counter() - context.query_started)
+
+
+def instrument_engine(target_engine: AsyncEngine) -> None:
+    event.listen(target_engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(target_engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
@@ -1,12 +1,20 @@
-from sqlalchemy import select, delete
+from dataclasses import asdict
+from datetime import datetime
+from typing import AsyncIterator
+
+from sqlalchemy import Select, and_, select, delete, exists, func, insert, or_, tuple_, update
 from sqlalchemy.exc import NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from domain.entities.jobs import JobEntity
+from domain.entities.jobs import JobEntity, JobFiltersEntity, JobSortEnum, JobStatsEntity
+from domain.entities.pagination import CursorEntity
+from domain.entities.versions import VersionEntity
 from infra.exceptions.jobs import JobNotFoundDBException
-from infra.repositories.alchemy_models.jobs import Job
+from infra.repositories.alchemy_models.jobs import Job, JOB_SEARCH_CONFIG
+from infra.repositories.alchemy_models.responses import Response
 from infra.repositories.jobs.base import BaseJobRepository
-from infra.repositories.jobs.converters import convert_job_entity_to_dto
+from infra.repositories.jobs.converters import JOB_ENTITY_COLUMNS, convert_job_entity_to_dto, convert_job_row_to_entity
+from infra.repositories.session import on_replica
 
 
 class AlchemyJobRepository(BaseJobRepository):
@@ -14,32 +22,138 @@ class AlchemyJobRepository(BaseJobRepository):
         self.session = session
 
     async def get_one_by_id(self, job_id: str) -> Job:
-        query = select(Job).where(Job.id == job_id).limit(1)
-        async with self.session as session:
-            try:
-                res = await session.execute(query)
-                job = res.scalar_one()
-            except NoResultFound:
-                raise JobNotFoundDBException(job_id=job_id)
+        query = on_replica(select(Job).where(Job.id == job_id).limit(1))
+        try:
+            res = await self.session.execute(query)
+            job = res.scalar_one()
+        except NoResultFound:
+            raise JobNotFoundDBException(job_id=job_id)
         return job
 
-    async def get_all(self, limit: int, offset: int) -> list[Job]:
-        query = select(Job).limit(limit).offset(offset)
-        async with self.session as session:
-            res = await session.execute(query)
-        return res.scalars().all()
+    async def get_version(self, job_id: str) -> VersionEntity:
+        query = on_replica(select(Job.id, Job.updated_at).where(Job.id == job_id))
+        row = (await self.session.execute(query)).one_or_none()
+        if row is None:
+            raise JobNotFoundDBException(job_id=job_id)
+        return VersionEntity(id=row.id, updated_at=row.updated_at)
+
+    @staticmethod
+    def _build_list_query(
+            limit: int | None,
+            offset: int,
+            cursor: CursorEntity | None,
+            filters: JobFiltersEntity,
+            columns: tuple = JOB_ENTITY_COLUMNS,
+    ) -> Select:
+        query = select(*columns)
+        if filters.is_active is not None:
+            query = query.where(Job.is_active == filters.is_active)
+        if filters.salary_from is not None:
+            query = query.where(Job.salary_from >= filters.salary_from)
+        if filters.salary_to is not None:
+            query = query.where(Job.salary_to <= filters.salary_to)
+        if filters.user_id is not None:
+            query = query.where(Job.user_id == filters.user_id)
+
+        sort_column = Job.salary_to if filters.sort == JobSortEnum.HIGHEST_SALARY else Job.created_at
+        query = query.order_by(sort_column.desc(), Job.id.desc()).limit(limit)
+        if cursor:
+            return query.where(tuple_(sort_column, Job.id) < (cursor.value, cursor.id))
+        return query.offset(offset)
+
+    async def get_all(
+            self,
+            limit: int,
+            offset: int = 0,
+            cursor: CursorEntity | None = None,
+            filters: JobFiltersEntity | None = None,
+    ) -> list[JobEntity]:
+        query = on_replica(self._build_list_query(limit, offset, cursor, filters or JobFiltersEntity()))
+        res = await self.session.execute(query)
+        return [convert_job_row_to_entity(row) for row in res]
+
+    async def get_all_versions(
+            self,
+            limit: int,
+            offset: int = 0,
+            cursor: CursorEntity | None = None,
+            filters: JobFiltersEntity | None = None,
+    ) -> list[VersionEntity]:
+        # тот же запрос страницы, но без тяжёлых колонок: хватает для проверки ETag
+        query = on_replica(self._build_list_query(
+            limit, offset, cursor, filters or JobFiltersEntity(), columns=(Job.id, Job.updated_at),
+        ))
+        res = await self.session.execute(query)
+        return [VersionEntity(id=row.id, updated_at=row.updated_at) for row in res]
+
+    async def stream_all(self, filters: JobFiltersEntity, batch_size: int) -> AsyncIterator[list[JobEntity]]:
+        # серверный курсор: в памяти держится не больше одной пачки строк
+        query = on_replica(self._build_list_query(None, 0, None, filters)).execution_options(yield_per=batch_size)
+        res = await self.session.stream(query)
+        async for rows in res.partitions():
+            yield [convert_job_row_to_entity(row) for row in rows]
+
+    async def search(
+            self, search_query: str, limit: int, cursor: CursorEntity | None = None
+    ) -> list[tuple[JobEntity, float]]:
+        ts_query = func.websearch_to_tsquery(JOB_SEARCH_CONFIG, search_query)
+        rank = func.ts_rank_cd(Job.search_vector, ts_query)
+        query = on_replica(select(*JOB_ENTITY_COLUMNS, rank).where(
+            Job.search_vector.bool_op("@@")(ts_query)
+        ).order_by(rank.desc(), Job.id.desc()).limit(limit))
+        if cursor:
+            query = query.where(tuple_(rank, Job.id) < (cursor.value, cursor.id))
+        res = await self.session.execute(query)
+        return [(convert_job_row_to_entity(row[:-1]), row[-1]) for row in res]
 
     async def add(self, job_in: JobEntity) -> Job:
         new_job = convert_job_entity_to_dto(job_in)
-        async with self.session as session:
-            session.add(new_job)
-            await session.commit()
-            await session.refresh(new_job)
+        self.session.add(new_job)
+        await self.session.flush()
         return new_job
 
-    async def delete(self, job_id: str) -> None:
-        query = delete(Job).where(Job.id == job_id)
-        async with self.session as session:
-            await session.execute(query)
-            await session.commit()
+    async def add_many(self, jobs_in: list[JobEntity]) -> int:
+        if not jobs_in:
+            return 0
+        # executemany с insertmanyvalues отправляет пачки многострочных INSERT ... VALUES
+        await self.session.execute(insert(Job), [asdict(job) for job in jobs_in])
+        return len(jobs_in)
+
+    async def get_existing_ids(self, job_ids: list[str]) -> set[str]:
+        res = await self.session.scalars(select(Job.id).where(Job.id.in_(job_ids)))
+        return set(res.all())
+
+    async def exists(self, job_id: str) -> bool:
+        return await self.session.scalar(select(exists().where(Job.id == job_id)))
+
+    async def delete(self, job_id: str, user_id: str) -> int:
+        query = delete(Job).where(Job.id == job_id, Job.user_id == user_id).returning(Job.id)
+        res = await self.session.execute(query)
+        return len(res.scalars().all())
+
+    async def get_stats_by_user_id(self, user_id: str, since: datetime | None = None) -> list[JobStatsEntity]:
+        # итоги берутся из счётчиков вакансии, к откликам присоединяются только новые — по индексу (job_id, created_at)
+        columns = (Job.id, Job.title, Job.is_active, Job.created_at, Job.responses_count, Job.last_response_at)
+        if since is None:
+            query = select(*columns)
+        else:
+            query = select(*columns, func.count(Response.id)).outerjoin(
+                Response, and_(Response.job_id == Job.id, Response.created_at > since)
+            ).group_by(Job.id)
+        query = query.where(Job.user_id == user_id).order_by(Job.created_at.desc(), Job.id.desc())
+        res = await self.session.execute(on_replica(query))
+        return [JobStatsEntity(*row) for row in res]
 
+    async def reconcile_response_counters(self) -> int:
+        # правит только разошедшиеся строки, поэтому повторный запуск ничего не меняет
+        responses_count = select(func.count()).where(Response.job_id == Job.id).scalar_subquery()
+        last_response_at = select(func.max(Response.created_at)).where(Response.job_id == Job.id).scalar_subquery()
+        query = update(Job).where(or_(
+            Job.responses_count != responses_count,
+            Job.last_response_at.is_distinct_from(last_response_at),
+        )).values(
+            responses_count=responses_count,
+            last_response_at=last_response_at,
+        ).returning(Job.id).execution_options(synchronize_session=False)
+        res = await self.session.scalars(query)
+        return len(res.all())
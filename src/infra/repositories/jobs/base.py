@@ -1,4 +1,8 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
+
+from domain.entities.jobs import JobFiltersEntity
+from domain.entities.pagination import CursorEntity
 
 
 class BaseJobRepository(ABC):
@@ -7,7 +11,35 @@ class BaseJobRepository(ABC):
         ...
 
     @abstractmethod
-    async def get_all(self, limit: int, offset: int):
+    async def get_version(self, job_id: str):
+        ...
+
+    @abstractmethod
+    async def get_all_versions(
+            self,
+            limit: int,
+            offset: int = 0,
+            cursor: CursorEntity | None = None,
+            filters: JobFiltersEntity | None = None,
+    ):
+        ...
+
+    @abstractmethod
+    async def get_all(
+            self,
+            limit: int,
+            offset: int = 0,
+            cursor: CursorEntity | None = None,
+            filters: JobFiltersEntity | None = None,
+    ):
+        ...
+
+    @abstractmethod
+    def stream_all(self, filters: JobFiltersEntity, batch_size: int):
+        ...
+
+    @abstractmethod
+    async def search(self, search_query: str, limit: int, cursor: CursorEntity | None = None):
         ...
 
     @abstractmethod
@@ -15,5 +47,25 @@ class BaseJobRepository(ABC):
         ...
 
     @abstractmethod
-    async def delete(self, job_id: str):
+    async def add_many(self, jobs_in: list) -> int:
+        ...
+
+    @abstractmethod
+    async def get_existing_ids(self, job_ids: list[str]) -> set[str]:
+        ...
+
+    @abstractmethod
+    async def exists(self, job_id: str) -> bool:
+        ...
+
+    @abstractmethod
+    async def delete(self, job_id: str, user_id: str) -> int:
+        ...
+
+    @abstractmethod
+    async def get_stats_by_user_id(self, user_id: str, since: datetime | None = None) -> list:
+        ...
+
+    @abstractmethod
+    async def reconcile_response_counters(self) -> int:
         ...
@@ -1,3 +1,5 @@
+from typing import Sequence
+
 from domain.entities.jobs import JobEntity
 from infra.repositories.alchemy_models.jobs import Job as JobDTO
 
@@ -12,3 +14,37 @@ def convert_job_entity_to_dto(job: JobEntity) -> JobDTO:
         is_active=job.is_active,
         user_id=job.user_id,
     )
+
+
+# колонки в порядке convert_job_row_to_entity, чтобы читать списки без ORM-объектов
+JOB_ENTITY_COLUMNS = (
+    JobDTO.id,
+    JobDTO.created_at,
+    JobDTO.updated_at,
+    JobDTO.title,
+    JobDTO.description,
+    JobDTO.salary_from,
+    JobDTO.salary_to,
+    JobDTO.is_active,
+    JobDTO.user_id,
+    JobDTO.responses_count,
+    JobDTO.last_response_at,
+)
+
+
+def convert_job_row_to_entity(row: Sequence) -> JobEntity:
+    (job_id, created_at, updated_at, title, description, salary_from, salary_to, is_active, user_id,
+     responses_count, last_response_at) = row
+    return JobEntity(
+        id=job_id,
+        created_at=created_at,
+        updated_at=updated_at,
+        title=title,
+        description=description,
+        salary_from=salary_from,
+        salary_to=salary_to,
+        is_active=is_active,
+        user_id=user_id,
+        responses_count=responses_count,
+        last_response_at=last_response_at,
+    )
@@ -1,77 +1,169 @@
-from sqlalchemy import select, delete
+from dataclasses import asdict
+
+from sqlalchemy import Insert, Select, select, delete, exists, func, or_, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import joinedload
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError, NoResultFound
 
-from domain.entities.responses import ResponseEntity
+from domain.entities.pagination import CursorEntity
+from domain.entities.responses import (ResponseEntity, ResponseAggregateJobEntity, ResponseAggregateUserEntity,
+                                       ResponseFiltersEntity)
 from infra.exceptions.base import RepositoryException
-from infra.exceptions.responses import ResponseNotFoundDBException
+from infra.exceptions.responses import ResponseAlreadyExistsDBException, ResponseNotFoundDBException
 from infra.repositories.alchemy_models.jobs import Job
 from infra.repositories.alchemy_models.responses import Response
+from infra.repositories.alchemy_models.users import User
 from infra.repositories.responses.base import BaseResponseRepository
-from infra.repositories.responses.converters import convert_response_entity_to_dto
+from infra.repositories.responses.converters import (RESPONSE_AGGREGATE_JOB_COLUMNS, RESPONSE_AGGREGATE_USER_COLUMNS,
+                                                     convert_response_job_row_to_entity,
+                                                     convert_response_user_row_to_entity)
+from infra.repositories.session import on_replica
 
 
 class AlchemyResponseRepository(BaseResponseRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
 
+    @staticmethod
+    def _insert_skipping_duplicates(responses_in: list[ResponseEntity]) -> Insert:
+        # владелец вакансии подставляется в той же вставке; для несуществующей вакансии получится NULL,
+        # и вставка упадёт на NOT NULL, как раньше падала на внешнем ключе
+        rows = [
+            {**asdict(response), "company_id": select(Job.user_id).where(Job.id == response.job_id).scalar_subquery()}
+            for response in responses_in
+        ]
+        # повторный отклик не роняет транзакцию, а просто не попадает в RETURNING
+        return pg_insert(Response).values(rows).on_conflict_do_nothing(
+            index_elements=[Response.user_id, Response.job_id],
+        ).returning(Response)
+
+    async def _increment_job_counters(self, response_ids: list[str]) -> None:
+        # счётчики меняются в той же транзакции, что и вставка: строка вакансии блокируется до коммита,
+        # поэтому параллельные отклики не теряют инкременты
+        inserted = select(
+            Response.job_id,
+            func.count().label("count"),
+            func.max(Response.created_at).label("last_at"),
+        ).where(Response.id.in_(response_ids)).group_by(Response.job_id).subquery()
+        await self.session.execute(
+            update(Job).where(Job.id == inserted.c.job_id).values(
+                responses_count=Job.responses_count + inserted.c.count,
+                last_response_at=func.greatest(Job.last_response_at, inserted.c.last_at),
+            ).execution_options(synchronize_session=False)
+        )
+
     async def add(self, response_in: ResponseEntity) -> Response:
-        new_response = convert_response_entity_to_dto(response_in)
-        async with self.session as session:
-            try:
-                session.add(new_response)
-                await session.commit()
-            except IntegrityError:
-                raise RepositoryException
+        try:
+            res = await self.session.scalars(self._insert_skipping_duplicates([response_in]))
+        except IntegrityError:
+            raise RepositoryException
+        new_response = res.one_or_none()
+        if new_response is None:
+            raise ResponseAlreadyExistsDBException(job_id=response_in.job_id)
+        await self._increment_job_counters([new_response.id])
         return new_response
 
+    async def add_many(self, responses_in: list[ResponseEntity]) -> list[Response]:
+        if not responses_in:
+            return []
+        try:
+            res = await self.session.scalars(self._insert_skipping_duplicates(responses_in))
+        except IntegrityError:
+            raise RepositoryException
+        new_responses = res.all()
+        if new_responses:
+            await self._increment_job_counters([response.id for response in new_responses])
+        return new_responses
+
     async def get_one_by_id(self, response_id: str) -> Response:
-        query = select(Response).where(Response.id == response_id)
-        async with self.session as session:
-            try:
-                res = await session.execute(query)
-                response = res.scalar_one()
-            except NoResultFound:
-                raise ResponseNotFoundDBException(response_id=response_id)
+        query = on_replica(select(Response).where(Response.id == response_id))
+        try:
+            res = await self.session.execute(query)
+            response = res.scalar_one()
+        except NoResultFound:
+            raise ResponseNotFoundDBException(response_id=response_id)
         return response
 
     async def get_one_by_id_join_job(self, response_id: str) -> Response:
         query = select(Response).where(Response.id == response_id).options(joinedload(Response.job))
-        async with self.session as session:
-            try:
-                res = await session.execute(query)
-                response = res.scalar_one()
-            except NoResultFound:
-                raise ResponseNotFoundDBException(response_id=response_id)
+        try:
+            res = await self.session.execute(query)
+            response = res.scalar_one()
+        except NoResultFound:
+            raise ResponseNotFoundDBException(response_id=response_id)
         return response
 
-    async def get_list_by_user_id(self, user_id: str) -> list[Response]:
-        query = select(Response).where(Response.user_id == user_id).options(
-                joinedload(Response.job)
-            )
-        async with self.session as session:
-            res = await session.execute(query)
-        return res.scalars().all()
+    @staticmethod
+    def _paginate(
+            query: Select, limit: int, cursor: CursorEntity | None, filters: ResponseFiltersEntity | None
+    ) -> Select:
+        if filters and filters.created_from is not None:
+            query = query.where(Response.created_at >= filters.created_from)
+        if filters and filters.created_to is not None:
+            query = query.where(Response.created_at <= filters.created_to)
+        if cursor:
+            query = query.where(tuple_(Response.created_at, Response.id) < (cursor.value, cursor.id))
+        return on_replica(query.order_by(Response.created_at.desc(), Response.id.desc()).limit(limit))
 
-    async def get_list_by_company_user_id(self, user_id: str) -> list[Response]:
-        query = select(Response).join(Job).filter(Job.user_id == user_id).options(
-                joinedload(Response.user)
-            )
-        async with self.session as session:
-            res = await session.execute(query)
-        return res.scalars().all()
+    async def get_list_by_user_id(
+            self,
+            user_id: str,
+            limit: int,
+            cursor: CursorEntity | None = None,
+            filters: ResponseFiltersEntity | None = None,
+    ) -> list[ResponseAggregateJobEntity]:
+        query = select(*RESPONSE_AGGREGATE_JOB_COLUMNS).join(Job, Job.id == Response.job_id).where(
+            Response.user_id == user_id
+        )
+        res = await self.session.execute(self._paginate(query, limit, cursor, filters))
+        return [convert_response_job_row_to_entity(row) for row in res]
+
+    async def get_list_by_company_user_id(
+            self,
+            user_id: str,
+            limit: int,
+            cursor: CursorEntity | None = None,
+            filters: ResponseFiltersEntity | None = None,
+    ) -> list[ResponseAggregateUserEntity]:
+        query = select(*RESPONSE_AGGREGATE_USER_COLUMNS).join(User, User.id == Response.user_id).where(
+            Response.company_id == user_id
+        )
+        res = await self.session.execute(self._paginate(query, limit, cursor, filters))
+        return [convert_response_user_row_to_entity(row) for row in res]
+
+    async def get_list_by_job_id(
+            self,
+            job_id: str,
+            limit: int,
+            cursor: CursorEntity | None = None,
+            filters: ResponseFiltersEntity | None = None,
+    ) -> list[ResponseAggregateUserEntity]:
+        query = select(*RESPONSE_AGGREGATE_USER_COLUMNS).join(User, User.id == Response.user_id).where(
+            Response.job_id == job_id
+        )
+        res = await self.session.execute(self._paginate(query, limit, cursor, filters))
+        return [convert_response_user_row_to_entity(row) for row in res]
+
+    async def exists(self, response_id: str) -> bool:
+        return await self.session.scalar(select(exists().where(Response.id == response_id)))
 
-    async def get_list_by_job_id(self, job_id: str) -> list[Response]:
-        query = select(Response).where(Response.job_id == job_id).options(
-                joinedload(Response.user)
+    async def delete(self, response_id: str, user_id: str) -> int:
+        # удалить может автор отклика или компания-владелец вакансии
+        query = delete(Response).where(
+            Response.id == response_id,
+            or_(Response.user_id == user_id, Response.company_id == user_id),
+        ).returning(Response.job_id)
+        job_ids = (await self.session.scalars(query)).all()
+        if job_ids:
+            # время последнего отклика пересчитывается по индексу (job_id, created_at)
+            last_response_at = select(func.max(Response.created_at)).where(
+                Response.job_id == Job.id
+            ).scalar_subquery()
+            await self.session.execute(
+                update(Job).where(Job.id == job_ids[0]).values(
+                    responses_count=Job.responses_count - len(job_ids),
+                    last_response_at=last_response_at,
+                ).execution_options(synchronize_session=False)
             )
-        async with self.session as session:
-            res = await session.execute(query)
-        return res.scalars().all()
-
-    async def delete(self, response_id: str) -> None:
-        query = delete(Response).where(Response.id == response_id)
-        async with self.session as session:
-            await session.execute(query)
-            await session.commit()
+        return len(job_ids)
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
-from domain.entities.responses import ResponseEntity
+from domain.entities.pagination import CursorEntity
+from domain.entities.responses import ResponseEntity, ResponseFiltersEntity
 
 
 class BaseResponseRepository(ABC):
@@ -9,6 +10,10 @@ class BaseResponseRepository(ABC):
     async def add(self, response_in: ResponseEntity):
         ...
 
+    @abstractmethod
+    async def add_many(self, responses_in: list[ResponseEntity]):
+        ...
+
     @abstractmethod
     async def get_one_by_id(self, response_id: str):
         ...
@@ -18,17 +23,39 @@ class BaseResponseRepository(ABC):
         ...
 
     @abstractmethod
-    async def get_list_by_user_id(self, user_id: str):
+    async def get_list_by_user_id(
+            self,
+            user_id: str,
+            limit: int,
+            cursor: CursorEntity | None = None,
+            filters: ResponseFiltersEntity | None = None,
+    ):
+        ...
+
+    @abstractmethod
+    async def get_list_by_job_id(
+            self,
+            job_id: str,
+            limit: int,
+            cursor: CursorEntity | None = None,
+            filters: ResponseFiltersEntity | None = None,
+    ):
         ...
 
     @abstractmethod
-    async def get_list_by_job_id(self, job_id: str):
+    async def get_list_by_company_user_id(
+            self,
+            user_id: str,
+            limit: int,
+            cursor: CursorEntity | None = None,
+            filters: ResponseFiltersEntity | None = None,
+    ):
         ...
 
     @abstractmethod
-    async def get_list_by_company_user_id(self, user_id: str):
+    async def exists(self, response_id: str) -> bool:
         ...
 
     @abstractmethod
-    async def delete(self, response_id: str):
+    async def delete(self, response_id: str, user_id: str) -> int:
         ...
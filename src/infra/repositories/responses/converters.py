@@ -1,5 +1,9 @@
-from domain.entities.responses import ResponseEntity
+from typing import Sequence
+
+from domain.entities.responses import ResponseEntity, ResponseAggregateJobEntity, ResponseAggregateUserEntity
 from infra.repositories.alchemy_models.responses import Response as ResponseDTO
+from infra.repositories.jobs.converters import JOB_ENTITY_COLUMNS, convert_job_row_to_entity
+from infra.repositories.users.converters import USER_ENTITY_COLUMNS, convert_user_row_to_entity
 
 
 def convert_response_entity_to_dto(response: ResponseEntity) -> ResponseDTO:
@@ -9,3 +13,42 @@ def convert_response_entity_to_dto(response: ResponseEntity) -> ResponseDTO:
         job_id=response.job_id,
         user_id=response.user_id,
     )
+
+
+# колонки отклика, за ними в строке идут колонки вакансии или пользователя
+RESPONSE_ENTITY_COLUMNS = (
+    ResponseDTO.id,
+    ResponseDTO.created_at,
+    ResponseDTO.updated_at,
+    ResponseDTO.message,
+    ResponseDTO.user_id,
+    ResponseDTO.job_id,
+)
+RESPONSE_AGGREGATE_JOB_COLUMNS = RESPONSE_ENTITY_COLUMNS + JOB_ENTITY_COLUMNS
+RESPONSE_AGGREGATE_USER_COLUMNS = RESPONSE_ENTITY_COLUMNS + USER_ENTITY_COLUMNS
+
+
+def convert_response_job_row_to_entity(row: Sequence) -> ResponseAggregateJobEntity:
+    response_id, created_at, updated_at, message, user_id, job_id = row[:len(RESPONSE_ENTITY_COLUMNS)]
+    return ResponseAggregateJobEntity(
+        id=response_id,
+        created_at=created_at,
+        updated_at=updated_at,
+        message=message,
+        user_id=user_id,
+        job_id=job_id,
+        job=convert_job_row_to_entity(row[len(RESPONSE_ENTITY_COLUMNS):]),
+    )
+
+
+def convert_response_user_row_to_entity(row: Sequence) -> ResponseAggregateUserEntity:
+    response_id, created_at, updated_at, message, user_id, job_id = row[:len(RESPONSE_ENTITY_COLUMNS)]
+    return ResponseAggregateUserEntity(
+        id=response_id,
+        created_at=created_at,
+        updated_at=updated_at,
+        message=message,
+        user_id=user_id,
+        job_id=job_id,
+        user=convert_user_row_to_entity(row[len(RESPONSE_ENTITY_COLUMNS):]),
+    )
@@ -1,19 +1,173 @@
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+import random
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable
 
-from core.config import settings
+from sqlalchemy import Executable
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.util.queue import AsyncAdaptedQueue, Empty
 
-engine = create_async_engine(
-    settings.db.db_url,
-    echo=True
-)
+from core.config import DbSettings, settings
+from domain.entities.monitoring import PoolStatsEntity
+from infra.exceptions.base import NoUnitOfWorkException
+from infra.repositories.instrumentation import instrument_engine
+
+
+@dataclass
+class PoolWaitStats:
+    count: int = 0
+    seconds_total: float = 0.0
+    seconds_max: float = 0.0
+    timeouts: int = 0
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.seconds_total += seconds
+        self.seconds_max = max(self.seconds_max, seconds)
+
+
+class ObservableQueue(AsyncAdaptedQueue):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def get(self, block: bool = True, timeout: float | None = None):
+        # ожиданием считается только блокирующее чтение из пустой очереди:
+        # свободное соединение или новое соединение сверх pool_size выдаются сразу
+        if not block or not self.empty():
+            return super().get(block, timeout)
+        started = time.perf_counter()
+        try:
+            return super().get(block, timeout)
+        except Empty:
+            self.wait_stats.timeouts += 1
+            raise
+        finally:
+            self.wait_stats.observe(time.perf_counter() - started)
+
+
+class ObservableQueuePool(AsyncAdaptedQueuePool):
+    _queue_class = ObservableQueue
+
+    @property
+    def wait_stats(self) -> PoolWaitStats:
+        return self._pool.wait_stats
+
+
+# запросы, помеченные этой опцией, можно выполнять на реплике
+READ_REPLICA_OPTION = "use_read_replica"
+
+
+def on_replica(query: Executable) -> Executable:
+    return query.execution_options(**{READ_REPLICA_OPTION: True})
+
+
+class RoutingSession(Session):
+    def __init__(self, *args, replicas: list[AsyncEngine] | tuple = (), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+
+    def get_bind(self, mapper=None, *, clause=None, **kwargs):
+        if (
+                self.replicas
+                and not self._flushing
+                and clause is not None
+                and clause.get_execution_options().get(READ_REPLICA_OPTION)
+        ):
+            return random.choice(self.replicas).sync_engine
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+def build_engine(db_settings: DbSettings, db_url: str | None = None) -> AsyncEngine:
+    target_engine = create_async_engine(
+        db_url or db_settings.db_url,
+        echo=db_settings.echo,
+        poolclass=ObservableQueuePool,
+        pool_size=db_settings.pool_size,
+        max_overflow=db_settings.max_overflow,
+        pool_timeout=db_settings.pool_timeout,
+        pool_recycle=db_settings.pool_recycle,
+        pool_pre_ping=db_settings.pool_pre_ping,
+        connect_args={
+            "prepared_statement_cache_size": db_settings.statement_cache_size,
+            "statement_cache_size": db_settings.statement_cache_size,
+        },
+    )
+    instrument_engine(target_engine)
+    return target_engine
+
+
+engine = build_engine(settings.db)
+replica_engines = [build_engine(settings.db, db_url) for db_url in settings.db.replica_urls]
 
 session_factory = async_sessionmaker(
     bind=engine,
+    sync_session_class=RoutingSession,
+    replicas=replica_engines,
     autoflush=False,
     autocommit=False,
     expire_on_commit=False,
 )
 
 
-def get_session():
-    return session_factory()
+# сессия текущей единицы работы (обычно одного HTTP-запроса)
+_current_session: ContextVar[AsyncSession | None] = ContextVar("current_session", default=None)
+
+
+def get_session() -> AsyncSession:
+    session = _current_session.get()
+    if session is None:
+        raise NoUnitOfWorkException()
+    return session
+
+
+AFTER_COMMIT_KEY = "after_commit"
+
+
+def after_commit(callback: Callable[[], Awaitable[None]]) -> None:
+    # сброс кэшей до коммита даёт параллельному запросу перечитать старые строки и закэшировать их заново
+    callbacks = get_session().info.setdefault(AFTER_COMMIT_KEY, [])
+    if callback not in callbacks:
+        callbacks.append(callback)
+
+
+@asynccontextmanager
+async def unit_of_work() -> AsyncIterator[AsyncSession]:
+    session = session_factory()
+    token = _current_session.set(session)
+    try:
+        yield session
+        await session.commit()
+    except BaseException:
+        await session.rollback()
+        raise
+    finally:
+        _current_session.reset(token)
+        await session.close()
+    for callback in session.info.pop(AFTER_COMMIT_KEY, []):
+        await callback()
+
+
+def get_pool_stats(name: str, target_engine: AsyncEngine) -> PoolStatsEntity:
+    pool: ObservableQueuePool = target_engine.pool
+    return PoolStatsEntity(
+        name=name,
+        size=pool.size(),
+        checked_in=pool.checkedin(),
+        checked_out=pool.checkedout(),
+        overflow=max(pool.overflow(), 0),
+        waits=pool.wait_stats.count,
+        wait_seconds_total=pool.wait_stats.seconds_total,
+        wait_seconds_max=pool.wait_stats.seconds_max,
+        timeouts=pool.wait_stats.timeouts,
+    )
+
+
+def get_all_pool_stats() -> list[PoolStatsEntity]:
+    return [get_pool_stats("primary", engine)] + [
+        get_pool_stats(f"replica-{number}", replica_engine) for number, replica_engine in enumerate(replica_engines)
+    ]
@@ -1,12 +1,20 @@
-from sqlalchemy import select, update
+from datetime import datetime
+
+from sqlalchemy import Select, select, update, tuple_
 from sqlalchemy.exc import IntegrityError, NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from domain.entities.pagination import CursorEntity
 from domain.entities.users import UserEntity
+from domain.entities.versions import VersionEntity
 from infra.exceptions.users import UserAlreadyExistsDBException, UserNotFoundDBException
 from infra.repositories.alchemy_models.users import User
 from infra.repositories.users.base import BaseUserRepository
-from infra.repositories.users.converters import convert_user_entity_to_dto
+from infra.repositories.users.converters import USER_ENTITY_COLUMNS, convert_user_entity_to_dto, convert_user_row_to_entity
+from infra.repositories.session import on_replica
+
+# id и created_at — ключ keyset-пагинации, при обновлении они не меняются
+NOT_UPDATABLE_FIELDS = ("id", "created_at", "updated_at")
 
 
 class AlchemyUserRepository(BaseUserRepository):
@@ -15,49 +23,58 @@ class AlchemyUserRepository(BaseUserRepository):
 
     async def get_one_by_id(self, user_id: str) -> User:
         query = select(User).where(User.id == user_id).limit(1)
-        async with self.session as session:
-            try:
-                res = await session.execute(query)
-                user = res.scalar_one()
-            except NoResultFound:
-                raise UserNotFoundDBException(user_id=user_id)
+        try:
+            res = await self.session.execute(query)
+            user = res.scalar_one()
+        except NoResultFound:
+            raise UserNotFoundDBException(user_id=user_id)
         return user
 
     async def get_one_by_email(self, email: str) -> User:
         query = select(User).where(User.email == email).limit(1)
-        async with self.session as session:
-            try:
-                res = await session.execute(query)
-                user = res.scalar_one()
-            except NoResultFound:
-                raise UserNotFoundDBException(user_email=email)
+        try:
+            res = await self.session.execute(query)
+            user = res.scalar_one()
+        except NoResultFound:
+            raise UserNotFoundDBException(user_email=email)
         return user
 
-    async def get_all(self, limit: int, offset: int) -> list[User]:
-        query = select(User).limit(limit).offset(offset)
-        async with self.session as session:
-            res = await session.execute(query)
-        return res.scalars().all()
+    @staticmethod
+    def _build_list_query(limit: int, offset: int, cursor: CursorEntity | None, columns: tuple) -> Select:
+        query = select(*columns).order_by(User.created_at.desc(), User.id.desc()).limit(limit)
+        if cursor:
+            return query.where(tuple_(User.created_at, User.id) < (cursor.value, cursor.id))
+        return query.offset(offset)
+
+    async def get_all(self, limit: int, offset: int = 0, cursor: CursorEntity | None = None) -> list[UserEntity]:
+        query = on_replica(self._build_list_query(limit, offset, cursor, USER_ENTITY_COLUMNS))
+        res = await self.session.execute(query)
+        return [convert_user_row_to_entity(row) for row in res]
+
+    async def get_all_versions(
+            self, limit: int, offset: int = 0, cursor: CursorEntity | None = None
+    ) -> list[VersionEntity]:
+        query = on_replica(self._build_list_query(limit, offset, cursor, (User.id, User.updated_at)))
+        res = await self.session.execute(query)
+        return [VersionEntity(id=row.id, updated_at=row.updated_at) for row in res]
 
     async def add(self, user_in: UserEntity) -> User:
         new_user = convert_user_entity_to_dto(user_in)
-        async with self.session as session:
-            try:
-                session.add(new_user)
-                await session.commit()
-                await session.refresh(new_user)
-            except IntegrityError:
-                raise UserAlreadyExistsDBException(user_email=user_in.email)
+        try:
+            self.session.add(new_user)
+            await self.session.flush()
+        except IntegrityError:
+            raise UserAlreadyExistsDBException(user_email=user_in.email)
         return new_user
 
     async def update(self, user_in: UserEntity) -> User:
-        async with self.session as session:
-            query = update(User).where(User.id == user_in.id).values(
-                **user_in.to_not_nullable_values_dict()
-            ).returning(User)
-            try:
-                res = await session.execute(query)
-                await session.commit()
-            except IntegrityError:
-                raise UserAlreadyExistsDBException(user_email=user_in.email)
+        values = {
+            key: value for key, value in user_in.to_not_nullable_values_dict().items()
+            if key not in NOT_UPDATABLE_FIELDS
+        }
+        query = update(User).where(User.id == user_in.id).values(**values, updated_at=datetime.now()).returning(User)
+        try:
+            res = await self.session.execute(query)
+        except IntegrityError:
+            raise UserAlreadyExistsDBException(user_email=user_in.email)
         return res.scalars().first()
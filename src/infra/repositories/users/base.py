@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 
+from domain.entities.pagination import CursorEntity
+
 
 class BaseUserRepository(ABC):
     @abstractmethod
@@ -7,7 +9,11 @@ class BaseUserRepository(ABC):
         ...
 
     @abstractmethod
-    async def get_all(self, limit: int, offset: int):
+    async def get_all(self, limit: int, offset: int = 0, cursor: CursorEntity | None = None):
+        ...
+
+    @abstractmethod
+    async def get_all_versions(self, limit: int, offset: int = 0, cursor: CursorEntity | None = None):
         ...
 
     @abstractmethod
@@ -18,6 +24,6 @@ class BaseUserRepository(ABC):
     async def update(self, user_in):
         ...
 
-    @abstractmeth
+    @abstractmethod
     async def get_one_by_email(self, email: str):
         ...
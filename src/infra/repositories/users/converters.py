@@ -1,3 +1,5 @@
+from typing import Sequence
+
 from domain.entities.users import UserEntity
 from infra.repositories.alchemy_models.users import User as UserDTO
 
@@ -10,3 +12,26 @@ def convert_user_entity_to_dto(user: UserEntity) -> UserDTO:
         hashed_password=user.hashed_password,
         is_company=user.is_company,
     )
+
+
+# колонки в порядке convert_user_row_to_entity, пароль в списки не попадает
+USER_ENTITY_COLUMNS = (
+    UserDTO.id,
+    UserDTO.created_at,
+    UserDTO.updated_at,
+    UserDTO.email,
+    UserDTO.name,
+    UserDTO.is_company,
+)
+
+
+def convert_user_row_to_entity(row: Sequence) -> UserEntity:
+    user_id, created_at, updated_at, email, name, is_company = row
+    return UserEntity(
+        id=user_id,
+        created_at=created_at,
+        updated_at=updated_at,
+        email=email,
+        name=name,
+        is_company=is_company,
+    )
@@ -1,4 +1,4 @@
-from src.logic.exceptions.base import ServiceException
+from logic.exceptions.base import ServiceException
 
 
 class InvalidTokenException(ServiceException):
@@ -21,3 +21,9 @@ class WrongCredentialsException(ServiceException):
     @property
     def message(self):
         return f"Неверные имя пользователя или пароль!"
+
+
+class PasswordHashingOverloadedException(ServiceException):
+    @property
+    def message(self):
+        return "Сервис проверки паролей перегружен, повторите попытку позже"
@@ -17,3 +17,9 @@ class OnlyJobOwnerCanDeleteJobException(ServiceException):
     @property
     def message(self):
         return f"Удалять вакансию может только компания, разместившая вакансии!"
+
+
+class OnlyCompanyCanGetJobStatsException(ServiceException):
+    @property
+    def message(self):
+        return f"Статистика по вакансиям доступна только компании"
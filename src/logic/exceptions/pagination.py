@@ -0,0 +1,7 @@
+from logic.exceptions.base import ServiceException
+
+
+class InvalidCursorException(ServiceException):
+    @property
+    def message(self):
+        return "Невалидный курсор пагинации!"
@@ -8,3 +8,9 @@ class UpdateOtherUserException(ServiceException):
     @property
     def message(self):
         return f"Невозможно изменить чужого пользователя с email {self.user_email}!"
+
+
+class PrincipalClaimsChangeException(ServiceException):
+    @property
+    def message(self):
+        return "Email и тип пользователя зашиты в выданные токены и не меняются, пока они действуют!"
@@ -9,12 +9,14 @@ from domain.entities.users import UserEntity
 from infra.repositories.users.base import BaseUserRepository
 from logic.exceptions.auth import InvalidTokenException, InvalidTokenTypeException, WrongCredentialsException
 from logic.utils import auth as auth_utils
-from logic.utils.auth import validate_token_type, verify_password
+from logic.utils.auth import validate_token_type
+from logic.utils.password_hasher import PasswordHasher
 
 
 class JWTAuthService:
-    def __init__(self, user_repository: BaseUserRepository):
+    def __init__(self, user_repository: BaseUserRepository, password_hasher: PasswordHasher):
         self.user_repository = user_repository
+        self.password_hasher = password_hasher
 
     @staticmethod
     def create_jwt(
@@ -35,9 +37,13 @@ class JWTAuthService:
         jwt_payload = TokenPayloadEntity(
             sub=user.email,
         )
+        if settings.auth_jwt.embed_principal_claims:
+            jwt_payload.user_id = user.id
+            jwt_payload.is_company = user.is_company
+        token_data = {key: value for key, value in asdict(jwt_payload).items() if value is not None}
         return self.create_jwt(
             token_type=settings.auth_jwt.access_token_name,
-            token_data=asdict(jwt_payload),
+            token_data=token_data,
             expire_minutes=settings.auth_jwt.access_token_expire_minutes,
         )
 
@@ -59,22 +65,24 @@ class JWTAuthService:
             raise InvalidTokenException
         if not validate_token_type(payload, token_type):
             raise InvalidTokenTypeException(token_type)
-        if not (email := payload["sub"]):
+        if not (email := payload.get("sub")):
             raise InvalidTokenException
         return TokenPayloadEntity(
             sub=email,
             iat=payload["iat"],
+            user_id=payload.get("user_id"),
+            is_company=payload.get("is_company"),
         )
 
     async def login_user(self, email: str, password: str):
 
         user = await self.user_repository.get_one_by_email(email=email)
 
-        if not verify_password(password, user.hashed_password):
+        if not await self.password_hasher.verify(password, user.hashed_password):
             raise WrongCredentialsException
 
         return TokenEntity(
             access_token=self.create_access_token(user=user.to_entity()),
-            refresh_token=self.create_refresh_token(),
+            refresh_token=self.create_refresh_token(user=user.to_entity()),
             token_type="Bearer"
         )
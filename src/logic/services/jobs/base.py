@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 
-from domain.entities.users import UserEntity
+from domain.entities.jobs import JobFiltersEntity
+from domain.entities.auth import PrincipalEntity
 
 
 class BaseJobService(ABC):
@@ -9,13 +11,49 @@ class BaseJobService(ABC):
         ...
 
     @abstractmethod
-    async def get_job_list(self, limit: int, offset: int):
+    async def get_job_version(self, job_id: str):
         ...
 
     @abstractmethod
-    async def create_job(self, job_in, auth_user: UserEntity):
+    async def get_job_list_versions(
+            self,
+            limit: int,
+            offset: int = 0,
+            cursor: str | None = None,
+            filters: JobFiltersEntity | None = None,
+    ):
         ...
 
     @abstractmethod
-    async def delete_job(self, job_id: str, user: UserEntity) -> None:
+    async def get_job_list(
+            self,
+            limit: int,
+            offset: int = 0,
+            cursor: str | None = None,
+            filters: JobFiltersEntity | None = None,
+    ):
+        ...
+
+    @abstractmethod
+    def export_jobs(self, filters: JobFiltersEntity, batch_size: int):
+        ...
+
+    @abstractmethod
+    async def search_jobs(self, search_query: str, limit: int, cursor: str | None = None):
+        ...
+
+    @abstractmethod
+    async def create_job(self, job_in, auth_user: PrincipalEntity):
+        ...
+
+    @abstractmethod
+    async def create_jobs(self, jobs_in: list, auth_user: PrincipalEntity) -> int:
+        ...
+
+    @abstractmethod
+    async def delete_job(self, job_id: str, user: PrincipalEntity) -> None:
+        ...
+
+    @abstractmethod
+    async def get_company_job_stats(self, auth_user: PrincipalEntity, since: datetime | None = None) -> list:
         ...
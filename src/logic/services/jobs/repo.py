@@ -1,35 +1,143 @@
-from domain.entities.jobs import JobEntity
-from domain.entities.users import UserEntity
-from infra.exceptions.base import RepositoryException
-from infra.repositories.alchemy_models.jobs import Job as JobDTO
+from datetime import datetime
+from typing import AsyncIterator
+
+from domain.entities.jobs import JobEntity, JobFiltersEntity, JobSortEnum, JobStatsEntity
+from domain.entities.pagination import CursorEntity, PageEntity
+from domain.entities.versions import PageVersionsEntity, VersionEntity
+from domain.entities.auth import PrincipalEntity
+from infra.cache.base import BaseCache
+from infra.exceptions.jobs import JobNotFoundDBException
 from infra.repositories.jobs.base import BaseJobRepository
+from infra.repositories.session import after_commit
 from logic.exceptions.jobs import (OnlyCompanyCanCreateJobException, OnlyCompanyCanDeleteJobException,
-                                   OnlyJobOwnerCanDeleteJobException)
+                                   OnlyCompanyCanGetJobStatsException, OnlyJobOwnerCanDeleteJobException)
 from logic.services.jobs.base import BaseJobService
+from logic.utils.pagination import build_page, decode_cursor, encode_cursor, page_versions
+
+
+def _decode_list_cursor(cursor: str | None, filters: JobFiltersEntity) -> CursorEntity | None:
+    if not cursor:
+        return None
+    return decode_cursor(cursor, value_type=float if filters.sort == JobSortEnum.HIGHEST_SALARY else datetime)
+
+
+def _list_key(limit: int, filters: JobFiltersEntity) -> str:
+    return f"jobs:list:{limit}:{filters!r}"
 
 
 class RepositoryJobService(BaseJobService):
-    def __init__(self, repository: BaseJobRepository):
+    def __init__(self, repository: BaseJobRepository, list_cache: BaseCache | None = None):
         self.repository = repository
+        self.list_cache = list_cache
 
     async def get_job_by_id(self, job_id: str):
         job = await self.repository.get_one_by_id(job_id=job_id)
         return job.to_entity()
 
-    async def get_job_list(self, limit: int, offset: int) -> list[JobEntity]:
-        job_list: list[JobDTO] = await self.repository.get_all(limit=limit, offset=offset)
-        return [job.to_entity() for job in job_list]
+    async def get_job_version(self, job_id: str) -> VersionEntity:
+        return await self.repository.get_version(job_id=job_id)
+
+    async def get_job_list(
+            self,
+            limit: int,
+            offset: int = 0,
+            cursor: str | None = None,
+            filters: JobFiltersEntity | None = None,
+    ) -> PageEntity[JobEntity]:
+        filters = filters or JobFiltersEntity()
+        # кэшируем только первые страницы: на них приходится почти всё чтение
+        cacheable = self.list_cache is not None and cursor is None and offset == 0
+        if cacheable:
+            cached_page: PageEntity[JobEntity] | None = await self.list_cache.get(_list_key(limit, filters))
+            if cached_page is not None:
+                return cached_page
+
+        if filters.sort == JobSortEnum.HIGHEST_SALARY:
+            cursor_key = lambda job: job.salary_to
+        else:
+            cursor_key = lambda job: job.created_at
+        job_list: list[JobEntity] = await self.repository.get_all(
+            limit=limit + 1,
+            offset=offset,
+            cursor=_decode_list_cursor(cursor, filters),
+            filters=filters,
+        )
+        page = build_page(job_list, limit=limit, key=cursor_key)
+        if cacheable:
+            await self.list_cache.set(_list_key(limit, filters), page)
+        return page
+
+    async def get_job_list_versions(
+            self,
+            limit: int,
+            offset: int = 0,
+            cursor: str | None = None,
+            filters: JobFiltersEntity | None = None,
+    ) -> PageVersionsEntity:
+        filters = filters or JobFiltersEntity()
+        # пока первая страница лежит в кэше, отдаётся именно она: версии берём оттуда же
+        if self.list_cache is not None and cursor is None and offset == 0:
+            cached_page: PageEntity[JobEntity] | None = await self.list_cache.get(_list_key(limit, filters))
+            if cached_page is not None:
+                return page_versions(cached_page)
+
+        # limit + 1, как и у страницы: появление следующей страницы тоже меняет ответ
+        versions = await self.repository.get_all_versions(
+            limit=limit + 1,
+            offset=offset,
+            cursor=_decode_list_cursor(cursor, filters),
+            filters=filters,
+        )
+        return PageVersionsEntity(items=versions[:limit], has_next=len(versions) > limit)
 
-    async def create_job(self, job_in: JobEntity, auth_user: UserEntity):
+    async def export_jobs(self, filters: JobFiltersEntity, batch_size: int) -> AsyncIterator[list[JobEntity]]:
+        async for jobs in self.repository.stream_all(filters=filters, batch_size=batch_size):
+            yield jobs
+
+    async def search_jobs(self, search_query: str, limit: int, cursor: str | None = None) -> PageEntity[JobEntity]:
+        rows = await self.repository.search(
+            search_query=search_query,
+            limit=limit + 1,
+            cursor=decode_cursor(cursor, value_type=float) if cursor else None,
+        )
+        page = PageEntity(items=[job for job, _ in rows[:limit]])
+        if len(rows) > limit:
+            last_job, last_rank = rows[limit - 1]
+            page.next_cursor = encode_cursor(last_rank, last_job.id)
+        return page
+
+    async def create_job(self, job_in: JobEntity, auth_user: PrincipalEntity):
         if not auth_user.is_company:
             raise OnlyCompanyCanCreateJobException
         new_job = await self.repository.add(job_in=job_in)
+        self._invalidate_list_cache()
         return new_job.to_entity()
 
-    async def delete_job(self, job_id: str, user: UserEntity) -> None:
+    async def create_jobs(self, jobs_in: list[JobEntity], auth_user: PrincipalEntity) -> int:
+        if not auth_user.is_company:
+            raise OnlyCompanyCanCreateJobException
+        created = await self.repository.add_many(jobs_in=jobs_in)
+        if created:
+            self._invalidate_list_cache()
+        return created
+
+    async def delete_job(self, job_id: str, user: PrincipalEntity) -> None:
         if not user.is_company:
             raise OnlyCompanyCanDeleteJobException
-        job_to_delete: JobDTO = await self.repository.get_one_by_id(job_id=job_id)
-        if job_to_delete.user_id != user.id:
+        deleted = await self.repository.delete(job_id=job_id, user_id=user.id)
+        if not deleted:
+            if not await self.repository.exists(job_id=job_id):
+                raise JobNotFoundDBException(job_id=job_id)
             raise OnlyJobOwnerCanDeleteJobException
-        await self.repository.delete(job_id=job_id)
+        self._invalidate_list_cache()
+
+    async def get_company_job_stats(
+            self, auth_user: PrincipalEntity, since: datetime | None = None
+    ) -> list[JobStatsEntity]:
+        if not auth_user.is_company:
+            raise OnlyCompanyCanGetJobStatsException
+        return await self.repository.get_stats_by_user_id(user_id=auth_user.id, since=since)
+
+    def _invalidate_list_cache(self) -> None:
+        if self.list_cache is not None:
+            after_commit(self.list_cache.clear)
@@ -1,23 +1,40 @@
 from abc import ABC, abstractmethod
 
-from domain.entities.responses import ResponseEntity
-from domain.entities.users import UserEntity
+from domain.entities.responses import ResponseEntity, ResponseFiltersEntity
+from domain.entities.auth import PrincipalEntity
 
 
 class BaseResponseService(ABC):
 
     @abstractmethod
-    async def make_response(self, response_in: ResponseEntity, user: UserEntity):
+    async def make_response(self, response_in: ResponseEntity, user: PrincipalEntity):
         ...
 
     @abstractmethod
-    async def get_user_response_list(self, user: UserEntity):
+    async def make_responses(self, responses_in: list[ResponseEntity], user: PrincipalEntity):
         ...
 
     @abstractmethod
-    async def get_job_response_list(self, job_id: str, user: UserEntity):
+    async def get_user_response_list(
+            self,
+            user: PrincipalEntity,
+            limit: int,
+            cursor: str | None = None,
+            filters: ResponseFiltersEntity | None = None,
+    ):
         ...
 
     @abstractmethod
-    async def delete_response(self, response_id: str, user: UserEntity):
+    async def get_job_response_list(
+            self,
+            job_id: str,
+            user: PrincipalEntity,
+            limit: int,
+            cursor: str | None = None,
+            filters: ResponseFiltersEntity | None = None,
+    ):
+        ...
+
+    @abstractmethod
+    async def delete_response(self, response_id: str, user: PrincipalEntity):
         ...
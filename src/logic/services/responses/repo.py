@@ -1,44 +1,107 @@
-from domain.entities.responses import ResponseEntity, ResponseAggregateJobEntity, ResponseAggregateUserEntity
-from domain.entities.users import UserEntity
-from infra.repositories.alchemy_models.responses import Response
+from domain.entities.pagination import PageEntity
+from domain.entities.responses import (ResponseEntity, ResponseAggregateJobEntity, ResponseAggregateUserEntity,
+                                       ResponseBatchResultEntity, ResponseFiltersEntity)
+from domain.entities.auth import PrincipalEntity
+from infra.cache.base import BaseCache
+from infra.exceptions.responses import ResponseNotFoundDBException
 from infra.repositories.jobs.base import BaseJobRepository
 from infra.repositories.responses.base import BaseResponseRepository
+from infra.repositories.session import after_commit
 from logic.exceptions.responses import OnlyNotCompanyUsersCanMakeResponsesException, ResponseDeleteLogicException, \
     OnlyCompanyCanGetJobResponses, OnlyJobOwnerCanGetJobResponsesException
 from logic.services.responses.base import BaseResponseService
+from logic.utils.pagination import build_page, decode_cursor
 
 
 class RepositoryResponseService(BaseResponseService):
-    def __init__(self, repository: BaseResponseRepository, job_repository: BaseJobRepository):
+    def __init__(
+            self,
+            repository: BaseResponseRepository,
+            job_repository: BaseJobRepository,
+            job_list_cache: BaseCache | None = None,
+    ):
         self.repository = repository
         self.job_repository = job_repository
+        self.job_list_cache = job_list_cache
 
-    async def make_response(self, response_in: ResponseEntity, user: UserEntity) -> ResponseEntity:
+    async def make_response(self, response_in: ResponseEntity, user: PrincipalEntity) -> ResponseEntity:
         if user.is_company:
             raise OnlyNotCompanyUsersCanMakeResponsesException
         new_response = await self.repository.add(response_in=response_in)
+        self._invalidate_job_list_cache()
         return new_response.to_entity()
 
+    async def make_responses(
+            self, responses_in: list[ResponseEntity], user: PrincipalEntity
+    ) -> ResponseBatchResultEntity:
+        if user.is_company:
+            raise OnlyNotCompanyUsersCanMakeResponsesException
+        # повторы вакансии внутри запроса схлопываем до первого отклика
+        unique_responses: dict[str, ResponseEntity] = {}
+        for response in responses_in:
+            unique_responses.setdefault(response.job_id, response)
+        responses_in = list(unique_responses.values())
+        job_ids = list(unique_responses)
+        existing_job_ids = await self.job_repository.get_existing_ids(job_ids=job_ids)
+        created = await self.repository.add_many(
+            responses_in=[response for response in responses_in if response.job_id in existing_job_ids],
+        )
+        if created:
+            self._invalidate_job_list_cache()
+        created_job_ids = {response.job_id for response in created}
+        return ResponseBatchResultEntity(
+            created=[response.to_entity() for response in created],
+            duplicate_job_ids=[
+                job_id for job_id in job_ids if job_id in existing_job_ids and job_id not in created_job_ids
+            ],
+            missing_job_ids=[job_id for job_id in job_ids if job_id not in existing_job_ids],
+        )
+
     async def get_user_response_list(
-            self, user: UserEntity
-    ) -> list[ResponseAggregateJobEntity] | list[ResponseAggregateUserEntity]:
+            self,
+            user: PrincipalEntity,
+            limit: int,
+            cursor: str | None = None,
+            filters: ResponseFiltersEntity | None = None,
+    ) -> PageEntity[ResponseAggregateJobEntity] | PageEntity[ResponseAggregateUserEntity]:
+        decoded_cursor = decode_cursor(cursor) if cursor else None
         if user.is_company:
-            response_list: list[Response] = await self.repository.get_list_by_company_user_id(user_id=user.id)
-            return [response.to_aggregate_user_entity() for response in response_list]
-        response_list: list[Response] = await self.repository.get_list_by_user_id(user_id=user.id)
-        return [response.to_aggregate_job_entity() for response in response_list]
+            response_list: list[ResponseAggregateUserEntity] = await self.repository.get_list_by_company_user_id(
+                user_id=user.id, limit=limit + 1, cursor=decoded_cursor, filters=filters,
+            )
+            return build_page(response_list, limit=limit)
+        response_list: list[ResponseAggregateJobEntity] = await self.repository.get_list_by_user_id(
+            user_id=user.id, limit=limit + 1, cursor=decoded_cursor, filters=filters,
+        )
+        return build_page(response_list, limit=limit)
 
-    async def get_job_response_list(self, job_id: str, user: UserEntity) -> list[ResponseEntity]:
+    async def get_job_response_list(
+            self,
+            job_id: str,
+            user: PrincipalEntity,
+            limit: int,
+            cursor: str | None = None,
+            filters: ResponseFiltersEntity | None = None,
+    ) -> PageEntity[ResponseAggregateUserEntity]:
         if not user.is_company:
             raise OnlyCompanyCanGetJobResponses
         job = await self.job_repository.get_one_by_id(job_id=job_id)
         if job.user_id != user.id:
             raise OnlyJobOwnerCanGetJobResponsesException
-        response_list = await self.repository.get_list_by_job_id(job_id=job_id)
-        return [response.to_aggregate_user_entity() for response in response_list]
+        response_list = await self.repository.get_list_by_job_id(
+            job_id=job_id, limit=limit + 1, cursor=decode_cursor(cursor) if cursor else None, filters=filters,
+        )
+        return build_page(response_list, limit=limit)
 
-    async def delete_response(self, response_id, user: UserEntity) -> None:
-        response_to_delete: Response = await self.repository.get_one_by_id_join_job(response_id=response_id)
-        if response_to_delete.job.user_id != user.id and response_to_delete.user_id != user.id:
+    async def delete_response(self, response_id, user: PrincipalEntity) -> None:
+        deleted = await self.repository.delete(response_id=response_id, user_id=user.id)
+        if not deleted:
+            if not await self.repository.exists(response_id=response_id):
+                raise ResponseNotFoundDBException(response_id=response_id)
             raise ResponseDeleteLogicException
-        return await self.repository.delete(response_id=response_id)
+        self._invalidate_job_list_cache()
+
+    def _invalidate_job_list_cache(self) -> None:
+        # кэшированные страницы вакансий содержат счётчики откликов
+        if self.job_list_cache is not None:
+            after_commit(self.job_list_cache.clear)
@@ -1,12 +1,20 @@
 from abc import abstractmethod, ABC
 
+from domain.entities.pagination import PageEntity
 from domain.entities.users import UserEntity
+from domain.entities.versions import PageVersionsEntity
 
 
 class BaseUserService(ABC):
 
     @abstractmethod
-    async def get_user_list(self, limit: int, offset: int) -> list[UserEntity]:
+    async def get_user_list(self, limit: int, offset: int = 0, cursor: str | None = None) -> PageEntity[UserEntity]:
+        ...
+
+    @abstractmethod
+    async def get_user_list_versions(
+            self, limit: int, offset: int = 0, cursor: str | None = None
+    ) -> PageVersionsEntity:
         ...
 
     @abstractmethod
@@ -1,36 +1,116 @@
+from dataclasses import replace
+from functools import partial
+
+from domain.entities.pagination import PageEntity
 from domain.entities.users import UserEntity
+from domain.entities.versions import PageVersionsEntity
+from infra.cache.base import BaseCache
 from logic.services.users.base import BaseUserService
-from logic.utils.auth import hash_password
-from logic.exceptions.users import UpdateOtherUserException
+from logic.utils.password_hasher import PasswordHasher
+from logic.utils.pagination import build_page, decode_cursor, page_versions
+from logic.exceptions.users import PrincipalClaimsChangeException, UpdateOtherUserException
 from infra.repositories.alchemy_models.users import User as UserDTO
+from infra.repositories.session import after_commit
 from infra.repositories.users.base import BaseUserRepository
 
 
+def _email_key(email: str) -> str:
+    return f"principal:email:{email}"
+
+
+def _list_key(limit: int) -> str:
+    return f"users:list:{limit}"
+
+
 class RepositoryUserService(BaseUserService):
-    def __init__(self, repository: BaseUserRepository):
+    def __init__(
+            self,
+            repository: BaseUserRepository,
+            password_hasher: PasswordHasher,
+            principal_cache: BaseCache | None = None,
+            list_cache: BaseCache | None = None,
+            principal_claims_in_token: bool = False,
+    ):
         self.repository = repository
+        self.password_hasher = password_hasher
+        self.principal_cache = principal_cache
+        self.list_cache = list_cache
+        self.principal_claims_in_token = principal_claims_in_token
 
-    async def get_user_list(self, limit: int, offset: int) -> list[UserEntity]:
-        user_list: list[UserDTO] = await self.repository.get_all(limit=limit, offset=offset)
-        return [user.to_entity() for user in user_list]
+    async def get_user_list(self, limit: int, offset: int = 0, cursor: str | None = None) -> PageEntity[UserEntity]:
+        cacheable = self.list_cache is not None and cursor is None and offset == 0
+        if cacheable:
+            cached_page: PageEntity[UserEntity] | None = await self.list_cache.get(_list_key(limit))
+            if cached_page is not None:
+                return cached_page
+
+        user_list: list[UserEntity] = await self.repository.get_all(
+            limit=limit + 1,
+            offset=offset,
+            cursor=decode_cursor(cursor) if cursor else None,
+        )
+        page = build_page(user_list, limit=limit)
+        if cacheable:
+            await self.list_cache.set(_list_key(limit), page)
+        return page
+
+    async def get_user_list_versions(
+            self, limit: int, offset: int = 0, cursor: str | None = None
+    ) -> PageVersionsEntity:
+        # пока первая страница лежит в кэше, отдаётся именно она: версии берём оттуда же
+        if self.list_cache is not None and cursor is None and offset == 0:
+            cached_page: PageEntity[UserEntity] | None = await self.list_cache.get(_list_key(limit))
+            if cached_page is not None:
+                return page_versions(cached_page)
+
+        versions = await self.repository.get_all_versions(
+            limit=limit + 1,
+            offset=offset,
+            cursor=decode_cursor(cursor) if cursor else None,
+        )
+        return PageVersionsEntity(items=versions[:limit], has_next=len(versions) > limit)
 
     async def get_user_by_email(self, email: str) -> UserEntity:
-        user = await self.repository.get_one_by_email(email=email)
-        return user.to_entity()
+        if self.principal_cache is None:
+            user = await self.repository.get_one_by_email(email=email)
+            return user.to_entity()
+
+        cached_user: UserEntity | None = await self.principal_cache.get(_email_key(email))
+        if cached_user is not None:
+            return replace(cached_user)
+        user = (await self.repository.get_one_by_email(email=email)).to_entity()
+        await self.principal_cache.set(_email_key(user.email), user)
+        return replace(user)
 
     async def create_user(self, user_in: UserEntity) -> UserEntity:
-        hashed_password = hash_password(user_in.password)
+        hashed_password = await self.password_hasher.hash(user_in.password)
         user_in.hashed_password = hashed_password
         new_user: UserDTO = await self.repository.add(user_in=user_in)
+        self._invalidate_list_cache()
         return new_user.to_entity()
 
     async def update_user(self, user_id: str, auth_user_email: str, user_in: UserEntity) -> UserEntity:
         old_user = await self.repository.get_one_by_id(user_id=user_id)
         if old_user.email != auth_user_email:
             raise UpdateOtherUserException(user_email=old_user.email)
+        # принципал собирается из claims токена без чтения пользователя: смена email или типа
+        # не дошла бы до уже выданных токенов до их истечения
+        if self.principal_claims_in_token and (
+                user_in.email not in (None, old_user.email) or user_in.is_company not in (None, old_user.is_company)
+        ):
+            raise PrincipalClaimsChangeException
 
         user_in.hashed_password = old_user.hashed_password
         user_in.id = user_id
 
         updated_user: UserDTO = await self.repository.update(user_in=user_in)
+        if self.principal_cache is not None:
+            after_commit(partial(
+                self.principal_cache.delete, _email_key(old_user.email), _email_key(updated_user.email),
+            ))
+        self._invalidate_list_cache()
         return updated_user.to_entity()
+
+    def _invalidate_list_cache(self) -> None:
+        if self.list_cache is not None:
+            after_commit(self.list_cache.clear)
@@ -3,9 +3,11 @@ from passlib.context import CryptContext
 from jose import jwt
 
 from core.config import settings
+from core.metrics import counter
 from logic.exceptions.auth import InvalidTokenException
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+JWT_DECODES = counter("jwt_decode_total", "Декодирование JWT по результату", ("result",))
 
 
 def hash_password(password: str) -> str:
@@ -52,8 +54,13 @@ def decode_jwt(
             secret_key,
             algorithms=[algorithm],
         )
+    except jwt.ExpiredSignatureError:
+        JWT_DECODES.inc("expired")
+        raise InvalidTokenException
     except jwt.JWTError:
+        JWT_DECODES.inc("invalid")
         raise InvalidTokenException
+    JWT_DECODES.inc("valid")
     return decoded
 
 
@@ -0,0 +1,52 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Callable
+
+from domain.entities.base import BaseEntity
+from domain.entities.pagination import CursorEntity, PageEntity
+from domain.entities.versions import PageVersionsEntity, VersionEntity
+from logic.exceptions.pagination import InvalidCursorException
+
+
+def encode_cursor(value: datetime | float, entity_id: str) -> str:
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps([value, entity_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, value_type: type[datetime] | type[float] = datetime) -> CursorEntity:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        value, entity_id = json.loads(raw)
+        if value_type is datetime:
+            value = datetime.fromisoformat(value)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            value = float(value)
+        else:
+            raise InvalidCursorException
+        return CursorEntity(value=value, id=str(entity_id))
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise InvalidCursorException
+
+
+def build_page(
+        items: list[BaseEntity],
+        limit: int,
+        key: Callable[[BaseEntity], datetime | float] = lambda entity: entity.created_at,
+) -> PageEntity:
+    # репозиторий запрашивается на limit + 1 запись: лишняя лишь сигнализирует о следующей странице
+    if len(items) <= limit:
+        return PageEntity(items=items)
+    items = items[:limit]
+    last = items[-1]
+    return PageEntity(items=items, next_cursor=encode_cursor(key(last), last.id))
+
+
+def page_versions(page: PageEntity) -> PageVersionsEntity:
+    return PageVersionsEntity(
+        items=[VersionEntity(id=entity.id, updated_at=entity.updated_at) for entity in page.items],
+        has_next=page.next_cursor is not None,
+    )
@@ -0,0 +1,79 @@
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from core.metrics import histogram
+from logic.exceptions.auth import PasswordHashingOverloadedException
+from logic.utils.auth import hash_password, verify_password
+
+# время bcrypt меряется в воркере: при process-пуле сама функция хеширования выполняется в другом процессе
+PASSWORD_HASHING_SECONDS = histogram(
+    "password_hashing_duration_seconds", "Время хеширования и проверки пароля bcrypt", ("operation",),
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 2.0, 5.0),
+)
+PASSWORD_HASHING_WAIT_SECONDS = histogram(
+    "password_hashing_wait_seconds", "Ожидание свободного воркера хеширования", ("operation",),
+)
+
+
+@dataclass
+class OperationStats:
+    count: int = 0
+    run_seconds_total: float = 0.0
+    run_seconds_max: float = 0.0
+    wait_seconds_total: float = 0.0
+
+    def observe(self, run_seconds: float, wait_seconds: float) -> None:
+        self.count += 1
+        self.run_seconds_total += run_seconds
+        self.run_seconds_max = max(self.run_seconds_max, run_seconds)
+        self.wait_seconds_total += wait_seconds
+
+
+def _timed_call(func: Callable, *args) -> tuple[Any, float]:
+    started = time.perf_counter()
+    return func(*args), time.perf_counter() - started
+
+
+class PasswordHasher:
+    def __init__(self, executor: Executor, max_pending: int):
+        self.executor = executor
+        self.max_pending = max_pending
+        self.pending = 0
+        self.stats = {"hash": OperationStats(), "verify": OperationStats()}
+
+    @classmethod
+    def from_settings(cls, executor_type: str, max_workers: int, max_pending: int) -> "PasswordHasher":
+        if executor_type == "process":
+            executor = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password-hasher")
+        return cls(executor=executor, max_pending=max_pending)
+
+    async def _run(self, operation: str, func: Callable, *args) -> Any:
+        if self.pending >= self.max_pending:
+            raise PasswordHashingOverloadedException
+        self.pending += 1
+        submitted = time.perf_counter()
+        try:
+            result, run_seconds = await asyncio.get_running_loop().run_in_executor(
+                self.executor, _timed_call, func, *args
+            )
+        finally:
+            self.pending -= 1
+        wait_seconds = max(time.perf_counter() - submitted - run_seconds, 0.0)
+        self.stats[operation].observe(run_seconds=run_seconds, wait_seconds=wait_seconds)
+        PASSWORD_HASHING_SECONDS.observe(run_seconds, operation)
+        PASSWORD_HASHING_WAIT_SECONDS.observe(wait_seconds, operation)
+        return result
+
+    async def hash(self, password: str) -> str:
+        return await self._run("hash", hash_password, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run("verify", verify_password, password, hashed_password)
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -1,11 +1,39 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from api import router as api_router
+from api.instrumentation import SQLInstrumentationMiddleware, configure_sql_logging
+from api.metrics import MetricsMiddleware, router as metrics_router
+from core.config import settings
+from di import get_container
+from infra.repositories.session import engine
+from logic.utils.password_hasher import PasswordHasher
 import uvicorn
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    # соединения пула привязаны к циклу событий приложения
+    await engine.dispose()
+    get_container().resolve(PasswordHasher).shutdown()
+    # контейнер с остановленным пулом не переиспользуется: следующее приложение соберёт новый
+    get_container.cache_clear()
+
+
 def create_app() -> FastAPI:
-    app = FastAPI()
+    app = FastAPI(lifespan=lifespan)
     app.include_router(router=api_router)
+    if settings.instrumentation.sql_instrumentation_enabled:
+        configure_sql_logging(settings.instrumentation.sql_log_level)
+        app.add_middleware(
+            SQLInstrumentationMiddleware,
+            repeated_statement_threshold=settings.instrumentation.sql_repeated_statement_threshold,
+        )
+    if settings.instrumentation.metrics_enabled:
+        app.include_router(router=metrics_router)
+        app.add_middleware(MetricsMiddleware)
 
     return app
 
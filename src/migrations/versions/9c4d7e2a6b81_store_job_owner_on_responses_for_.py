@@ -0,0 +1,31 @@
+"""Store job owner on responses for company response lists
+
+Revision ID: 9c4d7e2a6b81
+Revises: 4e8b2f6a1c93
+Create Date: 2026-10-18 18:46:37.258203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c4d7e2a6b81'
+down_revision = '4e8b2f6a1c93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # колонка заполняется из вакансий до NOT NULL, иначе существующие отклики не пройдут ограничение
+    op.add_column('responses', sa.Column('company_id', sa.String(), nullable=True, comment='Идентификатор компании-владельца вакансии'))
+    op.execute('UPDATE responses SET company_id = jobs.user_id FROM jobs WHERE jobs.id = responses.job_id')
+    op.alter_column('responses', 'company_id', nullable=False)
+    op.create_index('ix_responses_company_id_created_at_id', 'responses', ['company_id', 'created_at', 'id'], unique=False)
+    op.create_foreign_key('responses_company_id_fkey', 'responses', 'users', ['company_id'], ['id'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('responses_company_id_fkey', 'responses', type_='foreignkey')
+    op.drop_index('ix_responses_company_id_created_at_id', table_name='responses')
+    op.drop_column('responses', 'company_id')
@@ -0,0 +1,29 @@
+"""Add updated_at to timed models
+
+Revision ID: e5b2c8d4f6a1
+Revises: c3f1d7a2b9e4
+Create Date: 2026-10-18 18:10:45.934127
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5b2c8d4f6a1'
+down_revision = 'c3f1d7a2b9e4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # существующие записи считаем изменёнными в момент создания
+    for table_name in ('jobs', 'responses', 'users'):
+        op.add_column(table_name, sa.Column('updated_at', sa.DateTime(), nullable=True, comment='Время последнего изменения записи'))
+        op.execute(f'UPDATE {table_name} SET updated_at = created_at')
+        op.alter_column(table_name, 'updated_at', nullable=False)
+
+
+def downgrade() -> None:
+    for table_name in ('users', 'responses', 'jobs'):
+        op.drop_column(table_name, 'updated_at')
@@ -0,0 +1,35 @@
+import re
+
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, or_, select
+
+from infra.repositories.alchemy_models.jobs import Job
+from infra.repositories.alchemy_models.responses import Response
+from infra.repositories.alchemy_models.users import User
+from infra.repositories.session import engine, unit_of_work
+
+API = "/api/v1"
+PASSWORD = "secret"
+
+
+def register(client: TestClient, name: str, email: str, is_company: bool) -> dict[str, str]:
+    client.post(f"{API}/users", json={
+        "name": name, "email": email, "password": PASSWORD, "password2": PASSWORD, "is_company": is_company,
+    }).raise_for_status()
+    tokens = client.post(f"{API}/auth/login", json={"email": email, "password": PASSWORD}).json()
+    return {"Authorization": f"Bearer {tokens['access_token']}"}
+
+
+def query_count(response) -> int:
+    return int(re.search(r'desc="(\d+) queries"', response.headers["server-timing"]).group(1))
+
+
+async def delete_users(email_suffix: str) -> None:
+    async with unit_of_work() as session:
+        user_ids = select(User.id).where(User.email.endswith(email_suffix))
+        job_ids = select(Job.id).where(Job.user_id.in_(user_ids))
+        await session.execute(delete(Response).where(or_(Response.user_id.in_(user_ids), Response.job_id.in_(job_ids))))
+        await session.execute(delete(Job).where(Job.user_id.in_(user_ids)))
+        await session.execute(delete(User).where(User.id.in_(user_ids)))
+    # пул привязан к циклу событий клиента
+    await engine.dispose()
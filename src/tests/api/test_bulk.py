@@ -0,0 +1,47 @@
+import pytest
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from api.v1.jobs.bulk import NDJSON_MEDIA_TYPE, read_bulk_rows
+
+
+def build_request(chunks: list[bytes], **headers: str) -> Request:
+    raw_headers = [(name.replace("_", "-").lower().encode(), value.encode()) for name, value in headers.items()]
+    messages = [{"type": "http.request", "body": chunk, "more_body": True} for chunk in chunks]
+    messages.append({"type": "http.request", "body": b"", "more_body": False})
+
+    async def receive():
+        return messages.pop(0)
+
+    return Request({"type": "http", "headers": raw_headers}, receive)
+
+
+async def read_all(request: Request, max_bytes: int = 1024) -> list:
+    return [row async for row in read_bulk_rows(request, max_bytes=max_bytes)]
+
+
+@pytest.mark.asyncio
+async def test_ndjson_rows_keep_physical_line_numbers():
+    request = build_request([b'{"a": 1}\n\n{"a"', b': 2}\n  \n{"a": 3}'], content_type=NDJSON_MEDIA_TYPE)
+    assert await read_all(request) == [(1, b'{"a": 1}'), (3, b'{"a": 2}'), (5, b'{"a": 3}')]
+
+
+@pytest.mark.asyncio
+async def test_json_array_rows_numbered_by_position():
+    request = build_request([b'[{"a": 1}, ', b'{"a": 2}]'], content_type="application/json")
+    assert await read_all(request) == [(1, {"a": 1}), (2, {"a": 2})]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("content_type", ("application/json", NDJSON_MEDIA_TYPE))
+async def test_body_limit_checked_before_parsing(content_type):
+    declared = build_request([b"[]"], content_type=content_type, content_length="2048")
+    with pytest.raises(HTTPException) as e:
+        await read_all(declared)
+    assert e.value.status_code == 413
+
+    # без Content-Length тело считается по мере чтения
+    streamed = build_request([b"[" + b" " * 600, b" " * 600 + b"]"], content_type=content_type)
+    with pytest.raises(HTTPException) as e:
+        await read_all(streamed)
+    assert e.value.status_code == 413
@@ -0,0 +1,43 @@
+from datetime import datetime, timezone
+
+from starlette.requests import Request
+
+from api.conditional import is_not_modified, make_etag, validator_headers
+from domain.entities.versions import VersionEntity
+
+UPDATED_AT = datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+
+
+def build_request(**headers: str) -> Request:
+    raw_headers = [(name.replace("_", "-").lower().encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "headers": raw_headers})
+
+
+def test_etag_depends_on_versions_and_extra():
+    versions = [VersionEntity(id="1", updated_at=UPDATED_AT), VersionEntity(id="2", updated_at=UPDATED_AT)]
+    etag = make_etag(versions, True)
+    assert etag == make_etag(list(versions), True)
+    assert etag != make_etag(versions, False)
+    assert etag != make_etag(versions[:1], True)
+    assert etag != make_etag([versions[0], VersionEntity(id="2", updated_at=datetime(2024, 5, 2))], True)
+
+
+def test_if_none_match():
+    etag = make_etag([VersionEntity(id="1", updated_at=UPDATED_AT)])
+    assert is_not_modified(build_request(if_none_match=etag), etag)
+    assert is_not_modified(build_request(if_none_match=f'"other", W/{etag}'), etag)
+    assert is_not_modified(build_request(if_none_match="*"), etag)
+    assert not is_not_modified(build_request(if_none_match='"other"'), etag)
+    # If-None-Match важнее If-Modified-Since
+    last_modified = validator_headers(etag, UPDATED_AT)["Last-Modified"]
+    assert not is_not_modified(build_request(if_none_match='"other"', if_modified_since=last_modified), etag, UPDATED_AT)
+
+
+def test_if_modified_since():
+    etag = make_etag([])
+    last_modified = validator_headers(etag, UPDATED_AT)["Last-Modified"]
+    assert last_modified == "Wed, 01 May 2024 12:30:15 GMT"
+    assert is_not_modified(build_request(if_modified_since=last_modified), etag, UPDATED_AT)
+    assert not is_not_modified(build_request(if_modified_since="Wed, 01 May 2024 12:30:14 GMT"), etag, UPDATED_AT)
+    assert not is_not_modified(build_request(if_modified_since=last_modified), etag, UPDATED_AT, use_modified_since=False)
+    assert not is_not_modified(build_request(if_modified_since="garbage"), etag, UPDATED_AT)
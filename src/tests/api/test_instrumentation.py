@@ -0,0 +1,39 @@
+import json
+
+from api.instrumentation import SQLInstrumentationMiddleware, configure_sql_logging
+from infra.repositories.instrumentation import QueryStats, statement_shape
+
+
+def test_statement_shape_ignores_parameters_and_whitespace():
+    assert statement_shape("SELECT *\n  FROM jobs WHERE id IN ($1, $2, $3)") == "SELECT * FROM jobs WHERE id IN (?)"
+    assert statement_shape("SELECT * FROM jobs WHERE id = $1 AND user_id = $2") == (
+        "SELECT * FROM jobs WHERE id = ? AND user_id = ?"
+    )
+
+
+def test_repeated_shapes():
+    stats = QueryStats()
+    for number in range(6):
+        stats.record(f"SELECT * FROM users WHERE id = ${number + 1}", 0.001)
+    stats.record("SELECT * FROM jobs", 0.002)
+
+    assert stats.count == 7
+    assert stats.repeated_shapes(threshold=5) == {"SELECT * FROM users WHERE id = ?": 6}
+    assert stats.repeated_shapes(threshold=6) == {}
+
+
+def test_summary_logged_at_configured_level(caplog):
+    middleware = SQLInstrumentationMiddleware(app=None, repeated_statement_threshold=5)
+    stats = QueryStats()
+    stats.record("SELECT 1", 0.001)
+    scope = {"method": "GET", "path": "/api/v1/jobs"}
+
+    configure_sql_logging("INFO")
+    middleware._log(scope, 200, stats, 0.002)
+    assert [json.loads(record.message)["queries"] for record in caplog.records] == [1]
+
+    caplog.clear()
+    configure_sql_logging("WARNING")
+    middleware._log(scope, 200, stats, 0.002)
+    assert caplog.records == []
+    configure_sql_logging("INFO")
@@ -0,0 +1,18 @@
+from fastapi.testclient import TestClient
+
+from di import get_container
+from logic.utils.password_hasher import PasswordHasher
+from main import create_app
+from tests.api.fixtures import API
+
+
+def test_shutdown_stops_password_hasher():
+    with TestClient(create_app()):
+        hasher = get_container().resolve(PasswordHasher)
+    assert hasher.executor._shutdown
+
+    # следующее приложение получает новый пул
+    with TestClient(create_app()) as client:
+        response = client.post(f"{API}/auth/login", json={"email": "nobody@lifespan.example", "password": "p"})
+        assert response.status_code != 500
+        assert get_container().resolve(PasswordHasher) is not hasher
@@ -0,0 +1,82 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+
+from infra.repositories.alchemy_models.jobs import Job
+from infra.repositories.alchemy_models.users import User
+from infra.repositories.session import engine, unit_of_work
+from main import create_app
+from tests.api.fixtures import API, delete_users, query_count, register
+
+
+async def touch(model, ids: list[str]) -> None:
+    # изменение в обход сервиса: кэш списка о нём не знает
+    async with unit_of_work() as session:
+        await session.execute(update(model).where(model.id.in_(ids)).values(updated_at=datetime.now()))
+    await engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def api():
+    email_suffix = f".{uuid4().hex[:8]}@etags.example"
+    with TestClient(create_app()) as client:
+        headers = register(client, "company", "company" + email_suffix, True)
+        applicant_headers = register(client, "applicant", "applicant" + email_suffix, False)
+        jobs = [
+            client.post(f"{API}/jobs", headers=headers, json={
+                "title": title, "description": "d", "salary_from": 1, "salary_to": 2, "user_id": "",
+            }).json()
+            for title in ("Первая", "Вторая")
+        ]
+        yield client, jobs[0]["user_id"], applicant_headers
+        client.portal.call(delete_users, email_suffix)
+
+
+@pytest.mark.parametrize("path, model, params", [
+    ("/jobs", Job, {"limit": 1}),
+    ("/users", User, {"limit": 7}),
+])
+def test_cached_first_page_etag_matches_conditional_check(api, path, model, params):
+    client, company_id, _ = api
+    if model is Job:
+        params = {**params, "user_id": company_id}
+    page = client.get(API + path, params=params)
+    etag = page.headers["etag"]
+    client.portal.call(touch, model, [item["id"] for item in page.json()["items"]])
+
+    # пока в кэше лежит та же страница, клиентская копия актуальна
+    assert client.get(API + path, params=params).headers["etag"] == etag
+    not_modified = client.get(API + path, params=params, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+
+
+@pytest.mark.parametrize("path", ("/jobs", "/users"))
+def test_modified_since_alone_skips_versions_query(api, path):
+    client, _, _ = api
+    params = {"limit": 3}
+    last_modified = client.get(API + path, params=params).headers["last-modified"]
+    # первая страница уже в кэше, а 304 по одному If-Modified-Since списки не отдают
+    response = client.get(API + path, params=params, headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 200
+    assert query_count(response) == 0
+
+
+def test_response_writes_refresh_cached_job_counters(api):
+    client, company_id, applicant_headers = api
+    params = {"limit": 5, "user_id": company_id}
+
+    def counters() -> list[int]:
+        return [job["responses_count"] for job in client.get(f"{API}/jobs", params=params).json()["items"]]
+
+    assert counters() == [0, 0]
+    job_id = client.get(f"{API}/jobs", params=params).json()["items"][0]["id"]
+    response = client.post(f"{API}/responses", headers=applicant_headers, json={"message": "m", "job_id": job_id})
+    assert counters() == [1, 0]
+    client.delete(f"{API}/responses", headers=applicant_headers, params={"response_id": response.json()["id"]})
+    assert counters() == [0, 0]
+    client.post(f"{API}/responses/batch", headers=applicant_headers, json=[{"message": "m", "job_id": job_id}])
+    assert counters() == [1, 0]
@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.datetimes import to_local_naive
+from main import create_app
+from tests.api.fixtures import API, delete_users, register
+
+
+@pytest.fixture(scope="module")
+def api():
+    email_suffix = f".{uuid4().hex[:8]}@datetimes.example"
+    with TestClient(create_app()) as client:
+        headers = {
+            "company": register(client, "company", "company" + email_suffix, True),
+            "applicant": register(client, "applicant", "applicant" + email_suffix, False),
+        }
+        job = client.post(f"{API}/jobs", headers=headers["company"], json={
+            "title": "Время", "description": "d", "salary_from": 1, "salary_to": 2, "user_id": "",
+        }).json()
+        client.post(f"{API}/responses", headers=headers["applicant"], json={
+            "message": "m", "job_id": job["id"],
+        }).raise_for_status()
+        yield client, headers
+        client.portal.call(delete_users, email_suffix)
+
+
+def aware(delta: timedelta, offset_hours: int) -> str:
+    return (datetime.now(timezone.utc) + delta).astimezone(timezone(timedelta(hours=offset_hours))).isoformat()
+
+
+def test_to_local_naive():
+    naive = datetime(2024, 1, 1, 12)
+    assert to_local_naive(naive) is naive
+    value = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+    assert to_local_naive(value) == value.astimezone().replace(tzinfo=None)
+
+
+@pytest.mark.parametrize("params, expected", [
+    ({"created_from": aware(-timedelta(hours=1), 0)}, 1),
+    ({"created_from": aware(timedelta(hours=1), 5)}, 0),
+    ({"created_to": aware(timedelta(hours=1), -7)}, 1),
+])
+def test_company_responses_accept_aware_filters(api, params, expected):
+    client, headers = api
+    response = client.get(f"{API}/responses/my_company_responses", headers=headers["company"], params=params)
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == expected
+
+
+@pytest.mark.parametrize("since, expected", [
+    (aware(-timedelta(hours=1), 3), 1),
+    (aware(timedelta(hours=1), -3), 0),
+])
+def test_job_stats_accept_aware_since(api, since, expected):
+    client, headers = api
+    response = client.get(f"{API}/jobs/my/stats", headers=headers["company"], params={"since": since})
+    assert response.status_code == 200
+    assert [stats["new_responses_count"] for stats in response.json()] == [expected]
@@ -0,0 +1,66 @@
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from main import create_app
+from tests.api.fixtures import API, delete_users, query_count, register
+
+
+@pytest.fixture(scope="module")
+def api():
+    email_suffix = f".{uuid4().hex[:8]}@budget.example"
+    with TestClient(create_app()) as client:
+        headers = {}
+        for name, is_company in (("company", True), ("applicant", False)):
+            headers[name] = register(client, name, name + email_suffix, is_company)
+            # первый запрос кладёт пользователя в кэш принципалов, дальше авторизация без запросов в базу
+            client.get(f"{API}/responses/my_responses", headers=headers[name])
+        job = client.post(f"{API}/jobs", headers=headers["company"], json={
+            "title": "Бюджет", "description": "d", "salary_from": 1, "salary_to": 2, "user_id": "",
+        }).json()
+        yield client, headers, job
+        client.portal.call(delete_users, email_suffix)
+
+
+# верхняя граница числа SQL-запросов на запрос к API; рост — повод разобраться, а не поднять число
+@pytest.mark.parametrize("method, path, budget", [
+    ("GET", "/jobs", 1),
+    ("GET", "/jobs/{job_id}", 1),
+    ("GET", "/jobs/search?q=Бюджет", 1),
+    ("GET", "/users", 1),
+    ("GET", "/jobs/my/stats", 1),
+    ("GET", "/responses/my_company_responses", 1),
+    ("GET", "/responses/job_responses?job_id={job_id}", 2),
+])
+def test_read_budgets(api, method, path, budget):
+    client, headers, job = api
+    response = client.request(method, API + path.format(job_id=job["id"]), headers=headers["company"])
+    assert response.is_success
+    assert query_count(response) <= budget
+
+
+def test_write_budgets(api):
+    client, headers, job = api
+    response = client.post(f"{API}/responses", headers=headers["applicant"], json={"message": "m", "job_id": job["id"]})
+    assert response.is_success
+    # вставка отклика и счётчики вакансии
+    assert query_count(response) <= 2
+
+    deleted = client.delete(f"{API}/responses", headers=headers["applicant"], params={"response_id": response.json()["id"]})
+    assert deleted.status_code == 204
+    assert query_count(deleted) <= 2
+
+    batch = client.post(f"{API}/responses/batch", headers=headers["applicant"], json=[
+        {"message": "m", "job_id": job["id"]}, {"message": "m", "job_id": "missing"},
+    ])
+    assert batch.is_success
+    assert query_count(batch) <= 3
+
+    created = client.post(f"{API}/jobs", headers=headers["company"], json={
+        "title": "t", "description": "d", "salary_from": 1, "salary_to": 2, "user_id": "",
+    })
+    assert query_count(created) <= 1
+    deleted = client.delete(f"{API}/jobs", headers=headers["company"], params={"job_id": created.json()["id"]})
+    assert deleted.status_code == 204
+    assert query_count(deleted) <= 1
@@ -0,0 +1,58 @@
+import json
+from datetime import datetime
+
+from api.v1.jobs.schemas import JobPageSchema, job_page_serializer
+from api.v1.responses.schemas import (ResponseAggregateJobPageSchema, ResponseAggregateUserPageSchema,
+                                      response_job_page_serializer, response_user_page_serializer)
+from api.v1.users.schemas import UserPageSchema, user_page_serializer
+from domain.entities.jobs import JobEntity
+from domain.entities.pagination import PageEntity
+from domain.entities.responses import ResponseAggregateJobEntity, ResponseAggregateUserEntity
+from domain.entities.users import UserEntity
+from main import create_app
+
+
+def build_job(number: int) -> JobEntity:
+    return JobEntity(
+        title=f"Вакансия {number}", description="d", salary_from=number, salary_to=100.5, is_active=True, user_id="u",
+    )
+
+
+def build_user(number: int) -> UserEntity:
+    return UserEntity(
+        email=f"user{number}@example.com", name="n", is_company=False, hashed_password="secret-hash",
+        created_at=datetime(2024, 1, number),
+    )
+
+
+def test_job_page_matches_schema():
+    page = PageEntity(items=[build_job(number) for number in range(1, 4)], next_cursor="cursor")
+    assert json.loads(job_page_serializer.to_json(page)) == JobPageSchema.from_entity(page).model_dump(mode="json")
+
+
+def test_user_page_matches_schema_without_secrets():
+    page = PageEntity(items=[build_user(number) for number in range(1, 4)])
+    data = json.loads(user_page_serializer.to_json(page))
+    assert data == UserPageSchema.from_entity(page).model_dump(mode="json")
+    assert "hashed_password" not in data["items"][0]
+
+
+def test_response_pages_match_schema():
+    job_page = PageEntity(items=[
+        ResponseAggregateJobEntity(message="m", user_id="u", job_id=job.id, job=job)
+        for job in (build_job(1), build_job(2))
+    ])
+    user_page = PageEntity(items=[
+        ResponseAggregateUserEntity(message="m", user_id=user.id, job_id="j", user=user)
+        for user in (build_user(1), build_user(2))
+    ])
+    assert json.loads(response_job_page_serializer.to_json(job_page)) == \
+        ResponseAggregateJobPageSchema.from_entity(job_page).model_dump(mode="json")
+    assert json.loads(response_user_page_serializer.to_json(user_page)) == \
+        ResponseAggregateUserPageSchema.from_entity(user_page).model_dump(mode="json")
+
+
+def test_openapi_keeps_response_schema():
+    paths = create_app().openapi()["paths"]
+    response = paths["/api/v1/jobs"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+    assert response == {"$ref": "#/components/schemas/JobPageSchema"}
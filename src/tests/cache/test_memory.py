@@ -0,0 +1,47 @@
+import pytest
+
+from infra.cache.memory import MemoryCache
+
+
+@pytest.mark.asyncio
+async def test_get_counts_hits_and_misses():
+    cache = MemoryCache(max_size=10, ttl_seconds=60)
+    await cache.set("key", "value")
+
+    assert await cache.get("key") == "value"
+    assert await cache.get("missing") is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "hit_ratio": 0.5}
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction():
+    cache = MemoryCache(max_size=2, ttl_seconds=60)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    await cache.get("a")
+    await cache.set("c", 3)
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == 1
+    assert await cache.get("c") == 3
+    assert len(cache) == 2
+
+
+@pytest.mark.asyncio
+async def test_ttl_expiration():
+    cache = MemoryCache(max_size=10, ttl_seconds=0)
+    await cache.set("key", "value")
+
+    assert await cache.get("key") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_delete():
+    cache = MemoryCache(max_size=10, ttl_seconds=60)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    await cache.delete("a", "missing")
+
+    assert await cache.get("a") is None
+    assert await cache.get("b") == 2
@@ -0,0 +1,79 @@
+from datetime import datetime
+
+import pytest
+
+from domain.entities.jobs import JobEntity
+from domain.entities.pagination import PageEntity
+from infra.cache.fake import FakeSharedCacheClient
+from infra.cache.shared import SharedCache
+
+
+def build_cache(client: FakeSharedCacheClient, prefix: str = "test", ttl_seconds: int = 60) -> SharedCache:
+    return SharedCache(client=client, prefix=prefix, ttl_seconds=ttl_seconds, value_type=dict[str, list[int]] | int)
+
+
+@pytest.mark.asyncio
+async def test_get_counts_hits_and_misses():
+    cache = build_cache(FakeSharedCacheClient())
+    await cache.set("key", {"value": [1, 2]})
+
+    assert await cache.get("key") == {"value": [1, 2]}
+    assert await cache.get("missing") is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "hit_ratio": 0.5}
+
+
+@pytest.mark.asyncio
+async def test_ttl_expiration():
+    cache = build_cache(FakeSharedCacheClient(), ttl_seconds=0)
+    await cache.set("key", 1)
+
+    assert await cache.get("key") is None
+
+
+@pytest.mark.asyncio
+async def test_pages_round_trip_through_json():
+    client = FakeSharedCacheClient()
+    cache = SharedCache(client=client, prefix="jobs", ttl_seconds=60, value_type=PageEntity[JobEntity])
+    job = JobEntity(
+        id="1", title="t", description="d", salary_from=1, salary_to=2, is_active=True, user_id="2",
+        created_at=datetime(2024, 5, 1, 12, 30), updated_at=datetime(2024, 5, 2, 8),
+    )
+    page = PageEntity(items=[job], next_cursor="cursor")
+    await cache.set("page", page)
+
+    assert await cache.get("page") == page
+    assert b'"title":"t"' in await client.get("jobs:0:page")
+
+
+@pytest.mark.asyncio
+async def test_clear_bumps_generation_of_own_prefix():
+    client = FakeSharedCacheClient()
+    jobs = build_cache(client, prefix="jobs")
+    users = build_cache(client, prefix="users")
+    await jobs.set("a", 1)
+    await jobs.set("b", 2)
+    await users.set("a", 3)
+    await jobs.clear()
+
+    assert await jobs.get("a") is None
+    assert await jobs.get("b") is None
+    assert await users.get("a") == 3
+    # после сброса кэш снова наполняется в новом поколении
+    await jobs.set("a", 4)
+    assert await jobs.get("a") == 4
+    assert await client.get("jobs:generation") == b"1"
+
+
+@pytest.mark.asyncio
+async def test_instances_share_client():
+    client = FakeSharedCacheClient()
+    await build_cache(client, prefix="jobs").set("a", 1)
+
+    other_worker = build_cache(client, prefix="jobs")
+    assert await other_worker.get("a") == 1
+    await other_worker.delete("a")
+    assert await other_worker.get("a") is None
+
+    await other_worker.set("a", 2)
+    await build_cache(client, prefix="jobs").clear()
+    assert await other_worker.get("a") is None
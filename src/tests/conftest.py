@@ -3,22 +3,22 @@ import asyncio
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from fastapi.testclient import TestClient
-from main import app
+from main import create_app
 import pytest
 import pytest_asyncio
 from unittest.mock import MagicMock
-from infra.repositories.alchemy_settings import SQLALCHEMY_DATABASE_URL
+from core.config import settings
 
 
 @pytest.fixture()
 def client_app():
-    client = TestClient(app)
+    client = TestClient(create_app())
     return client
 
 
 @pytest_asyncio.fixture
 async def sa_session():
-    engine = create_async_engine(SQLALCHEMY_DATABASE_URL) # You must provide your database URL.
+    engine = create_async_engine(settings.db.db_url)
     connection = await engine.connect()
     trans = await connection.begin()
 
@@ -1,20 +1,95 @@
+from argparse import Namespace
+from random import Random
 from uuid import uuid4
 
 import factory
 
 from datetime import datetime
 from factory_boy_extra.async_sqlalchemy_factory import AsyncSQLAlchemyModelFactory
+from sqlalchemy import text
 
+from infra.repositories.alchemy_models.jobs import Job
+from infra.repositories.alchemy_models.responses import Response
 from infra.repositories.alchemy_models.users import User
+from benchmarks.dataset import (JOB_COLUMNS, RESPONSE_COLUMNS, USER_COLUMNS, allocate, generate_job,
+                                generate_responses, generate_users, make_id)
 
 
 class UserFactory(AsyncSQLAlchemyModelFactory):
     class Meta:
         model = User
 
-    id = str(uuid4())
+    id = factory.LazyFunction(lambda: str(uuid4()))
     name = factory.Faker("pystr")
     email = factory.Faker("email")
     hashed_password = factory.Faker("password")
     is_company = factory.Faker("pybool")
     created_at = factory.LazyFunction(datetime.utcnow)
+
+
+class JobFactory(AsyncSQLAlchemyModelFactory):
+    class Meta:
+        model = Job
+
+    id = factory.LazyFunction(lambda: str(uuid4()))
+    title = factory.Faker("job")
+    description = factory.Faker("text")
+    salary_from = factory.Faker("pyfloat", min_value=0, max_value=100000)
+    salary_to = factory.Faker("pyfloat", min_value=100000, max_value=200000)
+    is_active = True
+    created_at = factory.LazyFunction(datetime.utcnow)
+
+
+class ResponseFactory(AsyncSQLAlchemyModelFactory):
+    class Meta:
+        model = Response
+
+    id = factory.LazyFunction(lambda: str(uuid4()))
+    message = factory.Faker("text")
+    created_at = factory.LazyFunction(datetime.utcnow)
+
+
+# данные для проверки планов: на почти пустых таблицах планировщик выбирает что угодно
+DATASET = Namespace(
+    users=5000, companies=100, jobs=5000, responses=30000, skew=1.1, active_share=0.8, seed=20251,
+    start=datetime(2024, 1, 1), end=datetime(2025, 1, 1),
+)
+
+
+async def seed_dataset(connection) -> None:
+    rng = Random(DATASET.seed)
+    jobs, responses = [], []
+    responses_per_job = allocate(DATASET.responses, DATASET.jobs, DATASET.skew, rng)
+    for company, jobs_count in enumerate(allocate(DATASET.jobs, DATASET.companies, DATASET.skew, rng)):
+        for _ in range(jobs_count):
+            job_number = len(jobs)
+            created_at = DATASET.start + (DATASET.end - DATASET.start) * rng.random()
+            job_responses = generate_responses(
+                DATASET, rng, len(responses), job_number, company, created_at, responses_per_job[job_number],
+            )
+            jobs.append(generate_job(DATASET, rng, job_number, company, created_at, job_responses))
+            responses.extend(job_responses)
+
+    # asyncpg-диалект шлёт BEGIN только перед первым запросом, без него COPY ниже закоммитится сразу
+    await connection.execute(text("SELECT 1"))
+    raw_connection = (await connection.get_raw_connection()).driver_connection
+    await raw_connection.copy_records_to_table("users", records=list(generate_users(DATASET, rng)), columns=USER_COLUMNS)
+    await raw_connection.copy_records_to_table("jobs", records=jobs, columns=JOB_COLUMNS)
+    await raw_connection.copy_records_to_table("responses", records=responses, columns=RESPONSE_COLUMNS)
+    # в боевой базе список ожидания GIN разбирает autovacuum, здесь его приходится слить вручную,
+    # иначе планировщик считает индекс по search_vector дороже полного чтения
+    await connection.execute(text("SELECT gin_clean_pending_list('ix_jobs_search_vector')"))
+    # ANALYZE внутри транзакции теста учитывает её же незакоммиченные строки
+    await connection.execute(text("ANALYZE users, jobs, responses"))
+
+
+def user_id(number: int) -> str:
+    return make_id(DATASET.seed, "user", number)
+
+
+def job_id(number: int) -> str:
+    return make_id(DATASET.seed, "job", number)
+
+
+def response_id(number: int) -> str:
+    return make_id(DATASET.seed, "response", number)
@@ -0,0 +1,211 @@
+from datetime import datetime
+from itertools import product
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from domain.entities.jobs import JobEntity, JobFiltersEntity, JobSortEnum
+from domain.entities.pagination import CursorEntity
+from infra.repositories.jobs.alchemy import AlchemyJobRepository
+from tests.repositories.fixtures import JobFactory, ResponseFactory, UserFactory, job_id, seed_dataset
+
+
+@pytest.mark.asyncio
+async def test_search(sa_session):
+    user = UserFactory.build(is_company=True)
+    sa_session.add(user)
+    await sa_session.flush()
+    python_job = JobFactory.build(user_id=user.id, title="Python разработчик", description="Бэкенд на FastAPI")
+    java_job = JobFactory.build(user_id=user.id, title="Java разработчик", description="Знание Python желательно")
+    other_job = JobFactory.build(user_id=user.id, title="Повар", description="Готовить еду")
+    sa_session.add_all([python_job, java_job, other_job])
+    await sa_session.flush()
+
+    repo = AlchemyJobRepository(sa_session)
+    found = await repo.search(search_query="python", limit=10)
+    assert [job.id for job, _ in found] == [python_job.id, java_job.id]
+
+    found = await repo.search(search_query="разработчики", limit=10)
+    assert {job.id for job, _ in found} == {python_job.id, java_job.id}
+
+
+@pytest.mark.asyncio
+async def test_search_cursor(sa_session):
+    user = UserFactory.build(is_company=True)
+    sa_session.add(user)
+    await sa_session.flush()
+    sa_session.add_all(JobFactory.build_batch(3, user_id=user.id, title="Python разработчик"))
+    await sa_session.flush()
+
+    repo = AlchemyJobRepository(sa_session)
+    first_page = await repo.search(search_query="python", limit=2)
+    last_job, last_rank = first_page[-1]
+    second_page = await repo.search(
+        search_query="python", limit=2, cursor=CursorEntity(value=last_rank, id=last_job.id)
+    )
+    assert len(second_page) == 1
+    assert second_page[0][0].id not in {job.id for job, _ in first_page}
+
+
+def expected_list_index(filters: JobFiltersEntity) -> str:
+    # страница — один упорядоченный проход по индексу: равенство из фильтра, затем ключ сортировки
+    sort = "salary_to_id" if filters.sort == JobSortEnum.HIGHEST_SALARY else "created_at_id"
+    if filters.user_id is not None and filters.is_active is not None:
+        return f"ix_jobs_user_id_is_active_{sort}"
+    if filters.user_id is not None:
+        return f"ix_jobs_user_id_{sort}"
+    if filters.is_active is not None:
+        return f"ix_jobs_is_active_{sort}"
+    return f"ix_jobs_{sort}"
+
+
+@pytest.mark.asyncio
+async def test_list_query_plans_use_ordered_indexes(sa_session):
+    connection = await sa_session.connection()
+    await seed_dataset(connection)
+    # самая крупная компания: для неё сортировка всех её вакансий и была бы дорогой
+    res = await connection.exec_driver_sql(
+        "SELECT user_id FROM jobs GROUP BY user_id ORDER BY count(*) DESC LIMIT 1"
+    )
+    largest_company = res.scalar()
+
+    mismatches = []
+    for is_active, salary_from, salary_to, company, sort, with_cursor in product(
+        (None, True, False), (None, 50000.0), (None, 400000.0), (None, largest_company), JobSortEnum, (False, True),
+    ):
+        filters = JobFiltersEntity(
+            is_active=is_active, salary_from=salary_from, salary_to=salary_to, user_id=company, sort=sort,
+        )
+        cursor = None
+        if with_cursor:
+            value = 100000.0 if sort == JobSortEnum.HIGHEST_SALARY else datetime(2024, 6, 1)
+            cursor = CursorEntity(value=value, id=job_id(1))
+        query = AlchemyJobRepository._build_list_query(limit=21, offset=0, cursor=cursor, filters=filters)
+        compiled = query.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+        res = await connection.exec_driver_sql(f"EXPLAIN {compiled}")
+        plan = "\n".join(row[0] for row in res)
+        if f"using {expected_list_index(filters)} on jobs" not in plan or "Sort" in plan:
+            mismatches.append(f"{filters}, cursor={with_cursor}:\n{plan}")
+    assert not mismatches, "\n\n".join(mismatches)
+
+
+@pytest.mark.asyncio
+async def test_delete_checks_owner(sa_session):
+    owner, stranger = UserFactory.build(is_company=True), UserFactory.build(is_company=True)
+    sa_session.add_all([owner, stranger])
+    await sa_session.flush()
+    job = JobFactory.build(user_id=owner.id)
+    sa_session.add(job)
+    await sa_session.flush()
+
+    repo = AlchemyJobRepository(sa_session)
+    assert await repo.delete(job_id=job.id, user_id=stranger.id) == 0
+    assert await repo.exists(job_id=job.id)
+    assert await repo.delete(job_id=job.id, user_id=owner.id) == 1
+    assert not await repo.exists(job_id=job.id)
+
+
+@pytest.mark.asyncio
+async def test_add_many(sa_session):
+    user = UserFactory.build(is_company=True)
+    sa_session.add(user)
+    await sa_session.flush()
+    jobs_in = [
+        JobEntity(title=f"Вакансия {number}", description="d", salary_from=1, salary_to=2, is_active=True, user_id=user.id)
+        for number in range(3)
+    ]
+
+    repo = AlchemyJobRepository(sa_session)
+    assert await repo.add_many(jobs_in=jobs_in) == 3
+    assert await repo.add_many(jobs_in=[]) == 0
+    saved = await repo.get_all(limit=10, filters=JobFiltersEntity(user_id=user.id))
+    assert {job.id for job in saved} == {job.id for job in jobs_in}
+
+
+@pytest.mark.asyncio
+async def test_stream_all(sa_session):
+    user = UserFactory.build(is_company=True)
+    sa_session.add(user)
+    await sa_session.flush()
+    jobs = JobFactory.build_batch(5, user_id=user.id)
+    sa_session.add_all(jobs)
+    await sa_session.flush()
+
+    repo = AlchemyJobRepository(sa_session)
+    batches = [batch async for batch in repo.stream_all(filters=JobFiltersEntity(user_id=user.id), batch_size=2)]
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert {job.id for batch in batches for job in batch} == {job.id for job in jobs}
+
+
+@pytest.mark.asyncio
+async def test_versions_follow_list_query(sa_session):
+    user = UserFactory.build(is_company=True)
+    sa_session.add(user)
+    await sa_session.flush()
+    jobs = JobFactory.build_batch(3, user_id=user.id)
+    sa_session.add_all(jobs)
+    await sa_session.flush()
+
+    repo = AlchemyJobRepository(sa_session)
+    filters = JobFiltersEntity(user_id=user.id)
+    page = await repo.get_all(limit=2, filters=filters)
+    versions = await repo.get_all_versions(limit=2, filters=filters)
+    assert [(job.id, job.updated_at) for job in page] == [(version.id, version.updated_at) for version in versions]
+    assert (await repo.get_version(job_id=jobs[0].id)).updated_at == jobs[0].updated_at
+
+
+@pytest.mark.asyncio
+async def test_reconcile_response_counters(sa_session):
+    company = UserFactory.build(is_company=True)
+    applicants = UserFactory.build_batch(2, is_company=False)
+    sa_session.add_all([company, *applicants])
+    await sa_session.flush()
+    drifted, empty = JobFactory.build_batch(2, user_id=company.id)
+    drifted.responses_count = 5
+    empty.responses_count = 1
+    sa_session.add_all([drifted, empty])
+    await sa_session.flush()
+    sa_session.add_all([
+        ResponseFactory.build(
+            user_id=applicant.id, job_id=drifted.id, company_id=company.id, created_at=datetime(2024, 1, day),
+        )
+        for day, applicant in enumerate(applicants, start=1)
+    ])
+    await sa_session.flush()
+
+    repo = AlchemyJobRepository(sa_session)
+    assert await repo.reconcile_response_counters() == 2
+    assert await repo.reconcile_response_counters() == 0
+    jobs = {job.id: job for job in await repo.get_all(limit=None, filters=JobFiltersEntity(user_id=company.id))}
+    assert (jobs[drifted.id].responses_count, jobs[drifted.id].last_response_at) == (2, datetime(2024, 1, 2))
+    assert (jobs[empty.id].responses_count, jobs[empty.id].last_response_at) == (0, None)
+
+
+@pytest.mark.asyncio
+async def test_get_stats_by_user_id(sa_session):
+    company, other_company = UserFactory.build_batch(2, is_company=True)
+    applicants = UserFactory.build_batch(3, is_company=False)
+    sa_session.add_all([company, other_company, *applicants])
+    await sa_session.flush()
+    popular = JobFactory.build(user_id=company.id, created_at=datetime(2024, 1, 2), responses_count=3,
+                               last_response_at=datetime(2024, 2, 3))
+    quiet = JobFactory.build(user_id=company.id, created_at=datetime(2024, 1, 1))
+    foreign = JobFactory.build(user_id=other_company.id)
+    sa_session.add_all([popular, quiet, foreign])
+    await sa_session.flush()
+    sa_session.add_all([
+        ResponseFactory.build(
+            user_id=applicant.id, job_id=popular.id, company_id=company.id, created_at=datetime(2024, 2, day),
+        )
+        for day, applicant in enumerate(applicants, start=1)
+    ])
+    await sa_session.flush()
+
+    repo = AlchemyJobRepository(sa_session)
+    stats = await repo.get_stats_by_user_id(user_id=company.id, since=datetime(2024, 2, 1, 12))
+    assert [(job.job_id, job.responses_count, job.last_response_at, job.new_responses_count) for job in stats] == [
+        (popular.id, 3, datetime(2024, 2, 3), 2),
+        (quiet.id, 0, None, 0),
+    ]
+    stats = await repo.get_stats_by_user_id(user_id=company.id)
+    assert [job.new_responses_count for job in stats] == [None, None]
@@ -0,0 +1,33 @@
+import asyncio
+
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from core.config import settings
+from infra.repositories.session import build_engine, get_pool_stats
+
+
+@pytest.mark.asyncio
+async def test_pool_counts_only_blocked_checkouts():
+    engine = build_engine(settings.db.model_copy(update={"pool_size": 1, "max_overflow": 0, "pool_timeout": 0.2}))
+    try:
+        for _ in range(3):
+            async with engine.connect():
+                pass
+        assert get_pool_stats("primary", engine).waits == 0
+
+        async with engine.connect():
+            waiter = asyncio.create_task(engine.connect().start())
+            await asyncio.sleep(0.05)
+        await (await waiter).close()
+        stats = get_pool_stats("primary", engine)
+        assert (stats.waits, stats.timeouts) == (1, 0)
+        assert stats.wait_seconds_max >= 0.05
+
+        async with engine.connect():
+            with pytest.raises(PoolTimeoutError):
+                await engine.connect().start()
+        stats = get_pool_stats("primary", engine)
+        assert (stats.waits, stats.timeouts) == (2, 1)
+    finally:
+        await engine.dispose()
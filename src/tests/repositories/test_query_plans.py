@@ -0,0 +1,118 @@
+import json
+from datetime import datetime
+
+import pytest
+from sqlalchemy import event
+
+from domain.entities.jobs import JobEntity, JobFiltersEntity, JobSortEnum
+from domain.entities.pagination import CursorEntity
+from domain.entities.responses import ResponseEntity, ResponseFiltersEntity
+from domain.entities.users import UserEntity
+from infra.repositories.jobs.alchemy import AlchemyJobRepository
+from infra.repositories.responses.alchemy import AlchemyResponseRepository
+from infra.repositories.users.alchemy import AlchemyUserRepository
+from tests.repositories.fixtures import DATASET, job_id, response_id, seed_dataset, user_id
+
+LARGE_TABLES = {"users", "jobs", "responses"}
+
+
+def seq_scans(plan: dict) -> list[str]:
+    found = []
+    if plan["Node Type"] == "Seq Scan" and plan["Relation Name"] in LARGE_TABLES:
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found.extend(seq_scans(child))
+    return found
+
+
+# stream_all и reconcile_response_counters читают таблицы целиком по назначению и здесь не проверяются
+def repository_calls(session) -> list:
+    jobs = AlchemyJobRepository(session)
+    users = AlchemyUserRepository(session)
+    responses = AlchemyResponseRepository(session)
+    company, applicant = user_id(0), user_id(DATASET.companies + 1)
+    since = datetime(2024, 12, 1)
+    return [
+        ("jobs.get_one_by_id", lambda: jobs.get_one_by_id(job_id=job_id(1))),
+        ("jobs.get_version", lambda: jobs.get_version(job_id=job_id(1))),
+        ("jobs.get_all", lambda: jobs.get_all(limit=21)),
+        ("jobs.get_all active", lambda: jobs.get_all(limit=21, filters=JobFiltersEntity(is_active=True))),
+        ("jobs.get_all by company", lambda: jobs.get_all(limit=21, filters=JobFiltersEntity(user_id=company))),
+        ("jobs.get_all by salary", lambda: jobs.get_all(limit=21, filters=JobFiltersEntity(
+            is_active=True, salary_from=300000, sort=JobSortEnum.HIGHEST_SALARY,
+        ))),
+        ("jobs.get_all cursor", lambda: jobs.get_all(
+            limit=21, cursor=CursorEntity(value=datetime(2024, 6, 1), id=job_id(1)),
+        )),
+        ("jobs.get_all_versions", lambda: jobs.get_all_versions(limit=21)),
+        ("jobs.search", lambda: jobs.search(search_query="аналитик", limit=21)),
+        ("jobs.get_existing_ids", lambda: jobs.get_existing_ids(job_ids=[job_id(1), job_id(2)])),
+        ("jobs.exists", lambda: jobs.exists(job_id=job_id(1))),
+        ("jobs.get_stats_by_user_id", lambda: jobs.get_stats_by_user_id(user_id=company, since=since)),
+        ("jobs.add", lambda: jobs.add(job_in=JobEntity(
+            title="t", description="d", salary_from=1, salary_to=2, is_active=True, user_id=company,
+        ))),
+        ("jobs.delete", lambda: jobs.delete(job_id="missing", user_id=company)),
+        ("users.get_one_by_id", lambda: users.get_one_by_id(user_id=applicant)),
+        ("users.get_one_by_email", lambda: users.get_one_by_email(
+            email=f"user{DATASET.companies + 1}.{DATASET.seed}@dataset.example",
+        )),
+        ("users.get_all", lambda: users.get_all(limit=21)),
+        ("users.get_all_versions", lambda: users.get_all_versions(limit=21)),
+        ("users.add", lambda: users.add(user_in=UserEntity(
+            name="n", email="plan@example.com", hashed_password="h", is_company=False,
+        ))),
+        ("responses.add", lambda: responses.add(response_in=ResponseEntity(
+            message="m", user_id=user_id(DATASET.users - 1), job_id=job_id(DATASET.jobs - 1),
+        ))),
+        ("responses.get_one_by_id", lambda: responses.get_one_by_id(response_id=response_id(1))),
+        ("responses.get_one_by_id_join_job", lambda: responses.get_one_by_id_join_job(response_id=response_id(1))),
+        ("responses.get_list_by_user_id", lambda: responses.get_list_by_user_id(user_id=applicant, limit=21)),
+        ("responses.get_list_by_company_user_id", lambda: responses.get_list_by_company_user_id(
+            user_id=company, limit=21,
+        )),
+        ("responses.get_list_by_company_user_id cursor", lambda: responses.get_list_by_company_user_id(
+            user_id=company, limit=21, cursor=CursorEntity(value=since, id=response_id(1)),
+        )),
+        ("responses.get_list_by_company_user_id since", lambda: responses.get_list_by_company_user_id(
+            user_id=company, limit=21, filters=ResponseFiltersEntity(created_from=since),
+        )),
+        ("responses.get_list_by_job_id", lambda: responses.get_list_by_job_id(job_id=job_id(1), limit=21)),
+        ("responses.exists", lambda: responses.exists(response_id=response_id(1))),
+        ("responses.delete", lambda: responses.delete(response_id=response_id(2), user_id=applicant)),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_repository_queries_avoid_seq_scans_on_large_tables(sa_session):
+    connection = await sa_session.connection()
+    await seed_dataset(connection)
+
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and not statement.startswith("EXPLAIN"):
+            statements.append((statement, parameters))
+
+    event.listen(connection.sync_connection, "before_cursor_execute", capture)
+    violations = {}
+    try:
+        for name, call in repository_calls(sa_session):
+            statements.clear()
+            try:
+                await call()
+            except Exception:
+                # ожидаемые ошибки вроде «не найдено» не мешают проверить план
+                pass
+            assert statements, name
+            for statement, parameters in list(statements):
+                res = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+                plan = res.scalar()
+                plan = json.loads(plan) if isinstance(plan, str) else plan
+                tables = seq_scans(plan[0]["Plan"])
+                if tables:
+                    violations.setdefault(name, []).append((tables, statement))
+    finally:
+        event.remove(connection.sync_connection, "before_cursor_execute", capture)
+
+    assert not violations, json.dumps(violations, ensure_ascii=False, indent=2)
@@ -0,0 +1,66 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from core.config import settings
+from infra.exceptions.users import UserNotFoundDBException
+from infra.repositories.alchemy_models.users import User
+from infra.repositories.session import RoutingSession, build_engine
+from infra.repositories.users.alchemy import AlchemyUserRepository
+from tests.repositories.fixtures import UserFactory
+
+pytestmark = pytest.mark.skipif(
+    not settings.db.replica_urls,
+    reason="Нужна вторая база, заданная в REPLICA_URLS",
+)
+
+
+@pytest_asyncio.fixture
+async def replica_only_user():
+    replica_engine = build_engine(settings.db, settings.db.replica_urls[0])
+    user = UserFactory.build()
+    replica_session = async_sessionmaker(bind=replica_engine, expire_on_commit=False)()
+    replica_session.add(user)
+    await replica_session.commit()
+    try:
+        yield user
+    finally:
+        await replica_session.execute(delete(User).where(User.id == user.id))
+        await replica_session.commit()
+        await replica_session.close()
+        await replica_engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def routing_session():
+    primary_engine = build_engine(settings.db)
+    replica_engine = build_engine(settings.db, settings.db.replica_urls[0])
+    session = async_sessionmaker(
+        bind=primary_engine,
+        sync_session_class=RoutingSession,
+        replicas=[replica_engine],
+        expire_on_commit=False,
+    )()
+    try:
+        yield session
+    finally:
+        await session.close()
+        await primary_engine.dispose()
+        await replica_engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_read_only_methods_use_replica(routing_session, replica_only_user):
+    repo = AlchemyUserRepository(routing_session)
+
+    all_users = await repo.get_all(limit=1000)
+    assert replica_only_user.id in {user.id for user in all_users}
+
+
+@pytest.mark.asyncio
+async def test_read_your_own_write_methods_use_primary(routing_session, replica_only_user):
+    repo = AlchemyUserRepository(routing_session)
+
+    with pytest.raises(UserNotFoundDBException):
+        await repo.get_one_by_email(replica_only_user.email)
@@ -0,0 +1,173 @@
+from datetime import datetime
+from functools import partial
+from itertools import product
+
+import pytest
+from sqlalchemy import event, select
+
+from domain.entities.pagination import CursorEntity
+from domain.entities.responses import ResponseEntity, ResponseFiltersEntity
+from infra.exceptions.responses import ResponseAlreadyExistsDBException
+from infra.repositories.alchemy_models.jobs import Job
+from infra.repositories.alchemy_models.responses import Response
+from infra.repositories.responses.alchemy import AlchemyResponseRepository
+from tests.repositories.fixtures import JobFactory, ResponseFactory, UserFactory, response_id, seed_dataset
+
+
+@pytest.mark.asyncio
+async def test_delete_checks_author_or_job_owner(sa_session):
+    company = UserFactory.build(is_company=True)
+    applicant, stranger = UserFactory.build_batch(2, is_company=False)
+    sa_session.add_all([company, applicant, stranger])
+    await sa_session.flush()
+    job = JobFactory.build(user_id=company.id)
+    sa_session.add(job)
+    await sa_session.flush()
+    first = ResponseFactory.build(user_id=applicant.id, job_id=job.id, company_id=company.id)
+    second = ResponseFactory.build(user_id=stranger.id, job_id=job.id, company_id=company.id)
+    sa_session.add_all([first, second])
+    await sa_session.flush()
+
+    repo = AlchemyResponseRepository(sa_session)
+    assert await repo.delete(response_id=first.id, user_id=stranger.id) == 0
+    assert await repo.exists(response_id=first.id)
+    assert await repo.delete(response_id=first.id, user_id=applicant.id) == 1
+    assert await repo.delete(response_id=second.id, user_id=company.id) == 1
+    assert not await repo.exists(response_id=second.id)
+
+
+@pytest.mark.asyncio
+async def test_get_list_by_job_id_paginated(sa_session):
+    company = UserFactory.build(is_company=True)
+    applicants = UserFactory.build_batch(5, is_company=False)
+    sa_session.add_all([company, *applicants])
+    await sa_session.flush()
+    job = JobFactory.build(user_id=company.id)
+    sa_session.add(job)
+    await sa_session.flush()
+    responses = [
+        ResponseFactory.build(
+            user_id=applicant.id, job_id=job.id, company_id=company.id, created_at=datetime(2024, 1, day),
+        )
+        for day, applicant in enumerate(applicants, start=1)
+    ]
+    sa_session.add_all(responses)
+    await sa_session.flush()
+
+    repo = AlchemyResponseRepository(sa_session)
+    first_page = await repo.get_list_by_job_id(job_id=job.id, limit=2)
+    assert [response.id for response in first_page] == [responses[4].id, responses[3].id]
+    last = first_page[-1]
+    second_page = await repo.get_list_by_job_id(
+        job_id=job.id, limit=2, cursor=CursorEntity(value=last.created_at, id=last.id)
+    )
+    assert [response.id for response in second_page] == [responses[2].id, responses[1].id]
+
+    filters = ResponseFiltersEntity(created_from=datetime(2024, 1, 2), created_to=datetime(2024, 1, 3))
+    in_range = await repo.get_list_by_company_user_id(user_id=company.id, limit=10, filters=filters)
+    assert [response.id for response in in_range] == [responses[2].id, responses[1].id]
+    assert in_range[0].user.id == applicants[2].id
+
+
+@pytest.mark.asyncio
+async def test_list_query_plans_use_index_order(sa_session):
+    connection = await sa_session.connection()
+    await seed_dataset(connection)
+
+    async def largest(column: str) -> str:
+        res = await connection.exec_driver_sql(
+            f"SELECT {column} FROM responses GROUP BY {column} ORDER BY count(*) DESC LIMIT 1"
+        )
+        return res.scalar()
+
+    # самые крупные владельцы списков: для них сортировка всех откликов и была бы дорогой
+    company, applicant, job = await largest("company_id"), await largest("user_id"), await largest("job_id")
+    repo = AlchemyResponseRepository(sa_session)
+    # у соискателя откликов единицы, их планировщик вправе досортировать; списки компании и вакансии
+    # бывают огромными и должны читаться упорядоченным проходом по индексу без Sort
+    calls = [
+        ("ix_responses_company_id_created_at_id", True, partial(repo.get_list_by_company_user_id, user_id=company)),
+        ("ix_responses_user_id_created_at_id", False, partial(repo.get_list_by_user_id, user_id=applicant)),
+        ("ix_responses_job_id_created_at_id", True, partial(repo.get_list_by_job_id, job_id=job)),
+    ]
+
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not statement.startswith("EXPLAIN"):
+            statements.append((statement, parameters))
+
+    event.listen(connection.sync_connection, "before_cursor_execute", capture)
+    mismatches = []
+    try:
+        for (index_name, ordered, call), cursor, filters in product(
+            calls,
+            (None, CursorEntity(value=datetime(2024, 9, 1), id=response_id(1))),
+            (None, ResponseFiltersEntity(created_from=datetime(2024, 3, 1), created_to=datetime(2024, 11, 1))),
+        ):
+            statements.clear()
+            await call(limit=21, cursor=cursor, filters=filters)
+            [(statement, parameters)] = statements
+            res = await connection.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+            plan = "\n".join(row[0] for row in res)
+            if index_name not in plan or ordered and (f"using {index_name} on responses" not in plan or "Sort" in plan):
+                mismatches.append(f"{index_name}, cursor={cursor is not None}, filters={filters}:\n{plan}")
+    finally:
+        event.remove(connection.sync_connection, "before_cursor_execute", capture)
+    assert not mismatches, "\n\n".join(mismatches)
+
+
+@pytest.mark.asyncio
+async def test_add_skips_duplicates(sa_session):
+    company, applicant = UserFactory.build(is_company=True), UserFactory.build(is_company=False)
+    sa_session.add_all([company, applicant])
+    await sa_session.flush()
+    jobs = JobFactory.build_batch(3, user_id=company.id)
+    sa_session.add_all(jobs)
+    await sa_session.flush()
+
+    repo = AlchemyResponseRepository(sa_session)
+    first = await repo.add(ResponseEntity(message="m", user_id=applicant.id, job_id=jobs[0].id))
+    assert first.job_id == jobs[0].id
+    with pytest.raises(ResponseAlreadyExistsDBException):
+        await repo.add(ResponseEntity(message="m", user_id=applicant.id, job_id=jobs[0].id))
+
+    created = await repo.add_many([
+        ResponseEntity(message="m", user_id=applicant.id, job_id=job.id) for job in jobs
+    ])
+    assert {response.job_id for response in created} == {jobs[1].id, jobs[2].id}
+
+
+async def _job_counters(session, job_id: str) -> tuple:
+    res = await session.execute(select(Job.responses_count, Job.last_response_at).where(Job.id == job_id))
+    return tuple(res.one())
+
+
+@pytest.mark.asyncio
+async def test_add_and_delete_maintain_job_counters(sa_session):
+    company = UserFactory.build(is_company=True)
+    applicants = UserFactory.build_batch(3, is_company=False)
+    sa_session.add_all([company, *applicants])
+    await sa_session.flush()
+    job = JobFactory.build(user_id=company.id)
+    sa_session.add(job)
+    await sa_session.flush()
+
+    repo = AlchemyResponseRepository(sa_session)
+    first = await repo.add(ResponseEntity(
+        message="m", user_id=applicants[0].id, job_id=job.id, created_at=datetime(2024, 1, 1),
+    ))
+    assert await _job_counters(sa_session, job.id) == (1, datetime(2024, 1, 1))
+
+    # повторный отклик первого кандидата пропускается и не увеличивает счётчик
+    await repo.add_many([
+        ResponseEntity(message="m", user_id=applicant.id, job_id=job.id, created_at=datetime(2024, 1, day))
+        for day, applicant in enumerate(applicants, start=2)
+    ])
+    assert await _job_counters(sa_session, job.id) == (3, datetime(2024, 1, 4))
+
+    last = (await repo.get_list_by_job_id(job_id=job.id, limit=1))[0]
+    assert await repo.delete(response_id=last.id, user_id=company.id) == 1
+    assert await _job_counters(sa_session, job.id) == (2, datetime(2024, 1, 3))
+    assert await repo.delete(response_id=first.id, user_id=applicants[2].id) == 0
+    assert await _job_counters(sa_session, job.id) == (2, datetime(2024, 1, 3))
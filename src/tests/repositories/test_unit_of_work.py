@@ -0,0 +1,107 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete
+
+from domain.entities.users import UserEntity
+from infra.cache.memory import MemoryCache
+from infra.exceptions.base import NoUnitOfWorkException
+from infra.exceptions.users import UserNotFoundDBException
+from infra.repositories.alchemy_models.users import User
+from infra.repositories.session import after_commit, engine, get_session, unit_of_work
+from infra.repositories.users.alchemy import AlchemyUserRepository
+from logic.services.users.repo import RepositoryUserService
+from logic.utils.password_hasher import PasswordHasher
+from tests.repositories.fixtures import UserFactory
+
+
+@pytest_asyncio.fixture
+async def created_users():
+    user_ids = []
+    yield user_ids
+    async with unit_of_work() as session:
+        await session.execute(delete(User).where(User.id.in_(user_ids)))
+    # пул привязан к циклу событий теста
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_repositories_share_request_session(created_users):
+    user = UserFactory.build()
+    created_users.append(user.id)
+    async with unit_of_work() as session:
+        assert get_session() is session
+        new_user = await AlchemyUserRepository(get_session()).add(user)
+        assert await AlchemyUserRepository(get_session()).get_one_by_id(user.id) is new_user
+    with pytest.raises(NoUnitOfWorkException):
+        get_session()
+
+    async with unit_of_work():
+        assert (await AlchemyUserRepository(get_session()).get_one_by_id(user.id)).email == user.email
+
+
+@pytest.mark.asyncio
+async def test_rollback_on_error(created_users):
+    user = UserFactory.build()
+    created_users.append(user.id)
+    with pytest.raises(RuntimeError):
+        async with unit_of_work():
+            await AlchemyUserRepository(get_session()).add(user)
+            raise RuntimeError
+
+    async with unit_of_work():
+        with pytest.raises(UserNotFoundDBException):
+            await AlchemyUserRepository(get_session()).get_one_by_id(user.id)
+
+
+@pytest.mark.asyncio
+async def test_after_commit_runs_once_committed(created_users):
+    user = UserFactory.build()
+    created_users.append(user.id)
+    seen = []
+
+    async def callback():
+        # к моменту вызова строка уже видна из другой единицы работы
+        async with unit_of_work():
+            seen.append((await AlchemyUserRepository(get_session()).get_one_by_id(user.id)).email)
+
+    async with unit_of_work():
+        await AlchemyUserRepository(get_session()).add(user)
+        after_commit(callback)
+        after_commit(callback)
+        assert seen == []
+    assert seen == [user.email]
+
+
+@pytest.mark.asyncio
+async def test_after_commit_skipped_on_rollback():
+    calls = []
+
+    async def callback():
+        calls.append(1)
+
+    with pytest.raises(RuntimeError):
+        async with unit_of_work():
+            after_commit(callback)
+            raise RuntimeError
+    assert calls == []
+
+
+@pytest.mark.asyncio
+async def test_list_cache_cleared_after_commit(created_users):
+    list_cache = MemoryCache(max_size=10, ttl_seconds=60)
+    await list_cache.set("users:list:10", "page")
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        user = UserEntity(email="list-cache@example.com", name="n", is_company=False, password="p")
+        created_users.append(user.id)
+        async with unit_of_work():
+            service = RepositoryUserService(
+                repository=AlchemyUserRepository(get_session()),
+                password_hasher=PasswordHasher(executor, max_pending=1),
+                list_cache=list_cache,
+            )
+            await service.create_user(user)
+            # до коммита параллельный запрос перечитал бы старый список и вернул его в кэш
+            assert await list_cache.get("users:list:10") == "page"
+    assert await list_cache.get("users:list:10") is None
@@ -1,8 +1,11 @@
 import pytest
 
+from domain.entities.pagination import CursorEntity
 from domain.entities.users import UserEntity
 from infra.exceptions.users import UserAlreadyExistsDBException
 from infra.repositories.users.alchemy import AlchemyUserRepository
+from logic.exceptions.users import PrincipalClaimsChangeException
+from logic.services.users.repo import RepositoryUserService
 from tests.repositories.fixtures import UserFactory
 
 
@@ -15,7 +18,24 @@ async def test_get_all(sa_session):
     repo = AlchemyUserRepository(sa_session)
     all_users = await repo.get_all(limit=100, offset=0)
     assert all_users
-    assert user in all_users
+    found = next(found for found in all_users if found.id == user.id)
+    assert (found.email, found.name, found.is_company) == (user.email, user.name, user.is_company)
+    assert found.hashed_password is None
+
+
+@pytest.mark.asyncio
+async def test_get_all_cursor(sa_session):
+    users = UserFactory.build_batch(5)
+    sa_session.add_all(users)
+    await sa_session.flush()
+
+    repo = AlchemyUserRepository(sa_session)
+    first_page = await repo.get_all(limit=2)
+    last = first_page[-1]
+    second_page = await repo.get_all(limit=2, cursor=CursorEntity(value=last.created_at, id=last.id))
+    assert len(second_page) == 2
+    assert not {user.id for user in first_page} & {user.id for user in second_page}
+    assert (last.created_at, last.id) > (second_page[0].created_at, second_page[0].id)
 
 
 @pytest.mark.asyncio
@@ -85,3 +105,48 @@ async def test_create_same_email_error(sa_session):
     await repo.add(user_in=user)
     with pytest.raises(UserAlreadyExistsDBException):
         await repo.add(user_in=user)
+
+
+@pytest.mark.asyncio
+async def test_update_bumps_updated_at(sa_session):
+    user = UserFactory.build()
+    sa_session.add(user)
+    await sa_session.flush()
+    updated_at = user.updated_at
+
+    repo = AlchemyUserRepository(sa_session)
+    updated_user = await repo.update(user_in=UserEntity(id=user.id, name="new name", email=None, is_company=None))
+    assert updated_user.updated_at > updated_at
+
+
+@pytest.mark.asyncio
+async def test_update_keeps_created_at(sa_session):
+    user = UserFactory.build()
+    sa_session.add(user)
+    await sa_session.flush()
+    created_at = user.created_at
+
+    repo = AlchemyUserRepository(sa_session)
+    updated_user = await repo.update(user_in=UserEntity(id=user.id, name="new name", email=None, is_company=None))
+    assert updated_user.created_at == created_at
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("changes", [{"email": "changed@example.com"}, {"is_company": True}])
+async def test_update_rejects_principal_claims_embedded_in_token(sa_session, changes):
+    user = UserFactory.build(is_company=False)
+    sa_session.add(user)
+    await sa_session.flush()
+
+    service = RepositoryUserService(
+        repository=AlchemyUserRepository(sa_session), password_hasher=None, principal_claims_in_token=True,
+    )
+    with pytest.raises(PrincipalClaimsChangeException):
+        user_in = UserEntity(**{"name": None, "email": None, "is_company": None, **changes})
+        await service.update_user(user.id, user.email, user_in)
+
+    # те же значения и остальные поля менять можно
+    updated = await service.update_user(
+        user.id, user.email, UserEntity(name="new", email=user.email, is_company=False),
+    )
+    assert updated.name == "new"
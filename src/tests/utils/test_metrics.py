@@ -0,0 +1,44 @@
+from core.metrics import Counter, Gauge, Histogram, MetricsRegistry
+
+
+def test_counter_and_gauge_render():
+    requests = Counter("requests_total", "Запросы", ("method",))
+    requests.inc("GET")
+    requests.inc("GET", amount=2)
+    in_flight = Gauge("in_flight", "В работе")
+    in_flight.inc()
+    in_flight.dec()
+
+    assert requests.render() == '# HELP requests_total Запросы\n# TYPE requests_total counter\nrequests_total{method="GET"} 3.0'
+    assert in_flight.render().splitlines()[-1] == "in_flight 0.0"
+
+
+def test_histogram_buckets_are_cumulative():
+    duration = Histogram("duration_seconds", "Время", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        duration.observe(value, "/jobs")
+
+    assert list(duration.lines()) == [
+        'duration_seconds_bucket{route="/jobs",le="0.1"} 2',
+        'duration_seconds_bucket{route="/jobs",le="1.0"} 3',
+        'duration_seconds_bucket{route="/jobs",le="+Inf"} 4',
+        'duration_seconds_sum{route="/jobs"} 2.65',
+        'duration_seconds_count{route="/jobs"} 4',
+    ]
+
+
+def test_registry_renders_collectors_and_escapes_labels():
+    registry = MetricsRegistry()
+    errors = registry.register(Counter("errors_total", "Ошибки", ("message",)))
+    errors.inc('bad "value"\n')
+
+    def collect():
+        pool = Gauge("pool_size", "Пул", ("pool",))
+        pool.set(5, "primary")
+        return [pool]
+
+    registry.register_collector(collect)
+    rendered = registry.render()
+    assert 'errors_total{message="bad \\"value\\"\\n"} 1.0' in rendered
+    assert 'pool_size{pool="primary"} 5.0' in rendered
+    assert rendered.endswith("\n")
@@ -0,0 +1,32 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from logic.exceptions.auth import PasswordHashingOverloadedException
+from logic.utils.password_hasher import PasswordHasher
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify():
+    hasher = PasswordHasher(executor=ThreadPoolExecutor(max_workers=1), max_pending=4)
+
+    hashed_password = await hasher.hash("secret")
+    assert await hasher.verify("secret", hashed_password)
+    assert not await hasher.verify("wrong", hashed_password)
+    assert hasher.stats["hash"].count == 1
+    assert hasher.stats["verify"].count == 2
+    assert hasher.stats["verify"].run_seconds_total > 0
+    assert hasher.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_rejects_when_queue_is_full():
+    hasher = PasswordHasher(executor=ThreadPoolExecutor(max_workers=1), max_pending=1)
+
+    first = asyncio.create_task(hasher.hash("secret"))
+    await asyncio.sleep(0)
+    with pytest.raises(PasswordHashingOverloadedException):
+        await hasher.hash("secret")
+    await first
+    assert hasher.pending == 0